@@ -0,0 +1,150 @@
+"""
+SnackAnarchy - Allocations de surfaces par écran
+Dessine chaque écran (menus, pause, historique, tutoriel, cinématique...) plusieurs fois de suite
+et compte les surfaces créées par frame : pygame.Surface(...) et pygame.transform.*.
+Un écran bien caché ne devrait plus rien allouer une fois affiché.
+
+Exemples :
+    python bench_screens.py
+    python bench_screens.py --frames 120 --screens main_menu pause intro
+"""
+import argparse
+import os
+import time
+
+# Pas de vraie fenêtre ni de son nécessaires pour mesurer
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from config import *
+
+TRANSFORMS = ("scale", "smoothscale", "rotate", "rotozoom", "flip", "scale2x")
+
+
+class AllocationCounter:
+    """Remplace pygame.Surface et les fonctions de pygame.transform par des versions qui comptent"""
+
+    def __init__(self):
+        self.count = 0
+        self._originals = {}
+
+    def install(self):
+        counter = self
+        original_surface = pygame.Surface
+
+        class CountingSurface(original_surface):
+            def __init__(self, *args, **kwargs):
+                counter.count += 1
+                super().__init__(*args, **kwargs)
+
+        self._originals[(pygame, "Surface")] = original_surface
+        pygame.Surface = CountingSurface
+        for name in TRANSFORMS:
+            original = getattr(pygame.transform, name, None)
+            if original is None:
+                continue
+            self._originals[(pygame.transform, name)] = original
+            setattr(pygame.transform, name, self._counting(original))
+
+    def _counting(self, function):
+        def wrapper(*args, **kwargs):
+            self.count += 1
+            return function(*args, **kwargs)
+        return wrapper
+
+    def uninstall(self):
+        for (module, name), original in self._originals.items():
+            setattr(module, name, original)
+        self._originals.clear()
+
+
+def build_screens(screen):
+    """Nom -> fonction qui dessine une frame de l'écran"""
+    from game.state import GameState
+    from rendering.menu import MenuRenderer
+    from rendering.history_menu import HistoryMenu
+    from rendering.tutorial_menu import TutorialMenu
+    from rendering.keybind_menu import KeybindMenu
+    from rendering.inventory_menu import InventoryMenu
+    from rendering.carte_menu import CarteMenu
+    from rendering.intro_cutscene import IntroCutscene
+    from rendering.split_screen import SplitScreenRenderer
+
+    menu = MenuRenderer(screen)
+    game_state = GameState(record_history=False)
+    history = HistoryMenu(screen)
+    history.toggle()
+    tutorial = TutorialMenu(screen)
+    tutorial.toggle()
+    tutorial_interactive = TutorialMenu(screen)
+    tutorial_interactive.toggle()
+    tutorial_interactive._start_interactive_phase()
+    keybinds = KeybindMenu(screen)
+    keybinds.toggle()
+    inventory = InventoryMenu(screen)
+    inventory.toggle(0)
+    carte = CarteMenu(screen)
+    carte.toggle(1)
+    intro = IntroCutscene(screen)
+    renderer = SplitScreenRenderer(screen)
+
+    def pause():
+        menu.draw_pause_overlay()
+        menu.draw_pause_menu(game_state, overlay=False)
+
+    return {
+        'main_menu': menu.draw_main_menu,
+        'player_setup': menu.draw_player_setup,
+        'pause': pause,
+        'history': history.draw,
+        'tutorial': tutorial.draw,
+        'tutorial_interactive': tutorial_interactive.draw,
+        'keybinds': keybinds.draw,
+        'inventory': lambda: inventory.draw(game_state),
+        'carte': lambda: carte.draw(game_state),
+        'intro': intro.draw,
+        'game_over': lambda: renderer._draw_game_over(game_state),
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Surfaces allouées par frame, écran par écran")
+    parser.add_argument("--frames", type=int, default=60, help="frames mesurées par écran")
+    parser.add_argument("--warmup", type=int, default=3,
+                        help="frames dessinées avant la mesure (remplissage des caches)")
+    parser.add_argument("--screens", nargs="*", help="écrans à mesurer (tous par défaut)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    from game.assets_loader import Assets
+    Assets.get().load_images()
+    screens = build_screens(screen)
+    names = args.screens or list(screens)
+
+    counter = AllocationCounter()
+    counter.install()
+    try:
+        print(f"{'écran':<22}{'allocations/frame':>18}{'ms/frame':>10}")
+        for name in names:
+            draw = screens[name]
+            for _ in range(args.warmup):
+                draw()
+            counter.count = 0
+            start = time.perf_counter()
+            for _ in range(args.frames):
+                draw()
+            elapsed = time.perf_counter() - start
+            print(f"{name:<22}{counter.count / args.frames:>18.1f}{elapsed / args.frames * 1000:>10.2f}")
+    finally:
+        counter.uninstall()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
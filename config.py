@@ -1,9 +1,31 @@
 import pygame
 
 # Screen
-SCREEN_WIDTH = 1280
+SCREEN_WIDTH = 1280   # Mise en page : HUD, menus et positions du monde sont dans ce cadre
 SCREEN_HEIGHT = 720
+# Taille de rendu des vues de la partie (même proportions, hauteur multiple de 45 pour des tuiles
+# entières) : en dessous de la mise en page, le monde est dessiné plus petit puis agrandi dans le cadre
+RENDER_WIDTH = SCREEN_WIDTH
+RENDER_HEIGHT = SCREEN_HEIGHT
+# Taille de la fenêtre : si elle diffère, l'image interne y est mise à l'échelle en une passe finale
+WINDOW_WIDTH = SCREEN_WIDTH
+WINDOW_HEIGHT = SCREEN_HEIGHT
+WINDOW_SCALE_FILTER = "auto"  # "nearest" (net, rapide), "smooth" (lissé) ou "auto" (nearest pour réduire)
 FPS = 60
+IDLE_FPS = 30  # Menus et pause : écrans presque statiques, inutile de tourner à plein régime
+STARTUP_TARGET_MS = 300  # Objectif : première frame du menu (bornes), voir --profile-startup
+
+# Vidéo de fond du menu : frames décodées d'avance par un thread
+VIDEO_BUFFER_FRAMES = 6
+# Cache disque des frames converties (brut, mappé en mémoire ensuite) : ~2.7 Mo par frame en 1280x720
+VIDEO_FRAME_CACHE = False
+VIDEO_CACHE_MAX_MB = 1024
+
+# Musique d'ambiance procédurale (générée au menu, au-delà de 30 s les phrases varient)
+AMBIENT_MUSIC_SECONDS = 30
+
+# Chargement des sprites : PNG décodés en arrière-plan, en parallèle (au plus un thread par cœur)
+ASSET_LOADER_THREADS = 4
 
 # Colors
 BLACK = (0, 0, 0)
@@ -29,6 +51,10 @@ DEFAULT_DURATION = 300
 
 # Map
 TILE_SIZE = 64  # Large tiles for restaurants
+# Marge autour de la vue pour le culling (bulles de commande, indicateurs au-dessus des sprites)
+DRAW_CULL_MARGIN = TILE_SIZE * 2
+# Particules vivantes au plus par partie (sang, poussière) : au-delà, les émissions sont ignorées
+PARTICLE_CAPACITY = 256
 
 # Zone sizes (in tiles)
 RESTAURANT_WIDTH = 10
@@ -38,6 +64,9 @@ RESTAURANT_HEIGHT = 8
 STREET_WIDTH = 14
 STREET_HEIGHT = 8
 
+# Clients
+CLIENT_PATIENCE = 45  # Secondes d'attente en file avant de partir
+
 # Player
 PLAYER_SPEED = 5
 PLAYER_1_COLOR = RED
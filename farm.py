@@ -0,0 +1,139 @@
+"""
+SnackAnarchy - Ferme de simulation
+Répartit des parties sans fenêtre (graines consécutives) sur tous les cœurs et rassemble
+les résultats de chaque partie dans un seul fichier en colonnes (.npz ou .csv).
+
+Exemples :
+    python farm.py --matches 200 --output results.npz
+    python farm.py --matches 20 --spawn-interval 6 8 10 --patience 30 45 --sabotage-cost thief=80,100,120
+    python farm.py --matches 32 --duration 60 --scaling
+"""
+import argparse
+import csv
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from config import DEFAULT_DURATION
+from game.headless import POLICIES, run_match, match_result, setup_headless
+from game.sabotage import SABOTAGES
+
+
+def play(task):
+    """Joue une partie dans un processus de la ferme et renvoie sa ligne de résultats"""
+    seed, duration, policies, settings = task
+    game_state, _ = run_match(seed, duration, policies, settings=settings)
+    row = {'seed': seed}
+    row['spawn_interval'] = game_state.spawn_interval
+    row['patience'] = game_state.client_patience
+    for name, cost in sorted(settings.get('sabotage_costs', {}).items()):
+        row[f'cost_{name}'] = cost
+    row.update(match_result(game_state))
+    return row
+
+
+def build_tasks(args):
+    """Grille des réglages balayés x graines"""
+    sabotage_sweeps = {}
+    for spec in args.sabotage_cost:
+        name, _, costs = spec.partition("=")
+        if name not in SABOTAGES:
+            raise SystemExit(f"Sabotage inconnu: {name} ({', '.join(sorted(SABOTAGES))})")
+        sabotage_sweeps[name] = [int(c) for c in costs.split(",")]
+
+    names = sorted(sabotage_sweeps)
+    grid = itertools.product(
+        args.spawn_interval or [None],
+        args.patience or [None],
+        *[sabotage_sweeps[n] for n in names]
+    )
+
+    tasks = []
+    policies = (args.p1, args.p2)
+    for spawn_interval, patience, *costs in grid:
+        settings = {}
+        if spawn_interval is not None:
+            settings['spawn_interval'] = spawn_interval
+        if patience is not None:
+            settings['patience'] = patience
+        if names:
+            settings['sabotage_costs'] = dict(zip(names, costs))
+        for i in range(args.matches):
+            tasks.append((args.seed + i, args.duration, policies, settings))
+    return tasks
+
+
+def run_farm(tasks, workers):
+    """Joue toutes les parties sur `workers` processus, renvoie (lignes, secondes)"""
+    start = time.perf_counter()
+    if workers <= 1:
+        setup_headless()
+        rows = [play(task) for task in tasks]
+    else:
+        # Gros paquets : une partie dure bien plus longtemps que l'envoi d'une tâche
+        chunksize = max(1, len(tasks) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, initializer=setup_headless) as pool:
+            rows = list(pool.map(play, tasks, chunksize=chunksize))
+    return rows, time.perf_counter() - start
+
+
+def save_results(rows, path):
+    """Écrit les résultats en colonnes : .npz (un tableau numpy par colonne) ou .csv"""
+    columns = list(rows[0].keys())
+    if path.endswith(".csv"):
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=columns)
+            writer.writeheader()
+            writer.writerows(rows)
+    else:
+        np.savez(path, **{c: np.array([row[c] for row in rows]) for c in columns})
+    print(f"[Farm] {len(rows)} parties, {len(columns)} colonnes -> {path}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Parties SnackAnarchy en parallèle sur tous les cœurs")
+    parser.add_argument("--seed", type=int, default=0, help="graine de la première partie")
+    parser.add_argument("--matches", type=int, default=100, help="parties (graines) par point de la grille")
+    parser.add_argument("--duration", type=float, default=DEFAULT_DURATION,
+                        help="durée d'une partie en secondes de jeu")
+    parser.add_argument("--p1", choices=sorted(POLICIES), default="serve", help="stratégie du joueur 1")
+    parser.add_argument("--p2", choices=sorted(POLICIES), default="serve", help="stratégie du joueur 2")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="nombre de processus")
+    parser.add_argument("--spawn-interval", type=float, nargs="+", help="valeurs de GameState.spawn_interval")
+    parser.add_argument("--patience", type=float, nargs="+", help="valeurs de patience des clients")
+    parser.add_argument("--sabotage-cost", action="append", default=[], metavar="NOM=C1,C2",
+                        help="coûts à balayer pour un sabotage (répétable)")
+    parser.add_argument("--output", default="farm_results.npz", help="fichier de résultats (.npz ou .csv)")
+    parser.add_argument("--scaling", action="store_true",
+                        help="mesure parties/s pour 1, 2, 4... processus jusqu'à --workers")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    tasks = build_tasks(args)
+
+    if args.scaling:
+        worker_counts = []
+        count = 1
+        while count < args.workers:
+            worker_counts.append(count)
+            count *= 2
+        worker_counts.append(args.workers)
+    else:
+        worker_counts = [args.workers]
+
+    baseline = None
+    for workers in worker_counts:
+        rows, elapsed = run_farm(tasks, workers)
+        rate = len(rows) / elapsed
+        baseline = baseline or rate
+        print(f"[Farm] {workers:3d} processus: {len(rows)} parties en {elapsed:.2f}s - "
+              f"{rate:.2f} parties/s (x{rate / baseline:.2f})")
+
+    save_results(rows, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,59 +4,65 @@ Gère les animations de sprites et les effets visuels
 """
 import pygame
 import math
-import time
 from config import *
+from game.clock import wall_clock
+from game.fonts import render_text
 
 class Animation:
-    """Classe de base pour les animations"""
+    """Classe de base pour les animations.
+    clock: horloge de simulation (GameState.clock) ; horloge murale par défaut."""
     
-    def __init__(self, duration=1.0, loop=False):
+    def __init__(self, duration=1.0, loop=False, clock=None):
+        self.clock = clock or wall_clock
         self.duration = duration
         self.loop = loop
-        self.start_time = time.time()
+        self.start_time = self.clock.now()
         self.completed = False
         self.paused = False
         self.pause_time = 0
+        self.progress = 0.0
         
     def update(self):
         if self.paused:
             return
             
-        elapsed = time.time() - self.start_time
+        elapsed = self.clock.now() - self.start_time
         progress = elapsed / self.duration
         
         if progress >= 1.0:
             if self.loop:
-                self.start_time = time.time()
+                self.start_time = self.clock.now()
             else:
                 self.completed = True
                 progress = 1.0
                 
+        self.progress = progress
         return progress
         
     def pause(self):
         self.paused = True
-        self.pause_time = time.time()
+        self.pause_time = self.clock.now()
         
     def resume(self):
         if self.paused:
-            pause_duration = time.time() - self.pause_time
+            pause_duration = self.clock.now() - self.pause_time
             self.start_time += pause_duration
             self.paused = False
             
     def reset(self):
-        self.start_time = time.time()
+        self.start_time = self.clock.now()
         self.completed = False
+        self.progress = 0.0
 
 
 class SpriteAnimation(Animation):
     """Animation de sprite avec plusieurs frames"""
     
-    def __init__(self, frames, frame_duration=0.1, loop=True):
+    def __init__(self, frames, frame_duration=0.1, loop=True, clock=None):
         self.frames = frames
         self.frame_duration = frame_duration
         self.current_frame = 0
-        super().__init__(duration=len(frames) * frame_duration, loop=loop)
+        super().__init__(duration=len(frames) * frame_duration, loop=loop, clock=clock)
         
     def update(self):
         progress = super().update()
@@ -73,8 +79,8 @@ class SpriteAnimation(Animation):
 class WalkAnimation(Animation):
     """Animation de marche avec bobbing"""
     
-    def __init__(self, base_image, direction='right'):
-        super().__init__(duration=0.4, loop=True)
+    def __init__(self, base_image, direction='right', clock=None):
+        super().__init__(duration=0.4, loop=True, clock=clock)
         self.base_image = base_image
         self.direction = direction
         self.bob_amplitude = 3
@@ -97,8 +103,8 @@ class WalkAnimation(Animation):
 class AttackAnimation(Animation):
     """Animation d'attaque (coup de couteau/fourchette)"""
     
-    def __init__(self, attacker_pos, target_pos, weapon_type='knife'):
-        super().__init__(duration=0.3, loop=False)
+    def __init__(self, attacker_pos, target_pos, weapon_type='knife', clock=None):
+        super().__init__(duration=0.3, loop=False, clock=clock)
         self.attacker_pos = attacker_pos
         self.target_pos = target_pos
         self.weapon_type = weapon_type
@@ -147,8 +153,8 @@ class AttackAnimation(Animation):
         
     def draw_weapon(self, surface, camera):
         """Dessine l'arme pendant l'animation"""
-        draw_x = self.current_pos[0] - camera.x
-        draw_y = self.current_pos[1] - camera.y
+        px = camera.pixels
+        draw_x, draw_y = camera.to_view(*self.current_pos)
         
         # Angle de l'arme
         dx = self.target_pos[0] - self.attacker_pos[0]
@@ -162,27 +168,27 @@ class AttackAnimation(Animation):
             color = (150, 150, 150)
             length = 30
             
-        end_x = draw_x + math.cos(angle) * length
-        end_y = draw_y + math.sin(angle) * length
+        end_x = draw_x + math.cos(angle) * px(length)
+        end_y = draw_y + math.sin(angle) * px(length)
         
-        pygame.draw.line(surface, color, (draw_x, draw_y), (end_x, end_y), 4)
+        pygame.draw.line(surface, color, (draw_x, draw_y), (end_x, end_y), px(4))
         
         # Pointe de l'arme
         if self.weapon_type == 'knife':
-            pygame.draw.circle(surface, (200, 200, 200), (int(end_x), int(end_y)), 3)
+            pygame.draw.circle(surface, (200, 200, 200), (int(end_x), int(end_y)), px(3))
         else:
             # Dents de la fourchette
-            for offset in [-5, 0, 5]:
-                prong_x = end_x + math.cos(angle) * 8
-                prong_y = end_y + math.sin(angle) * 8 + offset
-                pygame.draw.line(surface, color, (end_x, end_y + offset), (prong_x, prong_y), 2)
+            for offset in [-px(5), 0, px(5)]:
+                prong_x = end_x + math.cos(angle) * px(8)
+                prong_y = end_y + math.sin(angle) * px(8) + offset
+                pygame.draw.line(surface, color, (end_x, end_y + offset), (prong_x, prong_y), px(2))
 
 
 class StealAnimation(Animation):
     """Animation de vol de broche"""
     
-    def __init__(self, thief_pos, target_pos):
-        super().__init__(duration=1.0, loop=False)
+    def __init__(self, thief_pos, target_pos, clock=None):
+        super().__init__(duration=1.0, loop=False, clock=clock)
         self.thief_pos = thief_pos
         self.target_pos = target_pos
         self.spit_pos = list(target_pos)
@@ -223,25 +229,13 @@ class StealAnimation(Animation):
 class DeathAnimation(Animation):
     """Animation de mort d'un client"""
     
-    def __init__(self, position, death_type='stab'):
-        super().__init__(duration=0.8, loop=False)
+    def __init__(self, position, death_type='stab', clock=None):
+        super().__init__(duration=0.8, loop=False, clock=clock)
         self.position = list(position)
         self.death_type = death_type
         self.rotation = 0
         self.alpha = 255
-        self.blood_particles = []
-        
-        # Créer des particules de sang
-        for _ in range(8):
-            import random
-            self.blood_particles.append({
-                'x': position[0],
-                'y': position[1],
-                'vx': random.uniform(-3, 3),
-                'vy': random.uniform(-5, -1),
-                'size': random.randint(3, 8),
-                'alpha': 255
-            })
+        # (le sang est émis par GameState dans son système de particules)
             
     def update(self):
         progress = super().update()
@@ -252,60 +246,36 @@ class DeathAnimation(Animation):
         self.rotation = progress * 90  # Tombe sur le côté
         self.position[1] += progress * 2  # Légère chute
         self.alpha = int(255 * (1 - progress * 0.5))  # Fade léger
-        
-        # Mise à jour des particules de sang
-        for p in self.blood_particles:
-            p['vy'] += 0.3  # Gravité
-            p['x'] += p['vx']
-            p['y'] += p['vy']
-            p['alpha'] = max(0, int(255 * (1 - progress)))
             
         return {
             'position': tuple(self.position),
             'rotation': self.rotation,
             'alpha': self.alpha,
-            'particles': self.blood_particles,
             'progress': progress
         }
         
     def draw(self, surface, camera, original_image):
-        """Dessine l'animation de mort"""
-        data = self.update()
-        if data is None:
-            return
-            
-        draw_x = data['position'][0] - camera.x
-        draw_y = data['position'][1] - camera.y
-        
-        # Dessiner les particules de sang d'abord (derrière)
-        # Compatible macOS: utiliser set_alpha() au lieu de couleur RGBA
-        for p in data['particles']:
-            if p['alpha'] > 0:
-                px = p['x'] - camera.x
-                py = p['y'] - camera.y
-                size = max(2, p['size'])
-                blood_surface = pygame.Surface((size, size), pygame.SRCALPHA)
-                blood_surface.fill((0, 0, 0, 0))  # Transparent
-                pygame.draw.circle(blood_surface, (180, 0, 0), 
-                                 (size//2, size//2), size//2)
-                blood_surface.set_alpha(p['alpha'])
-                surface.blit(blood_surface, (int(px), int(py)))
+        """Dessine l'animation de mort (l'état avance dans update(), appelé à chaque tick)"""
+        draw_x, draw_y = camera.to_view(*self.position)
         
         # Dessiner le sprite avec rotation et transparence
+        # (rotation précalculée dans l'atlas des Assets, partagée : alpha fixé juste avant le blit)
         if original_image:
-            rotated = pygame.transform.rotate(original_image, -data['rotation'])
-            rotated_copy = rotated.copy()
-            rotated_copy.set_alpha(data['alpha'])
-            rect = rotated_copy.get_rect(center=(draw_x + original_image.get_width()//2, 
-                                            draw_y + original_image.get_height()//2))
-            surface.blit(rotated_copy, rect)
+            from game.assets_loader import Assets
+            assets = Assets.get()
+            sprite = assets.sprite_for(original_image)
+            rotated = assets.get_rotated(sprite, self.rotation)
+            rotated.set_alpha(self.alpha)
+            rect = rotated.get_rect(center=(draw_x + sprite.get_width()//2, 
+                                            draw_y + sprite.get_height()//2))
+            surface.blit(rotated, rect)
 
 
 class FleeAnimation(Animation):
     """Animation de fuite d'un client effrayé"""
     
-    def __init__(self, start_pos, direction='right'):
-        super().__init__(duration=1.5, loop=False)
+    def __init__(self, start_pos, direction='right', clock=None):
+        super().__init__(duration=1.5, loop=False, clock=clock)
         self.start_pos = list(start_pos)
         self.current_pos = list(start_pos)
         self.direction = 1 if direction == 'right' else -1
@@ -332,8 +302,8 @@ class FleeAnimation(Animation):
 class PickupAnimation(Animation):
     """Animation de ramassage d'objet"""
     
-    def __init__(self, item_pos, player_pos):
-        super().__init__(duration=0.3, loop=False)
+    def __init__(self, item_pos, player_pos, clock=None):
+        super().__init__(duration=0.3, loop=False, clock=clock)
         self.item_pos = list(item_pos)
         self.player_pos = player_pos
         self.scale = 1.0
@@ -359,13 +329,14 @@ class PickupAnimation(Animation):
 class FloatingText(Animation):
     """Animation de texte flottant (ex: +20€, -5 réputation)"""
     
-    def __init__(self, text, position, color=WHITE, font_size=24):
-        super().__init__(duration=1.5, loop=False)
+    def __init__(self, text, position, color=WHITE, font_size=24, clock=None):
+        super().__init__(duration=1.5, loop=False, clock=clock)
         self.text = text
         self.position = list(position)
         self.color = color
         self.font_size = font_size
         self.alpha = 255
+        self._surface = None  # copie du texte en cache, propre à cette animation (alpha variable)
         
     def update(self):
         progress = super().update()
@@ -384,17 +355,17 @@ class FloatingText(Animation):
         }
         
     def draw(self, surface, camera):
-        data = self.update()
-        if data is None or data['alpha'] <= 0:
+        # L'état avance dans update() (AnimationManager, une fois par tick)
+        if self.alpha <= 0:
             return
             
-        draw_x = data['position'][0] - camera.x
-        draw_y = data['position'][1] - camera.y
+        draw_x, draw_y = camera.to_view(*self.position)
         
-        font = pygame.font.SysFont(None, self.font_size)
-        text_surface = font.render(data['text'], True, self.color)
-        text_surface.set_alpha(data['alpha'])
-        surface.blit(text_surface, (draw_x, draw_y))
+        # Surface du cache partagée : copiée une fois, avant de changer sa transparence
+        if self._surface is None:
+            self._surface = render_text(self.text, camera.pixels(self.font_size), self.color).copy()
+        self._surface.set_alpha(self.alpha)
+        surface.blit(self._surface, (draw_x, draw_y))
 
 
 class ServeAnimation(Animation):
@@ -405,8 +376,8 @@ class ServeAnimation(Animation):
     Phase 3: courte pause (geste de servir)
     """
 
-    def __init__(self, start_pos, kitchen_pos, client_pos, duration=1.4):
-        super().__init__(duration=duration, loop=False)
+    def __init__(self, start_pos, kitchen_pos, client_pos, duration=1.4, clock=None):
+        super().__init__(duration=duration, loop=False, clock=clock)
         self.start_pos = list(start_pos)
         self.kitchen_pos = list(kitchen_pos)
         self.client_pos = list(client_pos)
@@ -466,8 +437,8 @@ class ThiefAnimation(Animation):
     Animation du voleur : spawn à la porte du restaurant adverse, va à la caisse,
     vole, puis ressort par la porte.
     """
-    def __init__(self, zone_name, duration=2.8):
-        super().__init__(duration=duration, loop=False)
+    def __init__(self, zone_name, duration=2.8, clock=None):
+        super().__init__(duration=duration, loop=False, clock=clock)
         self.zone_name = zone_name
         self.spawn_x, self.spawn_y, self.register_x, self.register_y = _thief_zone_positions(zone_name)
         self.current_pos = [float(self.spawn_x), float(self.spawn_y)]
@@ -502,24 +473,20 @@ class ThiefAnimation(Animation):
         }
 
     def draw(self, surface, camera):
-        data = self.update()
-        if data is None:
-            return
+        # La position avance dans update() (GameState, une fois par tick)
         from game.assets_loader import Assets
-        img = Assets.get().get_image("voleur")
+        assets = Assets.get()
+        img = assets.get_sprite("voleur") if self.facing_right else assets.get_flipped_sprite("voleur")
         if not img:
             return
-        if not data['facing_right']:
-            img = pygame.transform.flip(img, True, False)
-        draw_x = data['position'][0] - camera.x
-        draw_y = data['position'][1] - camera.y
-        surface.blit(img, (draw_x, draw_y))
+        surface.blit(img, camera.to_view(int(self.current_pos[0]), int(self.current_pos[1])))
 
 
 class AnimationManager:
     """Gestionnaire global des animations"""
     
-    def __init__(self):
+    def __init__(self, clock=None):
+        self.clock = clock or wall_clock
         self.animations = []
         self.floating_texts = []
         
@@ -527,7 +494,7 @@ class AnimationManager:
         self.animations.append(animation)
         
     def add_floating_text(self, text, position, color=WHITE, font_size=24):
-        self.floating_texts.append(FloatingText(text, position, color, font_size))
+        self.floating_texts.append(FloatingText(text, position, color, font_size, clock=self.clock))
         
     def update(self):
         # Mettre à jour et nettoyer les animations terminées
@@ -1,7 +1,13 @@
 import pygame
+import glob
+import json
 import os
+import struct
 import sys
+import threading
+import time
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from config import *
 
 
@@ -59,6 +65,117 @@ def get_resource_path(relative_path):
     
     return os.path.realpath(full_path)
 
+
+def get_cache_dir(name):
+    """Dossier de cache utilisateur ~/.snackanarchy/cache/<name> (créé au besoin), ou None
+    s'il ne peut pas être créé : le cache est alors simplement désactivé."""
+    path = os.path.join(os.path.expanduser("~/.snackanarchy"), "cache", name)
+    try:
+        os.makedirs(path, exist_ok=True)
+    except OSError:
+        return None
+    return path
+
+
+# Sprites de personnages regroupés dans l'atlas, chacun avec sa variante retournée (regard à gauche)
+ATLAS_SPRITES = ("player1", "player1_left", "player2", "player2_left",
+                 "client", "client1", "client2", "voleur")
+ATLAS_MAX_WIDTH = 2048
+
+# Rotations précalculées pour l'animation de mort des clients (0 à 90°)
+DEATH_SPRITES = ("client", "client1", "client2")
+DEATH_ROTATION_MAX = 90
+DEATH_ROTATION_STEPS = 16  # pas de 90/16 = 5.6°
+
+
+def render_tile_size(render_height):
+    """Taille d'une tuile dans les vues de la partie pour une hauteur de rendu donnée
+    (TILE_SIZE à la hauteur de la mise en page)"""
+    return round(TILE_SIZE * render_height / SCREEN_HEIGHT)
+
+
+class AssetCache:
+    """Sprites déjà mis à l'échelle et collisions TMX déjà parsées, gardés sur disque
+    (un dossier par version du format et par taille de tuile : logique et rendu).
+
+    Un fichier par (élément, mise à l'échelle, date du fichier source) : relire un sprite revient à
+    lire quelques centaines de Ko de RGBA brut au lieu de décoder le PNG puis le redimensionner.
+    Les masques ne se sérialisent pas (pygame.Mask) : ils sont recalculés depuis ces pixels.
+    """
+    VERSION = 2
+    HEADER = struct.Struct("<II")  # largeur, hauteur
+
+    def __init__(self, tile_size=TILE_SIZE):
+        self.dir = get_cache_dir(os.path.join("assets", f"v{self.VERSION}", f"tile{tile_size}"))
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()  # compteurs mis à jour par les threads de décodage
+
+    def _path(self, name, spec, source, ext):
+        mtime = os.stat(source).st_mtime_ns
+        return os.path.join(self.dir, f"{name}_{spec}_{mtime}.{ext}")
+
+    def _count(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def load_image(self, name, spec, source):
+        """Surface RGBA en cache pour name/spec (None si absente ou si le PNG a changé)"""
+        if self.dir is None:
+            return None
+        try:
+            with open(self._path(name, spec, source, "rgba"), 'rb') as f:
+                data = f.read()
+            width, height = self.HEADER.unpack_from(data)
+            pixels = data[self.HEADER.size:]
+            if len(pixels) != width * height * 4:
+                raise ValueError("taille incohérente")
+        except (OSError, ValueError, struct.error):
+            self._count(False)
+            return None
+        self._count(True)
+        return pygame.image.frombytes(pixels, (width, height), "RGBA")
+
+    def store_image(self, name, spec, source, image):
+        header = self.HEADER.pack(*image.get_size())
+        self._store(name, spec, source, "rgba", header + pygame.image.tobytes(image, "RGBA"))
+
+    def load_rects(self, name, spec, source):
+        """Rectangles de collision en cache (None si absents ou si le TMX a changé)"""
+        if self.dir is None:
+            return None
+        try:
+            with open(self._path(name, spec, source, "json"), 'r', encoding='utf-8') as f:
+                rects = [pygame.Rect(rect) for rect in json.load(f)]
+        except (OSError, ValueError, TypeError):
+            self._count(False)
+            return None
+        self._count(True)
+        return rects
+
+    def store_rects(self, name, spec, source, rects):
+        data = json.dumps([list(rect) for rect in rects]).encode('utf-8')
+        self._store(name, spec, source, "json", data)
+
+    def _store(self, name, spec, source, ext, data):
+        """Écrit le fichier (remplacement atomique) et supprime les versions périmées"""
+        if self.dir is None:
+            return
+        path = self._path(name, spec, source, ext)
+        try:
+            with open(path + ".tmp", 'wb') as f:
+                f.write(data)
+            os.replace(path + ".tmp", path)
+            for stale in glob.glob(os.path.join(self.dir, glob.escape(f"{name}_{spec}_") + f"*.{ext}")):
+                if stale != path:
+                    os.remove(stale)
+        except OSError as e:
+            print(f"[Assets] Cache non écrit ({name}): {e}")
+
+
 class TMXCollisionLoader:
     """Parse les fichiers TMX Tiled pour extraire les zones de collision"""
     
@@ -125,125 +242,376 @@ class TMXCollisionLoader:
         return collisions
 
 
+def image_groups(tile_size=TILE_SIZE):
+    """Images à charger, par écran : {groupe: [(nom, fichier, taille, hauteur cible, masque)]}.
+    taille = dimensions exactes, ou None pour une mise à l'échelle à `hauteur cible` (proportions
+    gardées). Le menu n'attend que ses sprites ; le reste est décodé pendant qu'il s'affiche."""
+    resto_size = (RESTAURANT_WIDTH * tile_size, RESTAURANT_HEIGHT * tile_size)
+    tile = (tile_size, tile_size)
+    facade = (6 * tile_size, 3 * tile_size)
+    char_height = int(tile_size * 1.8)  # Larger characters for better visibility
+    return {
+        "menu": [
+            ("player1", "player1.png", None, char_height, True),
+            ("player2", "player2.png", None, char_height, True),
+            ("client", "client.png", None, char_height, True),
+        ],
+        "game": [
+            # Restaurant interiors
+            ("interior_tacos", "floor_tacos.png", resto_size, None, False),
+            ("interior_kebab", "floor_kebab.png", resto_size, None, False),
+            # Street tiles
+            ("sidewalk", "sidewalk.png", tile, None, False),
+            ("road", "street.png", tile, None, False),
+            ("wall", "wall.png", tile, None, False),
+            # Facades
+            ("facade_tacos", "facade_tacos.png", facade, None, False),
+            ("facade_kebab", "facade_kebab.png", facade, None, False),
+            # Door
+            ("door", "door.png", tile, None, False),
+            # Players (versions gauche) et clients - 3 types différents
+            ("player1_left", "player1-left.png", None, char_height, True),
+            ("player2_left", "player2-left.png", None, char_height, True),
+            ("client1", "client1.png", None, char_height, True),
+            ("client2", "client2.png", None, char_height, True),
+            # Voleur (sabotage) : purement visuel
+            ("voleur", "voleur.png", None, char_height, False),
+        ],
+    }
+
+
+# Collisions TMX des restaurants (chargées avec le groupe "game")
+COLLISION_MAPS = {"tacos": "floor_tacos.tmx", "kebab": "floor_kebab.tmx"}
+
+
 class Assets:
     _instance = None
     
     def __init__(self):
         self.images = {}
         self.masks = {}
+        # Vues de la partie dessinées à une autre hauteur que la mise en page (voir RENDER_HEIGHT) :
+        # sprites du monde chargés à cette échelle, à côté des images logiques (rect, masques, menus)
+        self.set_render_height(RENDER_HEIGHT)
+        self.sprites = {}       # nom -> sprite à l'échelle de rendu (vide si render_tile == TILE_SIZE)
+        self.sprite_flips = {}  # nom -> sprite de rendu retourné
+        self.sprite_of = {}     # image logique -> sprite de rendu correspondant
         self.fonts = {}
         self.collision_maps = {}  # Stocke les collisions TMX
+        self.atlas = None
+        self.flipped = {}    # nom -> sprite retourné horizontalement
+        self.rotations = {}  # sprite -> {pas: sprite tourné}
+        self.caches = {}  # taille de tuile -> AssetCache
+        self.headless = False
+        self.executor = None
+        self.pending = {}             # (nom, taille de tuile) -> Future (image, masque, trouvée)
+        self.pending_collisions = {}  # zone -> Future (rectangles)
+        self.origins = {}  # (nom, taille de tuile) -> "cache", "png" ou "fallback"
+        self.timings = {}  # groupe -> attente en ms
         
     @classmethod
     def get(cls):
         if cls._instance is None:
             cls._instance = Assets()
         return cls._instance
+
+    def set_render_height(self, render_height):
+        """Hauteur des vues de la partie : à fixer avant de demander le groupe "game".
+        Hors mise en page, les sprites du monde sont décodés (et mis en cache) à cette échelle."""
+        self.render_tile = render_tile_size(render_height)
+        scale = self.render_tile / TILE_SIZE
+        self.render_scale = int(scale) if scale.is_integer() else scale
+
+    @property
+    def scaled(self):
+        """Vrai si les vues de la partie ne sont pas dessinées à la taille de la mise en page"""
+        return self.render_tile != TILE_SIZE
         
-    def load_images(self):
-        # Debug: afficher le chemin de base
-        base = get_base_path()
-        assets_dir = get_resource_path("assets")
-        print(f"[DEBUG] Base path: {base}")
-        print(f"[DEBUG] Assets dir: {assets_dir}")
-        print(f"[DEBUG] Assets dir existe: {os.path.exists(assets_dir)}")
-        if os.path.exists(assets_dir):
-            print(f"[DEBUG] Contenu assets: {os.listdir(assets_dir)[:5]}...")
-        
-        def load(name, filename, size=None, create_mask=False):
-            path = get_resource_path(os.path.join("assets", filename))
-            if os.path.exists(path):
-                img = pygame.image.load(path).convert_alpha()
-                if size:
-                    img = pygame.transform.scale(img, size)
-                self.images[name] = img
-                
-                if create_mask:
-                    self.masks[name] = pygame.mask.from_surface(img)
-            else:
-                print(f"Warning: Asset {path} not found. Using fallback.")
-                s = pygame.Surface(size if size else (TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
-                s.fill((255, 0, 255, 128))
-                self.images[name] = s
-                if create_mask:
-                    self.masks[name] = pygame.mask.from_surface(s)
-
-        def load_scaled(name, filename, target_height, create_mask=False):
-            """Load image and scale to target height while keeping aspect ratio"""
-            path = get_resource_path(os.path.join("assets", filename))
-            if os.path.exists(path):
-                img = pygame.image.load(path).convert_alpha()
-                
+    def load_images(self, headless=False):
+        """Charge tous les sprites et les collisions TMX (en attendant la fin du décodage).
+        headless=True : pas de fenêtre (pas de convert_alpha) et seuls les éléments utiles à la
+        logique sont chargés (collisions, sprites des personnages pour leurs rect/masques)."""
+        self.headless = headless
+        if headless:
+            # Collisions et sprites des personnages (rect/masques) : ceux qui ont un masque
+            entries = [entry for group in image_groups().values() for entry in group if entry[4]]
+            self._submit(entries, collisions=True)
+            self._resolve_all()
+            self.shutdown()
+        else:
+            for group in image_groups():
+                self.request(group)
+            for group in image_groups():
+                self.load_group(group)
+
+    def request(self, group):
+        """Lance le décodage d'un groupe en arrière-plan (sans attendre)"""
+        self._submit(image_groups()[group], collisions=(group == "game"))
+        if group == "game" and self.scaled:
+            # Sprites du monde à l'échelle de rendu (personnages du menu compris)
+            self._submit([entry for entries in image_groups(self.render_tile).values() for entry in entries],
+                         tile_size=self.render_tile)
+
+    def load_group(self, group):
+        """Charge un groupe (décodage parallèle) et attend qu'il soit prêt.
+        Les images déjà demandées par request() ne sont pas décodées deux fois."""
+        start = time.perf_counter()
+        self.request(group)
+        keys = [(entry[0], TILE_SIZE) for entry in image_groups()[group]]
+        if group == "game" and self.scaled:
+            keys += [(entry[0], self.render_tile) for entries in image_groups(self.render_tile).values()
+                     for entry in entries]
+        for name, tile_size in keys:
+            self._resolve(name, tile_size)
+        if group == "game":
+            for zone in COLLISION_MAPS:
+                self._resolve_collisions(zone)
+        # L'atlas réunit tous les personnages (à l'échelle de rendu) : construit dès qu'ils sont tous chargés
+        sprites = self.sprites if self.scaled else self.images
+        if self.atlas is None and not self.headless and all(name in sprites for name in ATLAS_SPRITES):
+            self.build_atlas()
+
+        # À froid, les PNG sont décodés ; à chaud, tout vient du cache disque
+        elapsed = (time.perf_counter() - start) * 1000
+        self.timings[group] = elapsed
+        cached = sum(1 for key in keys if self.origins.get(key) == "cache")
+        decoded = sum(1 for key in keys if self.origins.get(key) == "png")
+        print(f"[Assets] Groupe '{group}' prêt en {elapsed:.0f} ms "
+              f"({'à chaud' if not decoded else 'à froid'} : {cached} depuis le cache, {decoded} décodées)")
+
+    def shutdown(self):
+        """Abandonne les décodages pas encore commencés (fermeture du jeu)"""
+        if self.executor:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+    # === Décodage (threads) ===
+
+    def _cache(self, tile_size):
+        cache = self.caches.get(tile_size)
+        if cache is None:
+            if not self.caches:
+                # Debug: afficher le chemin de base
+                base = get_base_path()
+                assets_dir = get_resource_path("assets")
+                print(f"[DEBUG] Base path: {base}")
+                print(f"[DEBUG] Assets dir: {assets_dir}")
+                print(f"[DEBUG] Assets dir existe: {os.path.exists(assets_dir)}")
+                if os.path.exists(assets_dir):
+                    print(f"[DEBUG] Contenu assets: {os.listdir(assets_dir)[:5]}...")
+            # Sprites déjà à l'échelle pour cette taille de tuile : pas de décodage PNG aux lancements suivants
+            cache = self.caches[tile_size] = AssetCache(tile_size)
+        return cache
+
+    def _submit(self, entries, tile_size=TILE_SIZE, collisions=False):
+        cache = self._cache(tile_size)
+        store = self.images if tile_size == TILE_SIZE else self.sprites
+        if self.executor is None:
+            workers = max(1, min(ASSET_LOADER_THREADS, os.cpu_count() or 1))
+            self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="AssetLoader")
+        for name, filename, size, target_height, create_mask in entries:
+            if name not in store and (name, tile_size) not in self.pending:
+                # Les sprites de rendu ne servent qu'à dessiner : pas de masque
+                self.pending[(name, tile_size)] = self.executor.submit(
+                    self._decode, cache, name, filename, size, target_height,
+                    create_mask and tile_size == TILE_SIZE)
+        if collisions:
+            resto_size = (RESTAURANT_WIDTH * TILE_SIZE, RESTAURANT_HEIGHT * TILE_SIZE)
+            for zone, filename in COLLISION_MAPS.items():
+                if zone not in self.collision_maps and zone not in self.pending_collisions:
+                    self.pending_collisions[zone] = self.executor.submit(
+                        self._parse_collisions, cache, zone, filename, resto_size)
+
+    def _decode(self, cache, name, filename, size, target_height, create_mask):
+        """Lit (cache) ou décode et met à l'échelle une image : (surface, masque, provenance)"""
+        path = get_resource_path(os.path.join("assets", filename))
+        if not os.path.exists(path):
+            print(f"Warning: Asset {path} not found. Using fallback.")
+            fallback_size = size or ((target_height, target_height) if target_height else (TILE_SIZE, TILE_SIZE))
+            img = pygame.Surface(fallback_size, pygame.SRCALPHA)
+            img.fill((255, 0, 255, 128))
+            return img, pygame.mask.from_surface(img) if create_mask else None, "fallback"
+
+        spec = f"{size[0]}x{size[1]}" if size else f"h{target_height}"
+        img = cache.load_image(name, spec, path)
+        origin = "cache"
+        if img is None:
+            origin = "png"
+            img = pygame.image.load(path)
+            if size is None:
                 # Calculate scale factor to fit target height
                 original_width, original_height = img.get_size()
                 scale_factor = target_height / original_height
-                new_width = int(original_width * scale_factor)
-                new_height = int(original_height * scale_factor)
-                
-                img = pygame.transform.scale(img, (new_width, new_height))
-                self.images[name] = img
-                
-                if create_mask:
-                    self.masks[name] = pygame.mask.from_surface(img)
+                size = (int(original_width * scale_factor), int(original_height * scale_factor))
+            img = pygame.transform.scale(img, size)
+            cache.store_image(name, spec, path, img)
+        return img, pygame.mask.from_surface(img) if create_mask else None, origin
+
+    def _parse_collisions(self, cache, zone, filename, target_size):
+        path = get_resource_path(os.path.join("assets", filename))
+        if not os.path.exists(path):
+            return TMXCollisionLoader.load_collisions(path, *target_size)
+        spec = f"{target_size[0]}x{target_size[1]}"
+        rects = cache.load_rects(f"collisions_{zone}", spec, path)
+        if rects is None:
+            rects = TMXCollisionLoader.load_collisions(path, *target_size)
+            cache.store_rects(f"collisions_{zone}", spec, path, rects)
+        return rects
+
+    # === Résultats (thread principal) ===
+
+    def _resolve(self, name, tile_size=TILE_SIZE):
+        """Attend l'image `name` si elle est en cours de décodage et la range"""
+        future = self.pending.pop((name, tile_size), None)
+        if future is None:
+            return
+        img, mask, origin = future.result()
+        if origin != "fallback" and not self.headless:
+            img = img.convert_alpha()
+        if tile_size == TILE_SIZE:
+            self.images[name] = img
+        else:
+            self.sprites[name] = img
+        self._link_sprite(name)
+        self.origins[(name, tile_size)] = origin
+        if mask is not None:
+            self.masks[name] = mask
+
+    def _link_sprite(self, name):
+        """Associe l'image logique `name` à son sprite de rendu (pour sprite_for)"""
+        if name in self.images and name in self.sprites:
+            self.sprite_of[self.images[name]] = self.sprites[name]
+
+    def _resolve_collisions(self, zone):
+        future = self.pending_collisions.pop(zone, None)
+        if future is not None:
+            self.collision_maps[zone] = future.result()
+
+    def _resolve_all(self):
+        for name, tile_size in list(self.pending):
+            self._resolve(name, tile_size)
+        for zone in list(self.pending_collisions):
+            self._resolve_collisions(zone)
+
+    def build_atlas(self):
+        """Range les sprites de personnages (à l'échelle de rendu), leurs variantes retournées et les
+        rotations de mort dans une seule surface. get_image/get_sprite/get_flipped/get_rotated
+        renvoient des sous-surfaces : plus aucune transformation (flip, rotate) pendant la partie."""
+        sprites = self.sprites if self.scaled else self.images
+        flips = self.sprite_flips if self.scaled else self.flipped
+        entries = []  # (clé, surface) : clé = ("image", nom) / ("flipped", nom) / ("rotation", nom, pas)
+        for name in ATLAS_SPRITES:
+            image = sprites.get(name)
+            if image is None:
+                continue
+            entries.append((("image", name), image))
+            entries.append((("flipped", name), pygame.transform.flip(image, True, False)))
+            if name in DEATH_SPRITES:
+                for step in range(DEATH_ROTATION_STEPS + 1):
+                    entries.append((("rotation", name, step),
+                                    pygame.transform.rotate(image, -self._step_angle(step))))
+        if not entries:
+            return
+
+        # Rangement par étagères : du plus haut au plus bas, de gauche à droite
+        entries.sort(key=lambda entry: entry[1].get_height(), reverse=True)
+        places = []
+        x = y = shelf_height = atlas_width = 0
+        for key, image in entries:
+            w, h = image.get_size()
+            if x + w > ATLAS_MAX_WIDTH:
+                x, y = 0, y + shelf_height
+                shelf_height = 0
+            places.append((key, image, pygame.Rect(x, y, w, h)))
+            x += w
+            shelf_height = max(shelf_height, h)
+            atlas_width = max(atlas_width, x)
+
+        atlas = pygame.Surface((atlas_width, y + shelf_height), pygame.SRCALPHA)
+        for key, image, rect in places:
+            atlas.blit(image, rect)
+        if pygame.display.get_surface():
+            atlas = atlas.convert_alpha()
+        self.atlas = atlas
+
+        rotations = {}
+        for key, image, rect in places:
+            sprite = atlas.subsurface(rect)
+            if key[0] == "image":
+                sprites[key[1]] = sprite
+                self._link_sprite(key[1])
+            elif key[0] == "flipped":
+                flips[key[1]] = sprite
             else:
-                print(f"Warning: Asset {path} not found. Using fallback.")
-                s = pygame.Surface((target_height, target_height), pygame.SRCALPHA)
-                s.fill((255, 0, 255, 128))
-                self.images[name] = s
-                if create_mask:
-                    self.masks[name] = pygame.mask.from_surface(s)
-
-        # Restaurant interiors
-        resto_width = RESTAURANT_WIDTH * TILE_SIZE
-        resto_height = RESTAURANT_HEIGHT * TILE_SIZE
-        load("interior_tacos", "floor_tacos.png", (resto_width, resto_height))
-        load("interior_kebab", "floor_kebab.png", (resto_width, resto_height))
-        
-        # Charger les collisions TMX pour tacos et kebab
-        self.collision_maps["tacos"] = TMXCollisionLoader.load_collisions(
-            get_resource_path(os.path.join("assets", "floor_tacos.tmx")), resto_width, resto_height
-        )
-        self.collision_maps["kebab"] = TMXCollisionLoader.load_collisions(
-            get_resource_path(os.path.join("assets", "floor_kebab.tmx")), resto_width, resto_height
-        )
-        
-        # Street tiles
-        load("sidewalk", "sidewalk.png", (TILE_SIZE, TILE_SIZE))
-        load("road", "street.png", (TILE_SIZE, TILE_SIZE))
-        load("wall", "wall.png", (TILE_SIZE, TILE_SIZE))
-        
-        # Facades
-        facade_w = 6 * TILE_SIZE
-        facade_h = 3 * TILE_SIZE
-        load("facade_tacos", "facade_tacos.png", (facade_w, facade_h))
-        load("facade_kebab", "facade_kebab.png", (facade_w, facade_h))
-        
-        # Door
-        load("door", "door.png", (TILE_SIZE, TILE_SIZE))
-        
-        # Characters - scale to height while keeping aspect ratio
-        char_height = int(TILE_SIZE * 1.8)  # Larger characters for better visibility
-        
-        # Players - versions droite et gauche
-        load_scaled("player1", "player1.png", char_height, create_mask=True)
-        load_scaled("player1_left", "player1-left.png", char_height, create_mask=True)
-        load_scaled("player2", "player2.png", char_height, create_mask=True)
-        load_scaled("player2_left", "player2-left.png", char_height, create_mask=True)
-        
-        # Clients - 3 types différents
-        load_scaled("client", "client.png", char_height, create_mask=True)
-        load_scaled("client1", "client1.png", char_height, create_mask=True)
-        load_scaled("client2", "client2.png", char_height, create_mask=True)
+                rotations.setdefault(key[1], {})[key[2]] = sprite
+        self.rotations = {sprites[name]: frames for name, frames in rotations.items()}
+        print(f"[Assets] Atlas {atlas.get_width()}x{atlas.get_height()} : {len(places)} sprites")
 
-        # Voleur (sabotage)
-        load_scaled("voleur", "voleur.png", char_height, create_mask=False)
+    @staticmethod
+    def _step_angle(step):
+        return step * DEATH_ROTATION_MAX / DEATH_ROTATION_STEPS
 
     def get_image(self, name):
+        self._resolve(name)
         return self.images.get(name)
+
+    def get_sprite(self, name):
+        """Image `name` à l'échelle de rendu des vues de la partie (get_image à l'échelle 1)"""
+        if not self.scaled:
+            return self.get_image(name)
+        self._resolve(name, self.render_tile)
+        return self.sprites.get(name)
+
+    def sprite_for(self, image):
+        """Sprite de rendu d'une image logique (celle d'un joueur, d'un client...) ; une image sans
+        variante chargée (fallback dessiné par le jeu) est mise à l'échelle une fois."""
+        if not self.scaled:
+            return image
+        sprite = self.sprite_of.get(image)
+        if sprite is None:
+            w, h = image.get_size()
+            sprite = pygame.transform.scale(image, (max(1, round(w * self.render_scale)),
+                                                    max(1, round(h * self.render_scale))))
+            self.sprite_of[image] = sprite
+        return sprite
+
+    def get_flipped(self, name):
+        """Sprite retourné horizontalement (précalculé dans l'atlas, sinon calculé une fois)"""
+        return self._flip(name, self.flipped, self.get_image)
+
+    def get_flipped_sprite(self, name):
+        """get_flipped à l'échelle de rendu des vues de la partie"""
+        if not self.scaled:
+            return self.get_flipped(name)
+        return self._flip(name, self.sprite_flips, self.get_sprite)
+
+    def _flip(self, name, flips, get):
+        sprite = flips.get(name)
+        if sprite is None:
+            image = get(name)
+            if image is None:
+                return None
+            sprite = pygame.transform.flip(image, True, False)
+            flips[name] = sprite
+        return sprite
+
+    def get_rotated(self, image, angle):
+        """Sprite (de rendu) tourné de `angle` degrés (sens horaire, 0 à 90°), arrondi au pas le plus proche.
+        Les sprites renvoyés sont partagés : set_alpha juste avant de les dessiner."""
+        step = min(DEATH_ROTATION_STEPS, max(0, round(angle * DEATH_ROTATION_STEPS / DEATH_ROTATION_MAX)))
+        frames = self.rotations.setdefault(image, {})
+        sprite = frames.get(step)
+        if sprite is None:
+            # Sprite hors atlas (fallback) : rotation calculée au premier usage
+            sprite = pygame.transform.rotate(image, -self._step_angle(step))
+            frames[step] = sprite
+        return sprite
         
     def get_mask(self, name):
+        self._resolve(name)
         return self.masks.get(name)
     
     def get_collisions(self, zone_name):
         """Retourne les rectangles de collision pour une zone donnée"""
+        self._resolve_collisions(zone_name)
         return self.collision_maps.get(zone_name, [])
\ No newline at end of file
@@ -3,10 +3,277 @@ Système audio pour SnackAnarchy
 Gère les sons et la musique du jeu
 """
 import pygame
+import glob
+import hashlib
+import json
 import os
 import sys
+import threading
+import time
+import numpy as np
 from config import *
-from game.assets_loader import get_resource_path
+from game.assets_loader import get_resource_path, get_cache_dir
+from game.music import SAMPLE_RATE, AmbientTrack, write_wav
+
+AMBIENT_MUSIC_VERSION = 1  # à incrémenter quand game/music.py change (piste régénérée)
+
+# Sons synthétiques du jeu :
+#   ('sound', fréquence, durée, forme d'onde, volume) ou ('chord', fréquences, durée, volume)
+SOUND_BANK = {
+    'footstep': ('sound', 200, 0.1, 'noise', 0.3),            # Son de pas
+    'serve': ('sound', 800, 0.2, 'sine', 0.5),                 # Son d'interaction/service
+    'money': ('sound', 1200, 0.15, 'square', 0.4),             # Son de caisse enregistreuse (cha-ching!)
+    'client_happy': ('sound', 600, 0.3, 'sine', 0.4),          # Son de client content
+    'client_angry': ('sound', 150, 0.4, 'sawtooth', 0.5),      # Son de client mécontent
+    'minigame_success': ('chord', (523, 659, 784), 0.4, 0.5),  # Son de minijeu réussi
+    'minigame_fail': ('sound', 150, 0.5, 'sawtooth', 0.4),     # Son de minijeu raté
+    'key_press': ('sound', 440, 0.05, 'square', 0.3),          # Son de touche dans le minijeu
+    'sabotage': ('sound', 100, 0.6, 'noise', 0.5),             # Son de sabotage
+    'steal_spit': ('sound', 300, 0.3, 'sawtooth', 0.6),        # Son de vol de broche
+    'pickup': ('sound', 600, 0.15, 'sine', 0.4),               # Son de ramassage d'objet
+    'stab': ('sound', 80, 0.2, 'noise', 0.7),                  # Son de coup de couteau/fourchette
+    'client_flee': ('sound', 400, 0.3, 'sine', 0.4),           # Son de client qui fuit
+    'client_death': ('sound', 120, 0.8, 'sawtooth', 0.6),      # Son de client qui meurt (plus dramatique)
+    'break': ('sound', 80, 0.5, 'noise', 0.6),                 # Son d'équipement qui casse
+    'repair': ('chord', (400, 500, 600), 0.3, 0.4),            # Son de réparation
+    'client_spawn': ('sound', 500, 0.2, 'sine', 0.3),          # Son de spawn client
+    'door': ('sound', 300, 0.25, 'square', 0.4),               # Son de transition de zone (porte)
+    'timer_warning': ('sound', 880, 0.1, 'square', 0.5),       # Son de timer warning
+    'game_over': ('chord', (200, 150, 100), 1.0, 0.6),         # Son de game over
+    'victory': ('chord', (523, 659, 784, 1047), 0.8, 0.6),     # Son de victoire
+    'menu_move': ('sound', 400, 0.05, 'sine', 0.3),            # Son de menu navigation
+    'menu_select': ('sound', 600, 0.1, 'sine', 0.4),           # Son de menu sélection
+    'stock_empty': ('sound', 200, 0.3, 'square', 0.4),         # Son de stock vide
+    'restock': ('chord', (400, 600, 800), 0.2, 0.4),           # Son de réapprovisionnement
+    'mission_complete': ('chord', (523, 659, 784, 1047), 0.5, 0.6),  # Son de mission complétée
+    'sweep': ('sound', 250, 0.6, 'noise', 0.4),                # Son de balayage
+}
+
+# Passe-bas du bruit : y[i] = 0.9 * y[i-1] + 0.1 * x[i], soit une convolution par 0.1 * 0.9^k.
+# 0.9^400 < 1e-18 : le noyau tronqué donne le même résultat que la récurrence, en une passe NumPy.
+LOWPASS_DECAY = 0.9
+LOWPASS_KERNEL = (1 - LOWPASS_DECAY) * LOWPASS_DECAY ** np.arange(400)
+
+
+def lowpass(wave):
+    """Passe-bas à un pôle sur tout le tableau (y[0] = x[0], comme la récurrence)"""
+    if len(wave) == 0:
+        return wave
+    x = wave.copy()
+    x[0] /= 1 - LOWPASS_DECAY
+    return np.convolve(x, LOWPASS_KERNEL)[:len(wave)]
+
+
+def synthesize(definition, rng=np.random, sample_rate=SAMPLE_RATE, channels=2):
+    """PCM 16 bits d'une entrée de SOUND_BANK, au format du mixer : tableau (n,) en mono,
+    (n, channels) sinon (le même signal sur chaque canal)"""
+    kind = definition[0]
+    if kind == 'chord':
+        _, frequencies, duration, volume = definition
+    else:
+        _, frequency, duration, wave_type, volume = definition
+    num_samples = int(sample_rate * duration)
+    t = np.linspace(0, duration, num_samples, False)
+
+    if kind == 'chord':
+        wave = np.zeros(num_samples)
+        for freq in frequencies:
+            wave += np.sin(2 * np.pi * freq * t)
+        wave = wave / len(frequencies)  # Normaliser
+        attack = int(num_samples * 0.05)
+        release = int(num_samples * 0.4)
+    else:
+        if wave_type == 'square':
+            wave = np.sign(np.sin(2 * np.pi * frequency * t))
+        elif wave_type == 'sawtooth':
+            wave = 2 * (t * frequency - np.floor(0.5 + t * frequency))
+        elif wave_type == 'noise':
+            # Bruit blanc adouci par un filtre passe-bas simple
+            wave = lowpass(rng.uniform(-1, 1, num_samples))
+        else:
+            wave = np.sin(2 * np.pi * frequency * t)
+        # Enveloppe ADSR simple
+        attack = int(num_samples * 0.1)
+        release = int(num_samples * 0.3)
+
+    envelope = np.ones(num_samples)
+    envelope[:attack] = np.linspace(0, 1, attack)
+    envelope[-release:] = np.linspace(1, 0, release)
+    wave = wave * envelope * volume
+
+    # Convertir en format audio
+    wave = (wave * 32767).astype(np.int16)
+    if channels == 1:
+        return wave
+    return np.repeat(wave[:, np.newaxis], channels, axis=1)
+
+
+# Voix du mixer : priorité (la plus haute gagne quand les canaux sont tous pris) et nombre maximal
+# de sons du même type joués en même temps
+PRIORITY_AMBIENT = 1  # foule, pas
+PRIORITY_ACTION = 2   # actions des joueurs, combat, sabotage
+PRIORITY_UI = 3       # menus, fin de partie, alertes
+DEFAULT_SOUND_RULE = (PRIORITY_ACTION, 2)
+SOUND_RULES = {
+    'footstep': (PRIORITY_AMBIENT, 2),
+    'client_spawn': (PRIORITY_AMBIENT, 1),
+    'client_angry': (PRIORITY_AMBIENT, 2),
+    'client_happy': (PRIORITY_AMBIENT, 2),
+    'client_flee': (PRIORITY_AMBIENT, 2),
+    'client_death': (PRIORITY_ACTION, 3),
+    'stab': (PRIORITY_ACTION, 3),
+    'menu_move': (PRIORITY_UI, 1),
+    'menu_select': (PRIORITY_UI, 1),
+    'key_press': (PRIORITY_UI, 2),
+    'minigame_success': (PRIORITY_UI, 1),
+    'minigame_fail': (PRIORITY_UI, 1),
+    'timer_warning': (PRIORITY_UI, 1),
+    'mission_complete': (PRIORITY_UI, 1),
+    'game_over': (PRIORITY_UI, 1),
+    'victory': (PRIORITY_UI, 1),
+}
+
+
+class VoiceScheduler:
+    """Répartit les sons sur un pool de canaux du mixer.
+
+    Un même son demandé plusieurs fois dans une frame n'est joué qu'une fois ; chaque type de son a
+    un nombre maximal de voix ; quand tous les canaux sont pris, le son le moins prioritaire (puis
+    le plus ancien) est coupé au profit du nouveau, sinon le nouveau est abandonné.
+    """
+
+    def __init__(self, channels, rules=None, clock=time.monotonic):
+        self.channels = channels
+        self.rules = SOUND_RULES if rules is None else rules
+        self.clock = clock
+        self.voices = [None] * len(channels)  # canal -> (nom, priorité, début) du dernier son lancé
+        self.frame_sounds = set()
+
+        # Compteurs
+        self.played = 0
+        self.deduped = 0   # doublons dans la même frame
+        self.limited = 0   # limite de voix du type atteinte
+        self.dropped = 0   # aucun canal libre ni son moins prioritaire à couper
+        self.stolen = 0    # sons coupés pour faire place à un plus prioritaire
+
+    def new_frame(self):
+        self.frame_sounds.clear()
+
+    def play(self, name, sound, loops=0):
+        """Joue `sound` (type `name`) sur une voix ; renvoie False si le son est écarté"""
+        if name in self.frame_sounds:
+            self.deduped += 1
+            return False
+        self.frame_sounds.add(name)
+        priority, max_voices = self.rules.get(name, DEFAULT_SOUND_RULE)
+
+        free = None
+        same_type = 0
+        victim = None
+        for index, channel in enumerate(self.channels):
+            voice = self.voices[index]
+            if voice is None or not channel.get_busy():
+                if free is None:
+                    free = index
+                continue
+            if voice[0] == name:
+                same_type += 1
+            # Candidat à couper : moins prioritaire, ou aussi prioritaire mais plus ancien
+            if voice[1] <= priority and (victim is None or voice[1:] < self.voices[victim][1:]):
+                victim = index
+
+        if same_type >= max_voices:
+            self.limited += 1
+            return False
+        if free is None:
+            if victim is None:
+                self.dropped += 1
+                return False
+            self.stolen += 1
+            free = victim
+
+        self.channels[free].play(sound, loops=loops)
+        self.voices[free] = (name, priority, self.clock())
+        self.played += 1
+        return True
+
+    def active(self):
+        return sum(1 for index, channel in enumerate(self.channels)
+                   if self.voices[index] is not None and channel.get_busy())
+
+    def stats(self):
+        return {
+            'voices': len(self.channels),
+            'active': self.active(),
+            'played': self.played,
+            'deduped': self.deduped,
+            'limited': self.limited,
+            'dropped': self.dropped,
+            'stolen': self.stolen,
+        }
+
+
+class PCMCache:
+    """Banque de sons déjà synthétisée, gardée sur disque en PCM brut (un seul fichier) et relue
+    en mémoire mappée. La clé couvre les définitions de SOUND_BANK et le format du mixer
+    (fréquence, format, canaux : pygame.mixer.get_init())."""
+    VERSION = 2
+
+    def __init__(self, mixer_format):
+        self.dir = get_cache_dir("audio")
+        self.channels = mixer_format[2]
+        key = repr((self.VERSION, SAMPLE_RATE, mixer_format, sorted(SOUND_BANK.items())))
+        self.name = "sounds_" + hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+
+    def _paths(self):
+        base = os.path.join(self.dir, self.name)
+        return base + ".pcm", base + ".json"
+
+    def load(self):
+        """{nom: PCM} lus dans le fichier mappé, ou None si le cache est absent/périmé"""
+        if self.dir is None:
+            return None
+        data_path, index_path = self._paths()
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            if set(index) != set(SOUND_BANK):
+                return None
+            data = np.memmap(data_path, dtype=np.int16, mode='r')
+            pcm = {}
+            for name, (offset, frames) in index.items():
+                size = frames * self.channels
+                if offset + size > len(data):
+                    return None
+                samples = data[offset:offset + size]
+                pcm[name] = samples if self.channels == 1 else samples.reshape(frames, self.channels)
+            return pcm
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def store(self, pcm):
+        """Écrit les sons à la suite (données puis index, remplacés d'un coup), supprime les anciens"""
+        if self.dir is None:
+            return
+        data_path, index_path = self._paths()
+        index = {}
+        offset = 0
+        try:
+            with open(data_path + ".tmp", 'wb') as f:
+                for name, samples in pcm.items():
+                    f.write(np.ascontiguousarray(samples, dtype=np.int16).tobytes())
+                    index[name] = (offset, len(samples))
+                    offset += samples.size
+            os.replace(data_path + ".tmp", data_path)
+            with open(index_path + ".tmp", 'w', encoding='utf-8') as f:
+                json.dump(index, f)
+            os.replace(index_path + ".tmp", index_path)
+            for stale in glob.glob(os.path.join(self.dir, "sounds_*")):
+                if not stale.startswith(os.path.join(self.dir, self.name)):
+                    os.remove(stale)
+        except OSError as e:
+            print(f"[Audio] Cache des sons non écrit: {e}")
+
 
 class AudioManager:
     _instance = None
@@ -17,34 +284,36 @@ class AudioManager:
             cls._instance = AudioManager()
         return cls._instance
     
-    def __init__(self):
+    @classmethod
+    def init_headless(cls):
+        """Installe un gestionnaire muet, sans mixer (simulation sans fenêtre)"""
+        cls._instance = AudioManager(init_mixer=False)
+        return cls._instance
+    
+    def __init__(self, init_mixer=True):
         # État d'activation de l'audio
         self.enabled = False
 
         # Tenter d'initialiser le mixer avec repli si l'endpoint audio pose problème
         # (cas fréquent sur certains Windows/WASAPI ou machines sans sortie audio)
-        self._init_mixer_with_fallbacks()
+        if init_mixer:
+            self._init_mixer_with_fallbacks()
 
         self.sounds = {}
+        self._bank_thread = None
+        self._music_thread = None
+        self._pending_music = None
         self.music_volume = 0.5
         self.sfx_volume = 0.7
         self.muted = False
 
         # Si l'audio est désactivé, ne pas aller plus loin
         if not self.enabled:
-            self.channels = {}
+            self.voices = None
             return
 
-        # Canaux dédiés
-        self.channels = {
-            'ui': pygame.mixer.Channel(0),
-            'player1': pygame.mixer.Channel(1),
-            'player2': pygame.mixer.Channel(2),
-            'client': pygame.mixer.Channel(3),
-            'ambient': pygame.mixer.Channel(4),
-            'combat': pygame.mixer.Channel(5),
-            'sabotage': pygame.mixer.Channel(6),
-        }
+        # Tous les canaux du mixer forment le pool de voix des effets
+        self.voices = VoiceScheduler([pygame.mixer.Channel(i) for i in range(pygame.mixer.get_num_channels())])
 
         self._load_sounds()
 
@@ -80,399 +349,126 @@ class AudioManager:
         print("[Audio] Aucun driver audio disponible, son désactivé (le jeu continue).")
         
     def _load_sounds(self):
-        """Charge tous les sons du jeu ou crée des sons synthétiques"""
+        """Prépare la banque de sons dans un thread : relue depuis le cache disque si possible,
+        sinon synthétisée puis mise en cache. Les Sound sont créés au premier son joué."""
         if not self.enabled:
             return
-        sound_path = os.path.join(os.path.dirname(__file__), '..', 'assets', 'sounds')
-        
-        # Créer les sons synthétiques si les fichiers n'existent pas
-        self._create_synthetic_sounds()
-        
-    def _create_synthetic_sounds(self):
-        """Crée des sons synthétiques avec pygame"""
-        if not self.enabled:
-            return
-        import numpy as np
-        
-        sample_rate = 44100
-        
-        # Son de pas
-        self.sounds['footstep'] = self._generate_sound(
-            frequency=200, duration=0.1, wave_type='noise', volume=0.3
-        )
-        
-        # Son d'interaction/service
-        self.sounds['serve'] = self._generate_sound(
-            frequency=800, duration=0.2, wave_type='sine', volume=0.5
-        )
-        
-        # Son de caisse enregistreuse (cha-ching!)
-        self.sounds['money'] = self._generate_sound(
-            frequency=1200, duration=0.15, wave_type='square', volume=0.4
-        )
-        
-        # Son de client content
-        self.sounds['client_happy'] = self._generate_sound(
-            frequency=600, duration=0.3, wave_type='sine', volume=0.4
-        )
-        
-        # Son de client mécontent
-        self.sounds['client_angry'] = self._generate_sound(
-            frequency=150, duration=0.4, wave_type='sawtooth', volume=0.5
-        )
-        
-        # Son de minijeu réussi
-        self.sounds['minigame_success'] = self._generate_chord(
-            frequencies=[523, 659, 784], duration=0.4, volume=0.5
-        )
-        
-        # Son de minijeu raté
-        self.sounds['minigame_fail'] = self._generate_sound(
-            frequency=150, duration=0.5, wave_type='sawtooth', volume=0.4
-        )
-        
-        # Son de touche dans le minijeu
-        self.sounds['key_press'] = self._generate_sound(
-            frequency=440, duration=0.05, wave_type='square', volume=0.3
-        )
-        
-        # Son de sabotage
-        self.sounds['sabotage'] = self._generate_sound(
-            frequency=100, duration=0.6, wave_type='noise', volume=0.5
-        )
-        
-        # Son de vol de broche
-        self.sounds['steal_spit'] = self._generate_sound(
-            frequency=300, duration=0.3, wave_type='sawtooth', volume=0.6
-        )
-        
-        # Son de ramassage d'objet
-        self.sounds['pickup'] = self._generate_sound(
-            frequency=600, duration=0.15, wave_type='sine', volume=0.4
-        )
-        
-        # Son de coup de couteau/fourchette
-        self.sounds['stab'] = self._generate_sound(
-            frequency=80, duration=0.2, wave_type='noise', volume=0.7
-        )
-        
-        # Son de client qui fuit
-        self.sounds['client_flee'] = self._generate_sound(
-            frequency=400, duration=0.3, wave_type='sine', volume=0.4
-        )
-        
-        # Son de client qui meurt (plus dramatique)
-        self.sounds['client_death'] = self._generate_sound(
-            frequency=120, duration=0.8, wave_type='sawtooth', volume=0.6
-        )
-        
-        # Son d'équipement qui casse
-        self.sounds['break'] = self._generate_sound(
-            frequency=80, duration=0.5, wave_type='noise', volume=0.6
-        )
-        
-        # Son de réparation
-        self.sounds['repair'] = self._generate_chord(
-            frequencies=[400, 500, 600], duration=0.3, volume=0.4
-        )
-        
-        # Son de spawn client
-        self.sounds['client_spawn'] = self._generate_sound(
-            frequency=500, duration=0.2, wave_type='sine', volume=0.3
-        )
-        
-        # Son de transition de zone (porte)
-        self.sounds['door'] = self._generate_sound(
-            frequency=300, duration=0.25, wave_type='square', volume=0.4
-        )
-        
-        # Son de timer warning
-        self.sounds['timer_warning'] = self._generate_sound(
-            frequency=880, duration=0.1, wave_type='square', volume=0.5
-        )
-        
-        # Son de game over
-        self.sounds['game_over'] = self._generate_chord(
-            frequencies=[200, 150, 100], duration=1.0, volume=0.6
-        )
-        
-        # Son de victoire
-        self.sounds['victory'] = self._generate_chord(
-            frequencies=[523, 659, 784, 1047], duration=0.8, volume=0.6
-        )
-        
-        # Son de menu navigation
-        self.sounds['menu_move'] = self._generate_sound(
-            frequency=400, duration=0.05, wave_type='sine', volume=0.3
-        )
-        
-        # Son de menu sélection
-        self.sounds['menu_select'] = self._generate_sound(
-            frequency=600, duration=0.1, wave_type='sine', volume=0.4
-        )
-        
-        # Son de stock vide
-        self.sounds['stock_empty'] = self._generate_sound(
-            frequency=200, duration=0.3, wave_type='square', volume=0.4
-        )
-        
-        # Son de réapprovisionnement
-        self.sounds['restock'] = self._generate_chord(
-            frequencies=[400, 600, 800], duration=0.2, volume=0.4
-        )
-        
-        # Son de mission complétée
-        self.sounds['mission_complete'] = self._generate_chord(
-            frequencies=[523, 659, 784, 1047], duration=0.5, volume=0.6
-        )
-        
-        # Son de balayage
-        self.sounds['sweep'] = self._generate_sound(
-            frequency=250, duration=0.6, wave_type='noise', volume=0.4
-        )
-        
-    def _generate_sound(self, frequency, duration, wave_type='sine', volume=0.5):
-        """Génère un son synthétique"""
-        if not self.enabled:
-            return None
-        import numpy as np
-        
-        sample_rate = 44100
-        num_samples = int(sample_rate * duration)
-        t = np.linspace(0, duration, num_samples, False)
-        
-        if wave_type == 'sine':
-            wave = np.sin(2 * np.pi * frequency * t)
-        elif wave_type == 'square':
-            wave = np.sign(np.sin(2 * np.pi * frequency * t))
-        elif wave_type == 'sawtooth':
-            wave = 2 * (t * frequency - np.floor(0.5 + t * frequency))
-        elif wave_type == 'noise':
-            wave = np.random.uniform(-1, 1, num_samples)
-            # Appliquer un filtre passe-bas simple
-            for i in range(1, len(wave)):
-                wave[i] = wave[i-1] * 0.9 + wave[i] * 0.1
+        self._bank_pcm = None
+        self._bank_thread = threading.Thread(target=self._prepare_sound_bank, name="SoundBank", daemon=True)
+        self._bank_thread.start()
+
+    def _prepare_sound_bank(self):
+        # Le mixer a pu ouvrir la sortie dans un autre format que demandé (mono, 5.1, 48 kHz...)
+        mixer_format = pygame.mixer.get_init()
+        sample_rate, _, channels = mixer_format
+        cache = PCMCache(mixer_format)
+        start = time.perf_counter()
+        pcm = cache.load()
+        if pcm is not None:
+            origin = "cache"
         else:
-            wave = np.sin(2 * np.pi * frequency * t)
-        
-        # Enveloppe ADSR simple
-        attack = int(num_samples * 0.1)
-        decay = int(num_samples * 0.1)
-        release = int(num_samples * 0.3)
-        
-        envelope = np.ones(num_samples)
-        envelope[:attack] = np.linspace(0, 1, attack)
-        envelope[-release:] = np.linspace(1, 0, release)
-        
-        wave = wave * envelope * volume
-        
-        # Convertir en format audio
-        wave = (wave * 32767).astype(np.int16)
-        stereo_wave = np.column_stack((wave, wave))
-        
-        sound = pygame.sndarray.make_sound(stereo_wave)
-        return sound
-    
-    def _generate_chord(self, frequencies, duration, volume=0.5):
-        """Génère un accord (plusieurs fréquences)"""
-        if not self.enabled:
-            return None
-        import numpy as np
-        
-        sample_rate = 44100
-        num_samples = int(sample_rate * duration)
-        t = np.linspace(0, duration, num_samples, False)
-        
-        wave = np.zeros(num_samples)
-        for freq in frequencies:
-            wave += np.sin(2 * np.pi * freq * t)
-        
-        wave = wave / len(frequencies)  # Normaliser
-        
-        # Enveloppe
-        attack = int(num_samples * 0.05)
-        release = int(num_samples * 0.4)
-        
-        envelope = np.ones(num_samples)
-        envelope[:attack] = np.linspace(0, 1, attack)
-        envelope[-release:] = np.linspace(1, 0, release)
-        
-        wave = wave * envelope * volume
-        wave = (wave * 32767).astype(np.int16)
-        stereo_wave = np.column_stack((wave, wave))
-        
-        return pygame.sndarray.make_sound(stereo_wave)
-    
+            pcm = {name: synthesize(definition, sample_rate=sample_rate, channels=channels)
+                   for name, definition in SOUND_BANK.items()}
+            cache.store(pcm)
+            origin = "synthèse"
+        self._bank_pcm = pcm
+        print(f"[Audio] {len(pcm)} sons prêts en {(time.perf_counter() - start) * 1000:.0f} ms ({origin})")
+
+    def _wait_sound_bank(self):
+        """Attend la banque de sons (normalement prête bien avant le premier son) et crée les Sound"""
+        if self._bank_thread is None:
+            return
+        self._bank_thread.join()
+        self._bank_thread = None
+        for name, pcm in (self._bank_pcm or {}).items():
+            self.sounds[name] = pygame.sndarray.make_sound(pcm)
+        self._bank_pcm = None
+
     def play(self, sound_name, channel='ui', loops=0):
-        """Joue un son"""
+        """Joue un son. channel indique sa source (ui, player1, client...) : la voix réelle est
+        choisie par le VoiceScheduler selon la priorité et la limite de voix du son."""
         if self.muted or not self.enabled:
             return
             
-        if sound_name not in self.sounds:
+        self._wait_sound_bank()
+        sound = self.sounds.get(sound_name)
+        if sound is None:
             return
-            
-        sound = self.sounds[sound_name]
         sound.set_volume(self.sfx_volume)
-        
-        if channel in self.channels:
-            self.channels[channel].play(sound, loops=loops)
-        else:
-            sound.play(loops=loops)
+        self.voices.play(sound_name, sound, loops=loops)
             
     def play_music(self, music_name='ambient'):
-        """Joue une musique de fond (loop). music_name: 'ambient' ou 'menu'."""
+        """Joue une musique de fond (loop). music_name: 'ambient' ou 'menu'.
+        La musique est lue en flux depuis le disque (pygame.mixer.music) ; si la piste d'ambiance
+        est encore en cours de génération, elle démarre dès qu'elle est prête (voir update())."""
         if self.muted or not self.enabled:
             return
+        self._pending_music = None
 
         if music_name == 'menu':
             music_path = get_resource_path(os.path.join('assets', 'menu.wav'))
             if not os.path.exists(music_path):
                 return
         else:
-            music_path = get_resource_path(os.path.join('assets', 'music_ambient.wav'))
+            music_path = self._ambient_music_path()
             if not os.path.exists(music_path):
-                try:
-                    self._generate_ambient_music(music_path)
-                except Exception as e:
-                    print(f"Impossible de générer la musique: {e}")
-                    return
+                if self.prepare_music():
+                    self._pending_music = music_name
+                return
 
-        if os.path.exists(music_path):
-            try:
-                pygame.mixer.music.load(music_path)
-                pygame.mixer.music.set_volume(self.music_volume)
-                pygame.mixer.music.play(-1)  # -1 = boucle infinie
-            except Exception as e:
-                print(f"Erreur chargement musique: {e}")
+        try:
+            pygame.mixer.music.load(music_path)
+            pygame.mixer.music.set_volume(self.music_volume)
+            pygame.mixer.music.play(-1)  # -1 = boucle infinie
+        except Exception as e:
+            print(f"Erreur chargement musique: {e}")
+
+    def prepare_music(self):
+        """Lance la génération de la musique d'ambiance dans un thread si elle n'existe pas encore
+        (à appeler au menu, bien avant la partie). Renvoie False si elle ne pourra pas être jouée."""
+        if not self.enabled:
+            return False
+        music_path = self._ambient_music_path()
+        if os.path.exists(music_path) or self._music_thread is not None:
+            return True
+        self._music_thread = threading.Thread(target=self._generate_ambient_music, args=(music_path,),
+                                              name="AmbientMusic", daemon=True)
+        self._music_thread.start()
+        return True
+
+    def update(self):
+        """À appeler à chaque frame : nouvelle frame pour le dédoublonnage des sons, et démarrage
+        de la musique attendue dès que sa génération est finie"""
+        if self.voices is not None:
+            self.voices.new_frame()
+        if self._music_thread is not None and not self._music_thread.is_alive():
+            self._music_thread = None
+            # Génération ratée : pas de nouvel essai à chaque frame
+            if self._pending_music and os.path.exists(self._ambient_music_path()):
+                self.play_music(self._pending_music)
+            self._pending_music = None
+
+    def _ambient_music_path(self):
+        """Piste livrée dans assets/ si elle existe, sinon piste générée dans le cache utilisateur"""
+        shipped = get_resource_path(os.path.join('assets', 'music_ambient.wav'))
+        cache_dir = get_cache_dir("audio")
+        if os.path.exists(shipped) or cache_dir is None:
+            return shipped
+        return os.path.join(cache_dir, f"music_ambient_v{AMBIENT_MUSIC_VERSION}_{AMBIENT_MUSIC_SECONDS}s.wav")
         
     def stop_music(self):
         """Arrête la musique"""
         if not self.enabled:
             return
+        self._pending_music = None
         pygame.mixer.music.stop()
         
     def _generate_ambient_music(self, filepath):
-        """Génère une musique d'ambiance style fast-food/arcade"""
-        import numpy as np
-        import wave
-        import struct
-        
-        sample_rate = 44100
-        duration = 30  # 30 secondes de boucle
-        
-        num_samples = sample_rate * duration
-        t = np.linspace(0, duration, num_samples, False)
-        
-        # Créer une musique funky/arcade pour fast-food
-        music = np.zeros(num_samples)
-        
-        # Basse funky (groove de base)
-        bass_pattern = [65.41, 0, 65.41, 0, 82.41, 0, 65.41, 0]  # C2, E2, C2 pattern
-        beats_per_second = 2  # 120 BPM
-        beat_duration = 1.0 / beats_per_second
-        
-        for i, note in enumerate(bass_pattern * int(duration * beats_per_second / len(bass_pattern))):
-            if note > 0:
-                start = int(i * beat_duration * sample_rate / 2)
-                end = int((i + 0.4) * beat_duration * sample_rate / 2)
-                if end <= num_samples:
-                    segment_t = t[start:end] - t[start]
-                    # Son de basse avec un peu de growl
-                    bass_wave = np.sin(2 * np.pi * note * segment_t) * 0.4
-                    bass_wave += np.sin(2 * np.pi * note * 2 * segment_t) * 0.1
-                    # Envelope
-                    env = np.exp(-segment_t * 4)
-                    music[start:end] += bass_wave * env
-        
-        # Accords/pads (ambiance chaude)
-        chord_freqs = [
-            [261.63, 329.63, 392.00],  # C major
-            [293.66, 369.99, 440.00],  # D major
-            [261.63, 329.63, 392.00],  # C major
-            [246.94, 311.13, 369.99],  # B minor
-        ]
-        
-        chord_duration = duration / len(chord_freqs)
-        for i, chord in enumerate(chord_freqs * 2):
-            start = int(i * chord_duration * sample_rate / 2)
-            end = int((i + 1) * chord_duration * sample_rate / 2)
-            if end <= num_samples:
-                segment_t = t[start:end] - t[start]
-                chord_wave = np.zeros(end - start)
-                for freq in chord:
-                    chord_wave += np.sin(2 * np.pi * freq * segment_t) * 0.08
-                # Envelope douce
-                attack = int(0.1 * (end - start))
-                release = int(0.2 * (end - start))
-                env = np.ones(end - start)
-                env[:attack] = np.linspace(0, 1, attack)
-                env[-release:] = np.linspace(1, 0, release)
-                music[start:end] += chord_wave * env
-        
-        # Mélodie simple et accrocheuse (style arcade)
-        melody_notes = [
-            523.25, 0, 587.33, 523.25, 0, 392.00, 440.00, 0,
-            523.25, 0, 659.25, 587.33, 0, 523.25, 0, 0,
-            698.46, 0, 659.25, 587.33, 0, 523.25, 587.33, 0,
-            523.25, 0, 440.00, 392.00, 0, 349.23, 392.00, 0,
-        ]
-        
-        note_duration = duration / len(melody_notes)
-        for i, note in enumerate(melody_notes * 2):
-            if note > 0:
-                start = int(i * note_duration * sample_rate / 2)
-                end = int((i + 0.7) * note_duration * sample_rate / 2)
-                if end <= num_samples:
-                    segment_t = t[start:end] - t[start]
-                    # Son type synthé rétro
-                    melody_wave = np.sin(2 * np.pi * note * segment_t) * 0.15
-                    melody_wave += np.sin(2 * np.pi * note * 2 * segment_t) * 0.05  # Harmonique
-                    # Envelope
-                    attack = int(0.05 * (end - start))
-                    release = int(0.3 * (end - start))
-                    env = np.ones(end - start)
-                    env[:attack] = np.linspace(0, 1, attack)
-                    env[-release:] = np.linspace(1, 0.2, release)
-                    music[start:end] += melody_wave * env
-        
-        # Percussion légère (hi-hat style)
-        for i in range(int(duration * 4)):  # 4 hits par seconde
-            start = int(i * sample_rate / 4)
-            hit_length = int(sample_rate * 0.05)
-            if start + hit_length <= num_samples:
-                # Noise burst pour hi-hat
-                noise = np.random.uniform(-1, 1, hit_length)
-                env = np.exp(-np.linspace(0, 10, hit_length))
-                music[start:start + hit_length] += noise * env * 0.08
-        
-        # Kick drum sur les temps forts
-        for i in range(int(duration * 2)):  # 2 kicks par seconde
-            start = int(i * sample_rate / 2)
-            kick_length = int(sample_rate * 0.1)
-            if start + kick_length <= num_samples:
-                kick_t = np.linspace(0, 0.1, kick_length)
-                # Kick avec pitch drop
-                kick_freq = 150 * np.exp(-kick_t * 30)
-                kick = np.sin(2 * np.pi * kick_freq * kick_t)
-                env = np.exp(-kick_t * 20)
-                music[start:start + kick_length] += kick * env * 0.25
-        
-        # Normaliser
-        max_val = np.max(np.abs(music))
-        if max_val > 0:
-            music = music / max_val * 0.7
-        
-        # Convertir en 16-bit
-        music_int = (music * 32767).astype(np.int16)
-        
-        # Sauvegarder en WAV
+        """Génère la musique d'ambiance (thread) : écrite par blocs, publiée d'un coup"""
+        start = time.perf_counter()
         try:
-            with wave.open(filepath, 'w') as wav_file:
-                wav_file.setnchannels(1)  # Mono
-                wav_file.setsampwidth(2)  # 16-bit
-                wav_file.setframerate(sample_rate)
-                wav_file.writeframes(music_int.tobytes())
-            print(f"Musique d'ambiance générée: {filepath}")
+            write_wav(AmbientTrack(duration=AMBIENT_MUSIC_SECONDS), filepath)
+            print(f"Musique d'ambiance générée: {filepath} ({(time.perf_counter() - start) * 1000:.0f} ms)")
         except Exception as e:
             print(f"Erreur génération musique: {e}")
         
@@ -492,6 +488,10 @@ class AudioManager:
         """Définit le volume des effets sonores (0.0 à 1.0)"""
         self.sfx_volume = max(0.0, min(1.0, volume))
         
+    def stats(self):
+        """Compteurs des voix du mixer (sons joués, doublons, limités, abandonnés, coupés)"""
+        return self.voices.stats() if self.voices is not None else {}
+
     def toggle_mute(self):
         """Active/désactive le son"""
         self.muted = not self.muted
@@ -1,20 +1,33 @@
 import pygame
 import random
-import time
 import math
 from config import *
 from game.dishes import create_dish_for_restaurant
 from game.assets_loader import Assets
 from game.animation import DeathAnimation, FleeAnimation
 from game.audio import play_sound
+from game.clock import wall_clock
+from game.fonts import render_text
 
 class Client(pygame.sprite.Sprite):
     # Types de clients disponibles
     CLIENT_TYPES = ['client', 'client1', 'client2']
     
-    def __init__(self, x, y, zone="street", client_type=None, target_zone=None):
+    def __init__(self, x, y, zone="street", client_type=None, target_zone=None, clock=None, patience=CLIENT_PATIENCE):
         super().__init__()
         
+        # Index de la partie (GameState.client_index), renseigné à l'ajout du client
+        self._index = None
+        # Foule de la partie (GameState.crowd) : case dans les tableaux, et propriétaire de la
+        # position tant que le client se balade (voir la propriété rect)
+        self._crowd = None
+        self._slot = None
+        self._position_owner = None
+        self._rect_version = 0
+        
+        # Horloge de simulation (GameState.clock)
+        self.clock = clock or wall_clock
+        
         assets = Assets.get()
         
         # Choisir un type de client aléatoire si non spécifié
@@ -86,13 +99,13 @@ class Client(pygame.sprite.Sprite):
         self.is_first_in_queue = False  # True uniquement pour le premier de la file (bulle plat)
         
         # On commence à mesurer la patience uniquement une fois en file intérieure
-        self.spawn_time = None if self.state != "waiting" else time.time()
-        self.patience = 45
+        self.spawn_time = None if self.state != "waiting" else self.clock.now()
+        self.patience = patience
         
         # Pour le wandering
         self.wander_dir_x = 0
         self.wander_dir_y = 0
-        self.wander_change_time = time.time()
+        self.wander_change_time = self.clock.now()
         
         # Animations
         self.death_animation = None
@@ -103,6 +116,74 @@ class Client(pygame.sprite.Sprite):
         self.fear_level = 0
         self.shake_offset = (0, 0)
         
+    # Tant qu'il se balade, la position du client vit dans les tableaux de la foule
+    @property
+    def rect(self):
+        owner = self._position_owner
+        if owner is not None and self._rect_version != owner.version:
+            owner.sync_rect(self)
+        return self._rect
+
+    @rect.setter
+    def rect(self, value):
+        self._rect = value
+
+    # Patience et début d'attente sont recopiés dans la foule (expiration vectorisée)
+    @property
+    def spawn_time(self):
+        return self._spawn_time
+
+    @spawn_time.setter
+    def spawn_time(self, value):
+        self._spawn_time = value
+        if self._crowd is not None:
+            self._crowd.set_spawn_time(self, value)
+
+    @property
+    def patience(self):
+        return self._patience
+
+    @patience.setter
+    def patience(self, value):
+        self._patience = value
+        if self._crowd is not None:
+            self._crowd.set_patience(self, value)
+
+    # zone, target_zone et state sont indexés : tout changement met à jour GameState.client_index
+    @property
+    def zone(self):
+        return self._zone
+
+    @zone.setter
+    def zone(self, value):
+        self._set_indexed('_zone', value)
+
+    @property
+    def target_zone(self):
+        return self._target_zone
+
+    @target_zone.setter
+    def target_zone(self, value):
+        self._set_indexed('_target_zone', value)
+
+    @property
+    def state(self):
+        return self._state
+
+    @state.setter
+    def state(self, value):
+        if self._crowd is not None:
+            self._crowd.on_state(self, self._state, value)
+        self._set_indexed('_state', value)
+
+    def _set_indexed(self, attr, value):
+        if self._index is None:
+            setattr(self, attr, value)
+            return
+        old_key = (self._zone, self._target_zone, self._state)
+        setattr(self, attr, value)
+        self._index.moved(self, old_key)
+
     def _generate_absurd_request(self):
         requests = [
             "Sans gluten mais avec double pain",
@@ -130,6 +211,13 @@ class Client(pygame.sprite.Sprite):
         self.rect.centerx += int(dx / dist * step)
         self.rect.centery += int(dy / dist * step)
 
+    def _walk_to_tile(self, world_map, tile):
+        """Avance vers une tuile en suivant le champ de flux partagé (contourne les obstacles)"""
+        target_x, target_y = world_map.pathfinder.next_waypoint(
+            self.zone, self.rect.centerx, self.rect.centery, tile
+        )
+        self._move_towards(target_x, target_y)
+
     def _clamp_to_street_zone(self, zone):
         """Maintient le client dans les limites walkables de la rue (évite de sortir en bas)."""
         # Rue : trottoir/route = lignes 3 à 7 (pixels 3*TILE_SIZE à 8*TILE_SIZE)
@@ -176,77 +264,23 @@ class Client(pygame.sprite.Sprite):
         else:
             self.shake_offset = (0, 0)
             
+        # Passant : déplacement et direction vectorisés (game.crowd)
+        if self._position_owner is not None:
+            return
+
         # Si pas de world_map, juste vérifier la patience
         if world_map is None:
-            if self.state == "waiting" and self.spawn_time is not None:
-                if time.time() - self.spawn_time > self.patience:
+            if self._crowd is None and self.state == "waiting" and self.spawn_time is not None:
+                if self.clock.now() - self.spawn_time > self.patience:
                     self.state = "angry"
                     play_sound('client_angry', 'client')
             return
         
         # === Logique de déplacement ===
         
-        # 1) Clients qui se baladent dans la rue
+        # 1) Clients qui se baladent dans la rue : déplacement et choix d'une file par la foule
         if self.state == "wandering":
-            zone = world_map.get_zone(self.zone)
-            if not zone:
-                return
-
-            # Change de direction de temps en temps
-            if time.time() - self.wander_change_time > 1.0:
-                self.wander_change_time = time.time()
-                self.wander_dir_x, self.wander_dir_y = random.choice(
-                    [(1, 0), (-1, 0), (0, 1), (0, -1), (0, 0)]
-                )
-
-            if self.wander_dir_x != 0 or self.wander_dir_y != 0:
-                new_cx = self.rect.centerx + self.wander_dir_x * self.speed
-                new_cy = self.rect.centery + self.wander_dir_y * self.speed
-                tile_x = int(new_cx // TILE_SIZE)
-                tile_y = int(new_cy // TILE_SIZE)
-                if zone.is_walkable(tile_x, tile_y):
-                    self.rect.centerx = new_cx
-                    self.rect.centery = new_cy
-
-            # Vérifie si une place est dispo dans une file extérieure de resto
-            if game_state:
-                # Déterminer les restaurants avec de la place
-                available_restaurants = []
-                for restaurant in ["tacos", "kebab"]:
-                    outside_clients = [
-                        c for c in game_state.clients
-                        if c.zone == "street" and getattr(c, "target_zone", None) == restaurant
-                    ]
-                    if len(outside_clients) < 3:
-                        available_restaurants.append(restaurant)
-                
-                if available_restaurants:
-                    # Choisir le restaurant en fonction de la réputation du propriétaire
-                    tacos_owner = game_state._get_restaurant_owner("tacos")
-                    kebab_owner = game_state._get_restaurant_owner("kebab")
-                    tacos_rep = tacos_owner.reputation if tacos_owner else 50
-                    kebab_rep = kebab_owner.reputation if kebab_owner else 50
-                    
-                    if len(available_restaurants) == 1:
-                        chosen_restaurant = available_restaurants[0]
-                    else:
-                        # Les deux sont disponibles, choisir selon la réputation
-                        total_rep = tacos_rep + kebab_rep
-                        if total_rep <= 0:
-                            chosen_restaurant = random.choice(available_restaurants)
-                        else:
-                            tacos_probability = tacos_rep / total_rep
-                            chosen_restaurant = "tacos" if random.random() < tacos_probability else "kebab"
-                    
-                    # Ce client rejoint la file de ce restaurant
-                    self.target_zone = chosen_restaurant
-                    self.is_wanderer = False
-                    self.state = "walking_to_restaurant"
-                    # Nouveau plat dédié à ce client (toujours une instance fraîche)
-                    self.dish = create_dish_for_restaurant(chosen_restaurant)
-                    if hasattr(game_state, '_recompute_queues'):
-                        game_state._recompute_queues()
-                    return
+            return
 
         # 2) Clients qui se dirigent vers un restaurant
         if self.state == "walking_to_restaurant":
@@ -254,35 +288,22 @@ class Client(pygame.sprite.Sprite):
             if not zone:
                 return
 
-            # Cherche la porte de rue qui mène à notre restaurant cible
-            door_to_restaurant = None
-            for door in zone.doors:
-                dx, dy, target_zone, _, _ = door
-                if target_zone == self.target_zone:
-                    door_to_restaurant = door
-                    break
+            # Porte de rue qui mène à notre restaurant cible
+            door_to_restaurant = zone.get_door_to(self.target_zone)
 
             if door_to_restaurant:
-                dx, dy, target_zone, target_x, target_y = door_to_restaurant
-                target_px = dx * TILE_SIZE + TILE_SIZE // 2
-                target_py = dy * TILE_SIZE + TILE_SIZE // 2
-                self._move_towards(target_px, target_py)
+                dx, dy, target_zone, _, _ = door_to_restaurant
+                self._walk_to_tile(world_map, (dx, dy))
 
                 # Vérifie si on est sur la tuile de la porte
                 tile_x = int(self.rect.centerx // TILE_SIZE)
                 tile_y = int(self.rect.centery // TILE_SIZE)
                 if tile_x == dx and tile_y == dy and game_state:
                     # Vérifie la capacité à l'intérieur (max 3 clients par resto)
-                    inside_clients = [
-                        c for c in game_state.clients
-                        if c.target_zone == self.target_zone
-                        and c.zone == self.target_zone
-                    ]
-                    if len(inside_clients) < 3:
+                    if game_state.client_index.count_inside(self.target_zone) < 3:
                         # Il peut rentrer
                         self.zone = target_zone
-                        self.rect.centerx = target_x * TILE_SIZE + TILE_SIZE // 2
-                        self.rect.centery = target_y * TILE_SIZE + TILE_SIZE // 2
+                        self.rect.center = zone.door_arrivals[door_to_restaurant]
                         self.state = "walking_to_queue"
                     else:
                         # Il attend devant la porte
@@ -295,63 +316,32 @@ class Client(pygame.sprite.Sprite):
                 return
 
             # Retrouve la porte vers son restaurant cible
-            door_to_restaurant = None
-            for door in zone.doors:
-                dx, dy, target_zone, target_x, target_y = door
-                if target_zone == self.target_zone:
-                    door_to_restaurant = door
-                    break
-
+            door_to_restaurant = zone.get_door_to(self.target_zone)
             if not door_to_restaurant:
                 return
 
-            dx, dy, target_zone, target_x, target_y = door_to_restaurant
-            door_cx = dx * TILE_SIZE + TILE_SIZE // 2
-            door_cy = dy * TILE_SIZE + TILE_SIZE // 2
+            target_zone = door_to_restaurant[2]
+            door_cx, door_cy = zone.door_centers[door_to_restaurant]
 
             # Position cible dans la file extérieure (si définie)
             if self.outside_tile_x is not None and self.outside_tile_y is not None:
-                target_px = self.outside_tile_x * TILE_SIZE + TILE_SIZE // 2
-                target_py = self.outside_tile_y * TILE_SIZE + TILE_SIZE // 2
+                self._walk_to_tile(world_map, (self.outside_tile_x, self.outside_tile_y))
             else:
-                target_px = door_cx
-                target_py = door_cy + TILE_SIZE // 2
-
-            self._move_towards(target_px, target_py)
+                self._move_towards(door_cx, door_cy + TILE_SIZE // 2)
 
             # Vérifie si de la place s'est libérée
             if game_state:
-                inside_clients = [
-                    c for c in game_state.clients
-                    if c.target_zone == self.target_zone
-                    and c.zone == self.target_zone
-                ]
-                if len(inside_clients) >= 3:
+                if game_state.client_index.count_inside(self.target_zone) >= 3:
                     return
 
-                outside_queue = [
-                    c for c in game_state.clients
-                    if c is not self
-                    and c.target_zone == self.target_zone
-                    and c.zone == "street"
-                    and c.state in ("walking_to_restaurant", "waiting_outside")
-                ]
-
-                def dist_to_door(client):
-                    cx = client.rect.centerx
-                    cy = client.rect.centery
-                    return ((cx - door_cx) ** 2 + (cy - door_cy) ** 2) ** 0.5
-
-                if outside_queue:
-                    closest = min(outside_queue, key=dist_to_door)
-                    # Si quelqu'un est plus proche de la porte, on attend
-                    if dist_to_door(closest) < dist_to_door(self):
-                        return
+                # Si quelqu'un est devant dans la file, on attend
+                queue = game_state.queues.get(self.target_zone)
+                if queue and not queue.is_next_to_enter(self):
+                    return
 
                 # C'est à lui de rentrer
                 self.zone = target_zone
-                self.rect.centerx = target_x * TILE_SIZE + TILE_SIZE // 2
-                self.rect.centery = target_y * TILE_SIZE + TILE_SIZE // 2
+                self.rect.center = zone.door_arrivals[door_to_restaurant]
                 self.state = "walking_to_queue"
 
         # 4) Client qui marche vers sa position dans la file
@@ -361,7 +351,7 @@ class Client(pygame.sprite.Sprite):
 
             target_px = self.queue_tile_x * TILE_SIZE + TILE_SIZE // 2
             target_py = self.queue_tile_y * TILE_SIZE + TILE_SIZE // 2
-            self._move_towards(target_px, target_py)
+            self._walk_to_tile(world_map, (self.queue_tile_x, self.queue_tile_y))
 
             dist = ((self.rect.centerx - target_px) ** 2 + (self.rect.centery - target_py) ** 2) ** 0.5
             if dist < 4:
@@ -369,7 +359,7 @@ class Client(pygame.sprite.Sprite):
                 self.rect.centery = target_py
                 self.state = "waiting"
                 if self.spawn_time is None:
-                    self.spawn_time = time.time()
+                    self.spawn_time = self.clock.now()
 
         # Clamp en rue pour ne jamais sortir de la map (surtout en bas)
         if self.zone == "street" and world_map:
@@ -377,12 +367,36 @@ class Client(pygame.sprite.Sprite):
             if zone:
                 self._clamp_to_street_zone(zone)
 
-        # 5) Gestion de la patience uniquement lorsqu'il est en file
-        if self.state == "waiting" and self.spawn_time is not None:
-            if time.time() - self.spawn_time > self.patience:
+        # 5) Gestion de la patience uniquement lorsqu'il est en file (la foule s'en charge en jeu)
+        if self._crowd is None and self.state == "waiting" and self.spawn_time is not None:
+            if self.clock.now() - self.spawn_time > self.patience:
                 self.state = "angry"
                 play_sound('client_angry', 'client')
             
+    def join_restaurant(self, game_state, available_restaurants):
+        """Le passant rejoint la file extérieure d'un des restaurants qui ont de la place"""
+        if len(available_restaurants) == 1:
+            chosen_restaurant = available_restaurants[0]
+        else:
+            # Les deux sont disponibles, choisir selon la réputation du propriétaire
+            tacos_owner = game_state._get_restaurant_owner("tacos")
+            kebab_owner = game_state._get_restaurant_owner("kebab")
+            tacos_rep = tacos_owner.reputation if tacos_owner else 50
+            kebab_rep = kebab_owner.reputation if kebab_owner else 50
+            total_rep = tacos_rep + kebab_rep
+            if total_rep <= 0:
+                chosen_restaurant = random.choice(available_restaurants)
+            else:
+                tacos_probability = tacos_rep / total_rep
+                chosen_restaurant = "tacos" if random.random() < tacos_probability else "kebab"
+
+        # Ce client rejoint la file de ce restaurant
+        self.target_zone = chosen_restaurant
+        self.is_wanderer = False
+        self.state = "walking_to_restaurant"
+        # Nouveau plat dédié à ce client (toujours une instance fraîche)
+        self.dish = create_dish_for_restaurant(chosen_restaurant)
+
     def take_damage(self, damage, weapon_type='knife'):
         """Le client reçoit des dégâts (attaque avec arme)"""
         if self.state in ['dying', 'dead', 'gone']:
@@ -392,7 +406,8 @@ class Client(pygame.sprite.Sprite):
         self.state = "dying"
         self.death_animation = DeathAnimation(
             (self.rect.x, self.rect.y),
-            death_type='stab'
+            death_type='stab',
+            clock=self.clock
         )
         play_sound('client_death', 'client')
         return True
@@ -422,7 +437,8 @@ class Client(pygame.sprite.Sprite):
         self.state = "fleeing"
         self.flee_animation = FleeAnimation(
             (self.rect.x, self.rect.y),
-            direction
+            direction,
+            clock=self.clock
         )
         play_sound('client_flee', 'client')
         
@@ -435,8 +451,8 @@ class Client(pygame.sprite.Sprite):
         return self.state in ['waiting', 'angry', 'walking_to_queue']
                 
     def draw(self, surface, camera):
-        draw_x = self.rect.x - camera.x + self.shake_offset[0]
-        draw_y = self.rect.y - camera.y + self.shake_offset[1]
+        px = camera.pixels
+        draw_x, draw_y = camera.to_view(self.rect.x + self.shake_offset[0], self.rect.y + self.shake_offset[1])
         
         # Animation de mort
         if self.state == "dying" and self.death_animation:
@@ -451,29 +467,27 @@ class Client(pygame.sprite.Sprite):
         if self.state == "fleeing":
             # Sprite qui court avec effet de mouvement
             if self.flee_animation:
-                wobble = math.sin(time.time() * 20) * 3
-                draw_y += wobble
+                wobble = math.sin(self.clock.now() * 20) * 3
+                draw_y += wobble * camera.scale
         
-        surface.blit(self.image, (draw_x, draw_y))
+        surface.blit(Assets.get().sprite_for(self.image), (draw_x, draw_y))
         
         # Order bubble - uniquement pour le premier client de la file
         if self.state in ['waiting', 'walking_to_queue', 'angry'] and self.is_first_in_queue:
-            font = pygame.font.SysFont(None, 24)
-            order_text = font.render(self.dish.name, True, BLACK)
-            bubble_rect = pygame.Rect(draw_x - 10, draw_y - 35, order_text.get_width() + 16, 28)
-            pygame.draw.rect(surface, WHITE, bubble_rect, border_radius=8)
-            pygame.draw.rect(surface, BLACK, bubble_rect, 2, border_radius=8)
-            surface.blit(order_text, (draw_x - 2, draw_y - 32))
+            order_text = render_text(self.dish.name, px(24), BLACK)
+            bubble_rect = pygame.Rect(draw_x - px(10), draw_y - px(35), order_text.get_width() + px(16), px(28))
+            pygame.draw.rect(surface, WHITE, bubble_rect, border_radius=px(8))
+            pygame.draw.rect(surface, BLACK, bubble_rect, px(2), border_radius=px(8))
+            surface.blit(order_text, (draw_x - px(2), draw_y - px(32)))
         
         # Angry indicator
         if self.state == "angry":
-            pygame.draw.circle(surface, (255, 0, 0), (draw_x + self.rect.width + 5, draw_y), 12)
-            angry_font = pygame.font.SysFont(None, 20)
-            angry_text = angry_font.render("!", True, WHITE)
-            surface.blit(angry_text, (draw_x + self.rect.width + 1, draw_y - 8))
+            right = draw_x + px(self.rect.width)
+            pygame.draw.circle(surface, (255, 0, 0), (right + px(5), draw_y), px(12))
+            angry_text = render_text("!", px(20), WHITE)
+            surface.blit(angry_text, (right + px(1), draw_y - px(8)))
             
         # Indicateur de peur
         if self.fear_level > 1:
-            fear_font = pygame.font.SysFont(None, 18)
-            fear_text = fear_font.render("😰", True, WHITE)
-            surface.blit(fear_text, (draw_x + self.rect.width - 5, draw_y - 15))
\ No newline at end of file
+            fear_text = render_text("😰", px(18), WHITE)
+            surface.blit(fear_text, (draw_x + px(self.rect.width - 5), draw_y - px(15)))
\ No newline at end of file
@@ -0,0 +1,110 @@
+"""
+Index des clients d'une partie
+Regroupe les clients par (zone, target_zone, state) et tient à jour les compteurs
+"dans le restaurant X" / "devant le restaurant X" sans parcourir toute la liste.
+"""
+import bisect
+
+
+class ClientIndex:
+    """Index maintenu par les setters de Client (zone, target_zone, state).
+
+    Les groupes sont des dicts utilisés comme ensembles, sauf by_zone (interrogé à chaque frame) :
+    des listes tenues dans l'ordre d'arrivée. Les requêtes rendent les clients dans leur ordre
+    d'arrivée dans la partie (même ordre que GameState.clients : résultats déterministes).
+    """
+
+    def __init__(self):
+        self.buckets = {}   # (zone, target_zone, state) -> {client: None}
+        self.by_zone = {}   # zone -> [clients par ordre d'arrivée]
+        self.by_place = {}  # (zone, target_zone) -> {client: None}
+        self._next_seq = 0
+        # Appelé à chaque ajout/retrait/déplacement : on_change(client, ancienne_clé, nouvelle_clé)
+        # (None pour l'ancienne clé à l'ajout, pour la nouvelle au retrait). Sert aux files d'attente.
+        self.on_change = None
+
+    def __contains__(self, client):
+        return client is not None and client._index is self
+
+    @staticmethod
+    def key_of(client):
+        return (client.zone, client.target_zone, client.state)
+
+    def _insert(self, client, key):
+        zone, target_zone, _ = key
+        self.buckets.setdefault(key, {})[client] = None
+        bisect.insort(self.by_zone.setdefault(zone, []), client, key=_arrival)
+        self.by_place.setdefault((zone, target_zone), {})[client] = None
+
+    def _discard(self, client, key):
+        zone, target_zone, _ = key
+        self.buckets[key].pop(client, None)
+        clients = self.by_zone[zone]
+        i = bisect.bisect_left(clients, client._index_seq, key=_arrival)
+        if i < len(clients) and clients[i] is client:
+            del clients[i]
+        self.by_place[(zone, target_zone)].pop(client, None)
+
+    def add(self, client):
+        client._index_seq = self._next_seq
+        self._next_seq += 1
+        key = self.key_of(client)
+        self._insert(client, key)
+        client._index = self
+        if self.on_change:
+            self.on_change(client, None, key)
+
+    def remove(self, client):
+        key = self.key_of(client)
+        self._discard(client, key)
+        client._index = None
+        if self.on_change:
+            self.on_change(client, key, None)
+
+    def moved(self, client, old_key):
+        """Appelé par Client quand zone, target_zone ou state change"""
+        new_key = self.key_of(client)
+        if new_key != old_key:
+            self._discard(client, old_key)
+            self._insert(client, new_key)
+            if self.on_change:
+                self.on_change(client, old_key, new_key)
+
+    # === Compteurs O(1) ===
+
+    def count_zone(self, zone):
+        return len(self.by_zone.get(zone, ()))
+
+    def count_inside(self, restaurant):
+        """Clients de ce restaurant déjà entrés"""
+        return len(self.by_place.get((restaurant, restaurant), ()))
+
+    def count_outside(self, restaurant):
+        """Clients dans la rue qui visent ce restaurant"""
+        return len(self.by_place.get(("street", restaurant), ()))
+
+    # === Requêtes (copies : l'appelant peut changer l'état des clients en itérant) ===
+
+    @staticmethod
+    def _ordered(clients):
+        return sorted(clients, key=_arrival)
+
+    def in_zone(self, zone):
+        return list(self.by_zone.get(zone, ()))
+
+    def query(self, zone=None, target_zone=None, states=None):
+        """Clients filtrés par zone, zone cible et/ou états (None = peu importe)"""
+        result = []
+        for (z, t, s), clients in self.buckets.items():
+            if zone is not None and z != zone:
+                continue
+            if target_zone is not None and t != target_zone:
+                continue
+            if states is not None and s not in states:
+                continue
+            result.extend(clients)
+        return self._ordered(result)
+
+
+def _arrival(client):
+    return client._index_seq
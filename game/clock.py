@@ -0,0 +1,81 @@
+"""
+Horloge de simulation pour SnackAnarchy
+Temps de jeu à pas fixe (fixed timestep), injectable dans tous les sous-systèmes
+"""
+import time
+from config import FPS
+
+
+class SimulationClock:
+    """
+    Horloge de simulation à pas fixe.
+
+    Le temps de jeu n'avance que par ticks de `dt` secondes. `advance(real_dt)`
+    accumule le temps réel écoulé et retourne le nombre de ticks à simuler
+    (rattrapage borné par `max_catch_up_ticks` pour éviter la spirale de la mort).
+    `time_scale` permet de simuler plus vite (ou plus lentement) que le temps réel.
+    """
+
+    def __init__(self, tick_rate=FPS, max_catch_up_ticks=5, time_scale=1.0):
+        self.tick_rate = tick_rate
+        self.dt = 1.0 / tick_rate
+        self.max_catch_up_ticks = max_catch_up_ticks
+        self.time_scale = time_scale
+        self.tick_count = 0
+        self.accumulator = 0.0
+        self.paused = False
+        # Temps réel abandonné quand le rattrapage est plafonné (frames trop lentes)
+        self.dropped_time = 0.0
+
+    def now(self):
+        """Temps de simulation courant (secondes depuis le début de la partie)"""
+        return self.tick_count * self.dt
+
+    def advance(self, real_dt):
+        """Accumule du temps réel et retourne le nombre de ticks à exécuter"""
+        if self.paused:
+            return 0
+
+        self.accumulator += max(0.0, real_dt) * self.time_scale
+        # Epsilon : une frame d'exactement `dt` doit donner un tick malgré les arrondis
+        ticks = int(self.accumulator / self.dt + 1e-6)
+
+        if ticks > self.max_catch_up_ticks:
+            self.dropped_time += (ticks - self.max_catch_up_ticks) * self.dt
+            ticks = self.max_catch_up_ticks
+            self.accumulator = 0.0
+        else:
+            self.accumulator = max(0.0, self.accumulator - ticks * self.dt)
+
+        return ticks
+
+    def tick(self):
+        """Avance la simulation d'un pas fixe"""
+        self.tick_count += 1
+
+    def get_alpha(self):
+        """Fraction du pas suivant déjà écoulée (interpolation du rendu)"""
+        return self.accumulator / self.dt
+
+    def pause(self):
+        self.paused = True
+
+    def resume(self):
+        if self.paused:
+            # Le temps passé en pause ne doit pas être rattrapé
+            self.accumulator = 0.0
+            self.paused = False
+
+
+class WallClock:
+    """Horloge murale (time.time) pour les objets créés hors d'une partie"""
+
+    def __init__(self, tick_rate=FPS):
+        self.dt = 1.0 / tick_rate
+
+    def now(self):
+        return time.time()
+
+
+# Horloge par défaut quand aucune horloge de simulation n'est injectée
+wall_clock = WallClock()
@@ -0,0 +1,213 @@
+"""
+Moteur de foule : les données des clients rangées en tableaux NumPy (une colonne par attribut)
+Les passants de la rue avancent, changent de direction et les files perdent patience
+en quelques opérations vectorisées par pas, quel que soit le nombre de clients.
+Les objets Client restent la vue utilisée pour le rendu et les interactions.
+"""
+import math
+import numpy as np
+from config import *
+from game.audio import play_sound
+
+# Directions d'un passant (dx, dy) ; (0, 0) = il s'arrête un moment
+WANDER_DIRECTIONS = np.array([(1, 0), (-1, 0), (0, 1), (0, -1), (0, 0)], dtype=np.int32)
+WANDER_CHANGE_DELAY = 1.0  # secondes entre deux changements de direction
+
+# Zone où se baladent les passants, et première ligne walkable (trottoir)
+WANDER_ZONE = "street"
+STREET_MIN_ROW = 3
+
+
+class Crowd:
+    """Clients d'une partie en structure de tableaux.
+
+    Chaque client occupe une case (slot) des tableaux. Tant qu'il se balade (état "wandering"),
+    sa position vit dans left/top et son rect est resynchronisé à la lecture (Client.rect) ;
+    dans les autres états c'est le rect du Client qui fait foi.
+    """
+
+    def __init__(self, world_map, clock, seed=None, capacity=64):
+        self.world_map = world_map
+        self.clock = clock
+        self.rng = np.random.default_rng(seed)
+        # Incrémenté à chaque déplacement : les rects en retard se resynchronisent
+        self.version = 0
+        self.clients = []
+        self.free_slots = []
+        self.size = 0
+        # Compteurs tenus en Python : pas d'appel NumPy quand il n'y a rien à faire
+        self.wanderer_count = 0
+        self.next_deadline = math.inf  # borne basse des fins de patience
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        """(Ré)alloue les colonnes en conservant les données existantes"""
+        def grow(name, dtype, fill):
+            column = np.full(capacity, fill, dtype=dtype)
+            old = getattr(self, name, None)
+            if old is not None:
+                column[:len(old)] = old
+            setattr(self, name, column)
+
+        grow('left', np.int32, 0)
+        grow('top', np.int32, 0)
+        grow('width', np.int32, 0)
+        grow('height', np.int32, 0)
+        grow('speed', np.int32, 0)
+        grow('dir_x', np.int32, 0)             # vitesse = dir * speed
+        grow('dir_y', np.int32, 0)
+        grow('wander_change', np.float64, 0.0)  # dernier changement de direction
+        grow('spawn_time', np.float64, math.nan)  # début de l'attente en file (nan = pas encore)
+        grow('patience', np.float64, math.inf)
+        grow('deadline', np.float64, math.inf)  # fin de patience (inf hors de la file)
+        grow('arrival', np.int64, 0)            # ordre d'arrivée (traitements déterministes)
+        grow('wandering', np.bool_, False)
+        grow('waiting', np.bool_, False)
+        self.clients.extend([None] * (capacity - len(self.clients)))
+        self.capacity = capacity
+
+    # === Appartenance ===
+
+    def add(self, client):
+        if self.free_slots:
+            slot = self.free_slots.pop()
+        else:
+            if self.size == self.capacity:
+                self._allocate(self.capacity * 2)
+            slot = self.size
+            self.size += 1
+        self.clients[slot] = client
+        client._crowd = self
+        client._slot = slot
+
+        self.width[slot] = client.rect.width
+        self.height[slot] = client.rect.height
+        self.speed[slot] = client.speed
+        self.dir_x[slot] = client.wander_dir_x
+        self.dir_y[slot] = client.wander_dir_y
+        self.wander_change[slot] = client.wander_change_time
+        self.spawn_time[slot] = math.nan if client.spawn_time is None else client.spawn_time
+        self.patience[slot] = client.patience
+        self.arrival[slot] = client._index_seq
+        self.waiting[slot] = False
+        self.wandering[slot] = False
+        self.on_state(client, None, client.state)
+
+    def remove(self, client):
+        slot = client._slot
+        self.on_state(client, client.state, None)
+        self.clients[slot] = None
+        self.free_slots.append(slot)
+        client._crowd = None
+        client._slot = None
+
+    def on_state(self, client, old_state, new_state):
+        """Appelé par Client à chaque changement d'état"""
+        slot = client._slot
+        if old_state == "wandering" and new_state != "wandering":
+            # La position repasse au rect du client
+            self.sync_rect(client)
+            client._position_owner = None
+            client.wander_dir_x = int(self.dir_x[slot])
+            client.wander_dir_y = int(self.dir_y[slot])
+            client.wander_change_time = float(self.wander_change[slot])
+            self.wandering[slot] = False
+            self.wanderer_count -= 1
+        elif new_state == "wandering" and old_state != "wandering":
+            self.left[slot], self.top[slot] = client._rect.topleft
+            client._position_owner = self
+            client._rect_version = self.version
+            self.wandering[slot] = True
+            self.wanderer_count += 1
+        self.waiting[slot] = (new_state == "waiting")
+        self._update_deadline(slot)
+
+    def sync_rect(self, client):
+        """Recopie la position des tableaux dans le rect du client"""
+        slot = client._slot
+        client._rect.topleft = (int(self.left[slot]), int(self.top[slot]))
+        client._rect_version = self.version
+
+    def set_spawn_time(self, client, value):
+        self.spawn_time[client._slot] = math.nan if value is None else value
+        self._update_deadline(client._slot)
+
+    def set_patience(self, client, value):
+        self.patience[client._slot] = value
+        self._update_deadline(client._slot)
+
+    def _update_deadline(self, slot):
+        spawn_time = self.spawn_time[slot]
+        if self.waiting[slot] and not math.isnan(spawn_time):
+            deadline = spawn_time + self.patience[slot]
+            self.deadline[slot] = deadline
+            self.next_deadline = min(self.next_deadline, deadline)
+        else:
+            self.deadline[slot] = math.inf
+
+    # === Pas de simulation ===
+
+    def update(self, game_state=None):
+        now = self.clock.now()
+        if self.wanderer_count:
+            wanderers = np.flatnonzero(self.wandering[:self.size])
+            self._wander(wanderers, now)
+            if game_state:
+                self._join_queues(wanderers, game_state)
+        if now > self.next_deadline:
+            self._check_patience(now)
+
+    def _wander(self, idx, now):
+        zone = self.world_map.get_zone(WANDER_ZONE)
+        if not zone:
+            return
+        zone.ensure_baked()
+
+        # Changement de direction de temps en temps
+        change = idx[now - self.wander_change[idx] > WANDER_CHANGE_DELAY]
+        if len(change):
+            self.wander_change[change] = now
+            directions = WANDER_DIRECTIONS[self.rng.integers(0, len(WANDER_DIRECTIONS), len(change))]
+            self.dir_x[change] = directions[:, 0]
+            self.dir_y[change] = directions[:, 1]
+
+        # Pas en avant, seulement si la tuile d'arrivée (centre du sprite) est walkable
+        step_x = self.dir_x[idx] * self.speed[idx]
+        step_y = self.dir_y[idx] * self.speed[idx]
+        left = self.left[idx]
+        top = self.top[idx]
+        width = self.width[idx]
+        height = self.height[idx]
+        tile_x = (left + width // 2 + step_x) // TILE_SIZE
+        tile_y = (top + height // 2 + step_y) // TILE_SIZE
+        inside = (tile_x >= 0) & (tile_x < zone.width) & (tile_y >= 0) & (tile_y < zone.height)
+        walkable = np.zeros(len(idx), dtype=bool)
+        walkable[inside] = zone.walkable_grid[tile_y[inside], tile_x[inside]]
+        left = np.where(walkable, left + step_x, left)
+        top = np.where(walkable, top + step_y, top)
+
+        # Jamais hors de la rue (surtout en bas)
+        left = np.minimum(np.maximum(left, 0), zone.width * TILE_SIZE - width)
+        top = np.minimum(np.maximum(top, STREET_MIN_ROW * TILE_SIZE), zone.height * TILE_SIZE - height)
+        self.left[idx] = left
+        self.top[idx] = top
+        self.version += 1
+
+    def _join_queues(self, idx, game_state):
+        """Les premiers passants arrivés rejoignent les files extérieures qui ont de la place"""
+        index = game_state.client_index
+        if all(index.count_outside(r) >= 3 for r in ("tacos", "kebab")):
+            return
+        for slot in idx[np.argsort(self.arrival[idx], kind="stable")]:
+            available = [r for r in ("tacos", "kebab") if index.count_outside(r) < 3]
+            if not available:
+                return
+            self.clients[slot].join_restaurant(game_state, available)
+
+    def _check_patience(self, now):
+        deadlines = self.deadline[:self.size]
+        expired = np.flatnonzero(deadlines < now)
+        for slot in expired[np.argsort(self.arrival[expired], kind="stable")]:
+            self.clients[slot].state = "angry"
+            play_sound('client_angry', 'client')
+        self.next_deadline = float(deadlines.min()) if len(deadlines) else math.inf
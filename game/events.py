@@ -1,17 +1,18 @@
 import random
-import time
+from game.clock import wall_clock
 
 class Event:
-    def __init__(self, name, description, duration, effect_func):
+    def __init__(self, name, description, duration, effect_func, clock=None):
+        self.clock = clock or wall_clock
         self.name = name
         self.description = description
-        self.start_time = time.time()
+        self.start_time = self.clock.now()
         self.duration = duration
         self.effect_func = effect_func
         self.active = True
         
     def update(self):
-        if time.time() - self.start_time > self.duration:
+        if self.clock.now() - self.start_time > self.duration:
             self.active = False
 
 def police_raid(game_state):
@@ -28,16 +29,17 @@ def health_inspection(game_state):
 class EventManager:
     def __init__(self, game_state):
         self.game_state = game_state
+        self.clock = game_state.clock
         self.active_events = []
-        self.last_event_time = time.time()
+        self.last_event_time = self.clock.now()
         self.event_interval = 60 # Every minute
         
     def update(self):
         # Random spawn
-        if time.time() - self.last_event_time > self.event_interval:
+        if self.clock.now() - self.last_event_time > self.event_interval:
             if random.random() < 0.3: # 30% chance
                 self.trigger_random_event()
-            self.last_event_time = time.time()
+            self.last_event_time = self.clock.now()
             
         # Update active events
         for event in self.active_events:
@@ -46,6 +48,6 @@ class EventManager:
         
     def trigger_random_event(self):
         # For prototype just simple print or effect
-        event = Event("Inspection", "Inspection sanitaire !", 5, health_inspection)
+        event = Event("Inspection", "Inspection sanitaire !", 5, health_inspection, clock=self.clock)
         event.effect_func(self.game_state) # Immediate effect for this type
         self.active_events.append(event)
@@ -0,0 +1,82 @@
+"""
+Polices et textes rendus, partagés par tout le jeu
+Une police n'est créée qu'une fois par (nom, taille, gras) et les textes fréquents
+(plats, "[E]", "!", "+20€ +2%"...) sont gardés en cache : les dessiner devient un simple blit.
+"""
+import pygame
+from collections import OrderedDict
+
+
+class FontCache:
+    _instance = None
+
+    @classmethod
+    def get(cls):
+        if cls._instance is None:
+            cls._instance = FontCache()
+        return cls._instance
+
+    def __init__(self, max_texts=512):
+        # (nom, taille, gras) -> pygame.font.Font ; None = police par défaut de pygame
+        self.fonts = {}
+        # (texte, nom, taille, gras, couleur, antialias) -> Surface, du moins au plus récemment utilisé
+        self.texts = OrderedDict()
+        self.max_texts = max_texts
+
+        # Compteurs pour dimensionner le cache
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def font(self, size, name=None, bold=False):
+        """Police partagée (pygame.font.SysFont n'est appelé qu'au premier usage)"""
+        key = (name, size, bold)
+        font = self.fonts.get(key)
+        if font is None:
+            font = pygame.font.SysFont(name, size, bold=bold)
+            self.fonts[key] = font
+        return font
+
+    def render(self, text, size, color, name=None, bold=False, antialias=True):
+        """Surface du texte, rendue une seule fois tant qu'elle reste dans le cache.
+        La surface est partagée : la copier avant de la modifier (set_alpha, fill...)."""
+        key = (text, name, size, bold, tuple(color), antialias)
+        surface = self.texts.get(key)
+        if surface is not None:
+            self.texts.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = self.font(size, name, bold).render(text, antialias, color)
+        self.texts[key] = surface
+        if len(self.texts) > self.max_texts:
+            self.texts.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def clear(self):
+        self.texts.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'fonts': len(self.fonts),
+            'texts': len(self.texts),
+            'max_texts': self.max_texts,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+
+# Fonctions utilitaires
+def get_font(size, name=None, bold=False):
+    """Raccourci vers une police partagée"""
+    return FontCache.get().font(size, name, bold)
+
+
+def render_text(text, size, color, name=None, bold=False):
+    """Raccourci vers un texte rendu en cache (ne pas modifier la surface renvoyée)"""
+    return FontCache.get().render(text, size, color, name, bold)
@@ -0,0 +1,224 @@
+"""
+Simulation sans fenêtre pour SnackAnarchy
+Parties complètes sans affichage, sans mixer et sans rendu (équilibrage, tests de non-régression)
+"""
+import random
+import pygame
+from config import *
+from game.assets_loader import Assets
+from game.audio import AudioManager
+from game.history import GameHistory
+from game.map import WorldMap
+from game.state import GameState
+
+# Carte partagée par toutes les parties du processus (elle ne change pas pendant une partie)
+_world_map = None
+
+
+def setup_headless():
+    """Prépare le processus : audio muet, collisions et masques chargés sans fenêtre"""
+    global _world_map
+    if _world_map is not None:
+        return _world_map
+    AudioManager.init_headless()
+    Assets.get().load_images(headless=True)
+    _world_map = WorldMap()
+    return _world_map
+
+
+def key_event(key):
+    """Appui de touche synthétique (mini-jeux)"""
+    return pygame.event.Event(pygame.KEYDOWN, key=key)
+
+
+class IdlePolicy:
+    """Joueur inactif (référence)"""
+
+    def __init__(self, rng):
+        self.rng = rng
+
+    def act(self, game_state, player_idx):
+        """Retourne (action, événements clavier) pour ce tick"""
+        return None, []
+
+
+class RandomPolicy:
+    """Joueur aléatoire : se balade, appuie sur des touches et tente des sabotages au hasard"""
+
+    def __init__(self, rng):
+        self.rng = rng
+        self.direction = (0, 0)
+        self.next_direction_change = 0.0
+
+    def act(self, game_state, player_idx):
+        player = game_state.players[player_idx]
+        now = game_state.clock.now()
+
+        if now >= self.next_direction_change:
+            self.direction = (self.rng.choice((-1, 0, 1)), self.rng.choice((-1, 0, 1)))
+            self.next_direction_change = now + self.rng.uniform(0.3, 1.5)
+        player.move(*self.direction)
+
+        if player.active_minigame:
+            # Tape une touche de sa séquence au hasard (réussit parfois)
+            if self.rng.random() < 0.2:
+                return None, [key_event(self.rng.choice(player.active_minigame.required_keys))]
+            return None, []
+
+        roll = self.rng.random()
+        if roll < 0.02:
+            return (player_idx, "interact"), []
+        if roll < 0.03 and player.inventory.has_weapon():
+            return (player_idx, "attack"), []
+        if roll < 0.035:
+            return (player_idx, "sweep"), []
+        if roll < 0.037:
+            sabotages = [s for s in game_state.get_available_sabotages(player_idx) if s['cooldown'] <= 0]
+            if sabotages:
+                game_state.handle_sabotage(player_idx, self.rng.choice(sabotages)['name'])
+        elif roll < 0.04 and player.get_low_stock_warning():
+            player.restock()
+        return None, []
+
+
+class ServePolicy:
+    """Joueur scripté : reste dans son restaurant, sert la file, réapprovisionne et balaie"""
+
+    # Ticks entre deux touches du mini-jeu (~0.1 s : réflexes humains)
+    KEY_INTERVAL_TICKS = 6
+
+    def __init__(self, rng):
+        self.rng = rng
+        self.ticks_until_key = 0
+
+    def act(self, game_state, player_idx):
+        player = game_state.players[player_idx]
+
+        if player.active_minigame:
+            player.move(0, 0)
+            self.ticks_until_key -= 1
+            if self.ticks_until_key > 0:
+                return None, []
+            self.ticks_until_key = self.KEY_INTERVAL_TICKS
+            minigame = player.active_minigame
+            return None, [key_event(minigame.required_keys[minigame.current_step])]
+
+        if player.serve_animation and not player.serve_animation.completed:
+            return None, []
+
+        if player.get_low_stock_warning():
+            player.restock()
+
+        if player.current_zone != player.owns_restaurant:
+            player.move(0, 0)
+            return None, []
+
+        if player.can_sweep():
+            return (player_idx, "sweep"), []
+
+        client = self._pick_client(game_state, player)
+        if client is None:
+            player.move(0, 0)
+            return None, []
+
+        if player.get_distance_to(client) < TILE_SIZE * 1.5:
+            player.move(0, 0)
+            return (player_idx, "interact"), []
+
+        dx = client.rect.centerx - player.rect.centerx
+        dy = client.rect.centery - player.rect.centery
+        player.move(self._sign(dx), self._sign(dy))
+        return None, []
+
+    def _pick_client(self, game_state, player):
+        """Client le plus proche de son restaurant qui peut être servi"""
+        others = [p.current_client for p in game_state.players if p is not player]
+        candidates = [
+            c for c in game_state.client_index.in_zone(player.owns_restaurant)
+            if c.is_targetable() and c not in others
+        ]
+        if not candidates:
+            return None
+        return min(candidates, key=player.get_distance_to)
+
+    @staticmethod
+    def _sign(value, dead_zone=PLAYER_SPEED):
+        if value > dead_zone:
+            return 1
+        if value < -dead_zone:
+            return -1
+        return 0
+
+
+POLICIES = {
+    "idle": IdlePolicy,
+    "random": RandomPolicy,
+    "serve": ServePolicy,
+}
+
+
+def apply_settings(game_state, settings):
+    """Applique des réglages d'équilibrage à une partie qui vient d'être créée.
+    Clés reconnues : 'spawn_interval', 'patience', 'sabotage_costs' ({nom: coût})."""
+    if 'spawn_interval' in settings:
+        game_state.spawn_interval = settings['spawn_interval']
+    if 'patience' in settings:
+        game_state.client_patience = settings['patience']
+        # Les premiers clients sont créés par le constructeur
+        for client in game_state.clients:
+            client.patience = settings['patience']
+    for name, cost in settings.get('sabotage_costs', {}).items():
+        game_state.sabotage_manager.sabotages[name].cost = cost
+
+
+def run_match(seed, duration=DEFAULT_DURATION, policies=("serve", "serve"), player_configs=None, settings=None):
+    """Joue une partie complète sans fenêtre, le plus vite possible.
+    Retourne (game_state, ticks simulés). Déterministe pour une graine donnée."""
+    world_map = setup_headless()
+
+    random.seed(seed)
+    game_state = GameState(player_configs, world_map=world_map, record_history=False)
+    game_state.game_duration = duration
+    if settings:
+        apply_settings(game_state, settings)
+
+    # RNG propre à chaque joueur : les décisions ne décalent pas l'aléatoire du jeu
+    agents = [POLICIES[name](random.Random(seed * 2 + i)) for i, name in enumerate(policies)]
+
+    ticks = 0
+    while not game_state.game_over:
+        actions = []
+        events = []
+        for player_idx, agent in enumerate(agents):
+            action, keys = agent.act(game_state, player_idx)
+            if action:
+                actions.append(action)
+            events.extend(keys)
+        game_state.update(events, actions)
+        ticks += 1
+
+    return game_state, ticks
+
+
+def build_match_record(game_state, seed, policies):
+    """Entrée d'historique (format GameHistory) complétée des paramètres de simulation"""
+    record = GameHistory.build_record(game_state)
+    record['seed'] = seed
+    record['policies'] = list(policies)
+    record['ticks'] = game_state.clock.tick_count
+    return record
+
+
+def match_result(game_state):
+    """Résultats à plat d'une partie terminée (une ligne du fichier de résultats)"""
+    result = {
+        'winner': game_state.get_winner(),
+        'ticks': game_state.clock.tick_count,
+    }
+    history = game_state.sabotage_manager.sabotage_history
+    for i, player in enumerate(game_state.players, start=1):
+        result[f'p{i}_money'] = player.money
+        result[f'p{i}_reputation'] = player.reputation
+        result[f'p{i}_clients_served'] = player.clients_served
+        result[f'p{i}_sabotages'] = sum(1 for entry in history if entry['executor'] == player.id)
+    return result
@@ -71,6 +71,17 @@ class GameHistory:
         if not game_state or not game_state.game_over:
             return
         
+        game_record = self.build_record(game_state)
+        for player_data in game_record['players']:
+            # Mettre à jour les statistiques globales du joueur
+            self._update_player_stats(player_data)
+        
+        self.history.append(game_record)
+        self._save()
+    
+    @staticmethod
+    def build_record(game_state):
+        """Construit l'entrée d'historique d'une partie (sans rien sauvegarder)"""
         players = game_state.players
         winner_idx = game_state.get_winner()
         
@@ -97,12 +108,8 @@ class GameHistory:
                 'is_winner': (winner_idx == i + 1)
             }
             game_record['players'].append(player_data)
-            
-            # Mettre à jour les statistiques globales du joueur
-            self._update_player_stats(player_data)
         
-        self.history.append(game_record)
-        self._save()
+        return game_record
     
     def _update_player_stats(self, player_data):
         """Met à jour les statistiques globales d'un joueur"""
@@ -3,14 +3,17 @@ Système d'inventaire et de stock de nourriture pour SnackAnarchy
 Gère les ingrédients disponibles et les armes ramassables
 """
 import pygame
-import time
 import random
 from config import *
+from game.clock import wall_clock
+from game.fonts import render_text
+from game.spatial import SpatialHash
 
 class FoodStock:
     """Stock de nourriture pour un restaurant"""
     
-    def __init__(self, restaurant_type='tacos'):
+    def __init__(self, restaurant_type='tacos', clock=None):
+        self.clock = clock or wall_clock
         self.restaurant_type = restaurant_type
         
         # Stock initial
@@ -107,31 +110,32 @@ class FoodStock:
         """Vérifie si la broche est disponible"""
         if not self.has_spit:
             return False
-        if time.time() < self.spit_stolen_until:
+        if self.clock.now() < self.spit_stolen_until:
             return False
         return True
         
     def steal_spit(self, duration=30):
         """Vole la broche pour une durée donnée"""
-        self.spit_stolen_until = time.time() + duration
+        self.spit_stolen_until = self.clock.now() + duration
         return True
         
     def get_spit_cooldown(self):
         """Retourne le temps restant avant récupération de la broche"""
-        remaining = self.spit_stolen_until - time.time()
+        remaining = self.spit_stolen_until - self.clock.now()
         return max(0, remaining)
 
 
 class Weapon:
     """Arme ramassable (couteau ou fourchette)"""
     
-    def __init__(self, weapon_type, x, y, zone):
+    def __init__(self, weapon_type, x, y, zone, clock=None):
+        self.clock = clock or wall_clock
         self.weapon_type = weapon_type  # 'knife' ou 'fork'
         self.x = x
         self.y = y
         self.zone = zone
         self.picked_up = False
-        self.spawn_time = time.time()
+        self.spawn_time = self.clock.now()
         self.despawn_time = 30  # Disparaît après 30 secondes
         
         # Stats
@@ -151,7 +155,7 @@ class Weapon:
         
     def update(self):
         """Met à jour l'arme (vérifie le despawn)"""
-        if time.time() - self.spawn_time > self.despawn_time:
+        if self.clock.now() - self.spawn_time > self.despawn_time:
             return False  # Doit être supprimée
         return True
         
@@ -160,42 +164,41 @@ class Weapon:
         if self.picked_up:
             return
             
-        draw_x = self.x - camera.x
-        draw_y = self.y - camera.y
+        px = camera.pixels
+        draw_x, draw_y = camera.to_view(self.x, self.y)
         
         # Ombre
         pygame.draw.ellipse(surface, (50, 50, 50, 100), 
-                          (draw_x + 4, draw_y + 24, 24, 8))
+                          (draw_x + px(4), draw_y + px(24), px(24), px(8)))
         
         # Animation de flottement
-        bob = pygame.math.Vector2(0, 3 * pygame.math.Vector2(1, 0).rotate(time.time() * 200).y)
+        bob = pygame.math.Vector2(0, 3 * pygame.math.Vector2(1, 0).rotate(self.clock.now() * 200).y) * camera.scale
         
         if self.weapon_type == 'knife':
             # Dessiner un couteau
             # Lame
             pygame.draw.polygon(surface, self.color, [
-                (draw_x + 8 + bob.x, draw_y + 5 + bob.y),
-                (draw_x + 24 + bob.x, draw_y + 5 + bob.y),
-                (draw_x + 28 + bob.x, draw_y + 12 + bob.y),
-                (draw_x + 8 + bob.x, draw_y + 12 + bob.y),
+                (draw_x + px(8) + bob.x, draw_y + px(5) + bob.y),
+                (draw_x + px(24) + bob.x, draw_y + px(5) + bob.y),
+                (draw_x + px(28) + bob.x, draw_y + px(12) + bob.y),
+                (draw_x + px(8) + bob.x, draw_y + px(12) + bob.y),
             ])
             # Manche
             pygame.draw.rect(surface, (139, 90, 43), 
-                           (draw_x + 2 + bob.x, draw_y + 7 + bob.y, 8, 6))
+                           (draw_x + px(2) + bob.x, draw_y + px(7) + bob.y, px(8), px(6)))
         else:
             # Dessiner une fourchette
             # Manche
             pygame.draw.rect(surface, (139, 90, 43),
-                           (draw_x + 4 + bob.x, draw_y + 15 + bob.y, 6, 12))
+                           (draw_x + px(4) + bob.x, draw_y + px(15) + bob.y, px(6), px(12)))
             # Dents
             for i in range(4):
                 pygame.draw.rect(surface, self.color,
-                               (draw_x + 3 + i * 5 + bob.x, draw_y + 2 + bob.y, 3, 15))
+                               (draw_x + px(3 + i * 5) + bob.x, draw_y + px(2) + bob.y, px(3), px(15)))
                                
         # Indicateur de ramassage
-        font = pygame.font.SysFont(None, 18)
-        text = font.render("[E]", True, WHITE)
-        surface.blit(text, (draw_x + 5, draw_y - 15))
+        text = render_text("[E]", px(18), WHITE)
+        surface.blit(text, (draw_x + px(5), draw_y - px(15)))
 
 
 class PlayerInventory:
@@ -253,10 +256,13 @@ class PlayerInventory:
 class WeaponSpawner:
     """Gère le spawn des armes sur la carte"""
     
-    def __init__(self):
+    def __init__(self, clock=None):
+        self.clock = clock or wall_clock
         self.weapons = []
+        # Grille spatiale des armes par zone (ramassage sans parcourir toutes les armes)
+        self.grids = {}
         self.spawn_interval = 10  # Spawn toutes les 10 secondes
-        self.last_spawn = time.time()
+        self.last_spawn = self.clock.now()
         self.max_weapons = 4
         
         # Positions de spawn possibles par zone
@@ -271,13 +277,19 @@ class WeaponSpawner:
     def update(self):
         """Met à jour le spawner"""
         # Nettoyer les armes expirées ou ramassées
-        self.weapons = [w for w in self.weapons if w.update() and not w.picked_up]
+        kept = []
+        for weapon in self.weapons:
+            if weapon.update() and not weapon.picked_up:
+                kept.append(weapon)
+            else:
+                self.grids[weapon.zone].remove(weapon)
+        self.weapons = kept
         
         # Spawn périodique
-        if time.time() - self.last_spawn > self.spawn_interval:
+        if self.clock.now() - self.last_spawn > self.spawn_interval:
             if len(self.weapons) < self.max_weapons:
                 self.spawn_weapon()
-            self.last_spawn = time.time()
+            self.last_spawn = self.clock.now()
             
     def spawn_weapon(self, zone=None, position=None):
         """Spawn une arme aléatoire, de façon équitable entre tacos, kebab et rue."""
@@ -296,8 +308,9 @@ class WeaponSpawner:
             x, y = position
             
         weapon_type = random.choice(['knife', 'fork'])
-        weapon = Weapon(weapon_type, x, y, zone)
+        weapon = Weapon(weapon_type, x, y, zone, clock=self.clock)
         self.weapons.append(weapon)
+        self.grids.setdefault(zone, SpatialHash()).insert_rect(weapon, weapon.rect)
         return weapon
         
     def get_weapons_in_zone(self, zone):
@@ -306,17 +319,21 @@ class WeaponSpawner:
         
     def check_pickup(self, player_rect, zone):
         """Vérifie si le joueur peut ramasser une arme"""
-        for weapon in self.weapons:
-            if weapon.zone != zone or weapon.picked_up:
+        grid = self.grids.get(zone)
+        if not grid:
+            return None
+        for weapon in grid.query_rect(player_rect):
+            if weapon.picked_up:
                 continue
             if player_rect.colliderect(weapon.rect):
                 return weapon
         return None
         
-    def draw(self, surface, camera, zone):
-        """Dessine les armes d'une zone"""
+    def draw(self, surface, camera, zone, view=None):
+        """Dessine les armes d'une zone (seulement celles qui touchent `view`, si donné)"""
         for weapon in self.get_weapons_in_zone(zone):
-            weapon.draw(surface, camera)
+            if view is None or view.colliderect(weapon.rect):
+                weapon.draw(surface, camera)
 
 
 # Recettes : dict { nom_ingrédient: quantité } — chaque plat consomme un nombre d'ingrédients différent
@@ -1,6 +1,13 @@
 import pygame
+import array
+import numpy as np
 from config import *
 from game.assets_loader import Assets
+from game.queues import QueueLayout
+from game.pathfinding import Pathfinder
+
+# Types de tuiles sur lesquelles on peut marcher
+WALKABLE_TILES = (TILE_FLOOR, TILE_DOOR, TILE_STREET, TILE_SIDEWALK)
 
 class Zone:
     """Represents a single zone (room) in the game"""
@@ -11,42 +18,99 @@ class Zone:
         self.bg_image_name = bg_image_name
         self.tiles = [[TILE_FLOOR for _ in range(width)] for _ in range(height)]
         self.doors = []
+        # Tables de portes construites par add_door (évite de parcourir self.doors à chaque frame)
+        self.doors_by_tile = {}    # (x, y) -> porte
+        self.doors_by_target = {}  # zone cible -> première porte qui y mène
+        self.door_centers = {}     # porte -> centre en pixels de la tuile de porte
+        self.door_arrivals = {}    # porte -> centre en pixels de la tuile d'arrivée (zone cible)
         self.walkable_area = []
         self.collision_rects = []  # Rectangles de collision en pixels (zones NON walkables)
         self.use_pixel_collisions = False  # Utiliser les collisions en pixels
         
+        # Grilles de collision précalculées (voir _bake), reconstruites à la demande.
+        # `version` augmente à chaque modification : les caches qui en dépendent la comparent.
+        self.version = 0
+        self._baked_version = -1
+        self.walkable_grid = None   # numpy bool (height, width) : tuiles walkables
+        self._walkable_rows = None  # même grille en listes Python (accès unitaire rapide)
+        self.nav_rows = None        # tuiles praticables pour la navigation (centre hors collisions TMX)
+        self._blocked_sat = None    # sommes cumulées des pixels bloqués (collisions TMX), à plat
+        self._sat_stride = 0
+
+        # Décor fixe (sol, murs, façades, portes) rendu une fois par WorldMap.get_static_layer
+        self.static_layer = None
+        self._static_layer_version = -1
+        
     def set_tile(self, x, y, tile_type):
         if 0 <= x < self.width and 0 <= y < self.height:
             self.tiles[y][x] = tile_type
+            self.version += 1
             
     def add_door(self, x, y, target_zone, target_x, target_y):
         self.tiles[y][x] = TILE_DOOR
-        self.doors.append((x, y, target_zone, target_x, target_y))
+        self.version += 1
+        door = (x, y, target_zone, target_x, target_y)
+        self.doors.append(door)
+        self.doors_by_tile.setdefault((x, y), door)
+        self.doors_by_target.setdefault(target_zone, door)
+        self.door_centers[door] = (x * TILE_SIZE + TILE_SIZE // 2, y * TILE_SIZE + TILE_SIZE // 2)
+        self.door_arrivals[door] = (target_x * TILE_SIZE + TILE_SIZE // 2, target_y * TILE_SIZE + TILE_SIZE // 2)
         
     def set_walkable_rect(self, x, y, w, h):
         self.walkable_area.append(pygame.Rect(x, y, w, h))
+        self.version += 1
     
     def set_collision_rects(self, rects):
         """Définit les rectangles de collision en pixels (zones NON walkables)"""
         self.collision_rects = rects
         self.use_pixel_collisions = True
+        self.version += 1
+    
+    def _bake(self):
+        """Rastérise tuiles, zones walkables, portes et collisions TMX en grilles numpy"""
+        if self.walkable_area:
+            grid = np.zeros((self.height, self.width), dtype=bool)
+            for rect in self.walkable_area:
+                grid[max(0, rect.top):max(0, rect.bottom), max(0, rect.left):max(0, rect.right)] = True
+            for x, y in self.doors_by_tile:
+                grid[y, x] = True
+        else:
+            grid = np.isin(np.array(self.tiles), WALKABLE_TILES)
+        self.walkable_grid = grid
+        self._walkable_rows = grid.tolist()
+        
+        self._blocked_sat = None
+        nav = grid
+        if self.use_pixel_collisions and self.collision_rects:
+            pixel_w = self.width * TILE_SIZE
+            pixel_h = self.height * TILE_SIZE
+            blocked = np.zeros((pixel_h, pixel_w), dtype=np.int32)
+            for rect in self.collision_rects:
+                blocked[max(0, rect.top):max(0, rect.bottom), max(0, rect.left):max(0, rect.right)] = 1
+            # Table des sommes cumulées : nombre de pixels bloqués d'un rectangle en 4 lectures
+            sat = np.zeros((pixel_h + 1, pixel_w + 1), dtype=np.int32)
+            sat[1:, 1:] = blocked.cumsum(axis=0).cumsum(axis=1)
+            # array.array : lecture unitaire plus rapide qu'un index numpy
+            self._blocked_sat = array.array('i', sat.tobytes())
+            self._sat_stride = pixel_w + 1
+            # Navigation : une tuile est praticable si son centre n'est pas dans une collision
+            centers = blocked[TILE_SIZE // 2::TILE_SIZE, TILE_SIZE // 2::TILE_SIZE]
+            nav = grid & (centers[:self.height, :self.width] == 0)
+        self.nav_rows = nav.tolist()
+        
+        self._baked_version = self.version
+    
+    def ensure_baked(self):
+        if self._baked_version != self.version:
+            self._bake()
         
     def is_walkable(self, x, y):
         """Vérifie si une position en tiles est walkable"""
         if x < 0 or x >= self.width or y < 0 or y >= self.height:
             return False
-        
-        if self.walkable_area:
-            for rect in self.walkable_area:
-                if rect.collidepoint(x, y):
-                    return True
-            for door in self.doors:
-                if door[0] == x and door[1] == y:
-                    return True
-            return False
-            
-        tile = self.tiles[y][x]
-        return tile in [TILE_FLOOR, TILE_DOOR, TILE_STREET, TILE_SIDEWALK]
+        if self._baked_version != self.version:
+            self._bake()
+        return self._walkable_rows[y][x]
     
     def is_walkable_pixel(self, px, py, player_width=32, player_height=32):
         """
@@ -63,14 +127,15 @@ class Zone:
             return False
         
         if self.use_pixel_collisions and self.collision_rects:
-            # Créer un rect pour le joueur
-            player_rect = pygame.Rect(px, py, player_width, player_height)
-            
-            # Vérifier collision avec chaque zone de collision
-            for collision_rect in self.collision_rects:
-                if player_rect.colliderect(collision_rect):
-                    return False
-            return True
+            if self._baked_version != self.version:
+                self._bake()
+            # Aucun pixel bloqué sous la hitbox (table des sommes cumulées, O(1))
+            x1, y1 = int(px), int(py)
+            x2 = x1 + int(player_width)
+            row1 = y1 * self._sat_stride
+            row2 = (y1 + int(player_height)) * self._sat_stride
+            sat = self._blocked_sat
+            return sat[row2 + x2] - sat[row1 + x2] - sat[row2 + x1] + sat[row1 + x1] == 0
         
         # Fallback: utiliser la méthode par tiles
         tile_x = int(px // TILE_SIZE)
@@ -78,10 +143,11 @@ class Zone:
         return self.is_walkable(tile_x, tile_y)
         
     def get_door_at(self, x, y):
-        for door in self.doors:
-            if door[0] == x and door[1] == y:
-                return door
-        return None
+        return self.doors_by_tile.get((x, y))
+    
+    def get_door_to(self, target_zone):
+        """Porte de cette zone qui mène à target_zone (ou None)"""
+        return self.doors_by_target.get(target_zone)
 
 class TacosRestaurant(Zone):
     def __init__(self):
@@ -165,71 +231,96 @@ class WorldMap:
             "kebab": KebabRestaurant(),
             "street": Street()
         }
+        # Grilles de collision calculées au chargement plutôt qu'à la première frame
+        for zone in self.zones.values():
+            zone.ensure_baked()
+        # Géométrie des files d'attente par restaurant (calculée à la première demande)
+        self._queue_layouts = {}
+        # Chemins des clients : champs de flux partagés vers les portes et les places de file
+        self.pathfinder = Pathfinder(self)
+        self.pathfinder.warm_up()
         
     def get_zone(self, name):
         return self.zones.get(name)
+    
+    def get_queue_layout(self, restaurant):
+        """Places de file (dedans et dehors) d'un restaurant, ou None si le restaurant n'existe pas"""
+        if restaurant not in self._queue_layouts:
+            self._queue_layouts[restaurant] = QueueLayout.build(self, restaurant)
+        return self._queue_layouts[restaurant]
         
     def draw_zone(self, zone, surface, camera):
+        # Tout le décor de la zone est fixe pendant une partie : un seul blit par vue
+        surface.blit(self.get_static_layer(zone), camera.to_view(0, 0))
+
+    def get_static_layer(self, zone):
+        """Surface du décor de la zone, reconstruite seulement si ses tuiles ou portes changent"""
+        if zone.static_layer is None or zone._static_layer_version != zone.version:
+            zone.static_layer = self._render_static_layer(zone)
+            zone._static_layer_version = zone.version
+        return zone.static_layer
+
+    def _render_static_layer(self, zone):
+        """Décor de la zone à l'échelle de rendu des vues (tuiles de assets.render_tile pixels)"""
         assets = Assets.get()
-        
+        tile_size = assets.render_tile
+        width = zone.width * tile_size
+        height = zone.height * tile_size
+        bg = assets.get_sprite(zone.bg_image_name) if zone.bg_image_name else None
+        if bg:
+            width = max(width, bg.get_width())
+            height = max(height, bg.get_height())
+        # Transparent là où rien n'est dessiné : le fond de la vue reste visible comme avant
+        layer = pygame.Surface((width, height), pygame.SRCALPHA)
+        door_img = assets.get_sprite("door")
+
         # For restaurants: draw full background image
-        if zone.bg_image_name:
-            bg = assets.get_image(zone.bg_image_name)
-            if bg:
-                pos = (-camera.x, -camera.y)
-                surface.blit(bg, pos)
-                
-                # Draw exit door indicator
-                door_img = assets.get_image("door")
-                for door in zone.doors:
-                    dx, dy = door[0], door[1]
-                    door_pos = (dx * TILE_SIZE - camera.x, dy * TILE_SIZE - camera.y)
-                    if door_img:
-                        surface.blit(door_img, door_pos)
-                return
-        
-        # For street
-        sidewalk_img = assets.get_image("sidewalk")
-        road_img = assets.get_image("road")
-        facade_tacos = assets.get_image("facade_tacos")
-        facade_kebab = assets.get_image("facade_kebab")
-        door_img = assets.get_image("door")
-        
-        # Draw base tiles first
-        for y in range(zone.height):
-            for x in range(zone.width):
-                tile = zone.tiles[y][x]
-                pos = (x * TILE_SIZE - camera.x, y * TILE_SIZE - camera.y)
-                
-                if tile == TILE_SIDEWALK and sidewalk_img:
-                    surface.blit(sidewalk_img, pos)
-                elif tile == TILE_STREET and road_img:
-                    surface.blit(road_img, pos)
-                elif tile == TILE_WALL:
-                    # Dark background for buildings
-                    pygame.draw.rect(surface, (40, 35, 50), (pos[0], pos[1], TILE_SIZE, TILE_SIZE))
-                elif tile == TILE_DOOR:
-                    # Sidewalk under door
-                    if sidewalk_img:
-                        surface.blit(sidewalk_img, pos)
-                    
-        # Draw facades over building area
-        # Tacos facade: tiles 0-5, rows 0-2 (6 tiles wide, 3 tiles tall)
-        if facade_tacos:
-            facade_pos = (0 - camera.x, 0 - camera.y)
-            surface.blit(facade_tacos, facade_pos)
-            
-        # Kebab facade: tiles 7-12, rows 0-2
-        if facade_kebab:
-            facade_pos = (7 * TILE_SIZE - camera.x, 0 - camera.y)
-            surface.blit(facade_kebab, facade_pos)
-            
-        # Draw door markers on sidewalk
-        for door in zone.doors:
-            dx, dy = door[0], door[1]
-            door_pos = (dx * TILE_SIZE - camera.x, dy * TILE_SIZE - camera.y)
-            if door_img:
-                surface.blit(door_img, door_pos)
+        if bg:
+            layer.blit(bg, (0, 0))
+        else:
+            # For street
+            sidewalk_img = assets.get_sprite("sidewalk")
+            road_img = assets.get_sprite("road")
+            facade_tacos = assets.get_sprite("facade_tacos")
+            facade_kebab = assets.get_sprite("facade_kebab")
+
+            # Draw base tiles first
+            for y in range(zone.height):
+                for x in range(zone.width):
+                    tile = zone.tiles[y][x]
+                    pos = (x * tile_size, y * tile_size)
+
+                    if tile == TILE_SIDEWALK and sidewalk_img:
+                        layer.blit(sidewalk_img, pos)
+                    elif tile == TILE_STREET and road_img:
+                        layer.blit(road_img, pos)
+                    elif tile == TILE_WALL:
+                        # Dark background for buildings
+                        pygame.draw.rect(layer, (40, 35, 50), (pos[0], pos[1], tile_size, tile_size))
+                    elif tile == TILE_DOOR:
+                        # Sidewalk under door
+                        if sidewalk_img:
+                            layer.blit(sidewalk_img, pos)
+
+            # Draw facades over building area
+            # Tacos facade: tiles 0-5, rows 0-2 (6 tiles wide, 3 tiles tall)
+            if facade_tacos:
+                layer.blit(facade_tacos, (0, 0))
+
+            # Kebab facade: tiles 7-12, rows 0-2
+            if facade_kebab:
+                layer.blit(facade_kebab, (7 * tile_size, 0))
+
+        # Door markers (sortie des restaurants, entrées sur le trottoir)
+        if door_img:
+            for door in zone.doors:
+                layer.blit(door_img, (door[0] * tile_size, door[1] * tile_size))
+
+        # Décor entièrement opaque : surface sans alpha, bien plus rapide à blitter
+        if pygame.display.get_surface() is not None:
+            opaque = pygame.mask.from_surface(layer, 254).count() == width * height
+            layer = layer.convert() if opaque else layer.convert_alpha()
+        return layer
 
 class Map:
     def __init__(self):
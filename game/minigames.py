@@ -1,7 +1,8 @@
 import pygame
 import random
-import time
 from config import *
+from game.clock import wall_clock
+from game.fonts import render_text
 
 # Touches faciles sur PC portable, réparties par joueur pour 2 joueurs sur le même clavier
 # Joueur 1: gauche du clavier | Joueur 2: droite du clavier (pas de chevauchement)
@@ -14,11 +15,12 @@ MINIGAME_KEYS_PLAYER2 = [
 
 
 class MiniGame:
-    def __init__(self, dish_name, player_index=0):
+    def __init__(self, dish_name, player_index=0, clock=None):
+        self.clock = clock or wall_clock
         self.dish_name = dish_name
         self.player_index = player_index
         self.active = True
-        self.start_time = time.time()
+        self.start_time = self.clock.now()
         self.duration = 5.0
         self.completed = False
         self.success = False
@@ -46,7 +48,7 @@ class MiniGame:
                 else:
                     self.current_step = 0
                     
-        if time.time() - self.start_time > self.duration:
+        if self.clock.now() - self.start_time > self.duration:
             self.success = False
             self.completed = True
             self.active = False
@@ -62,24 +64,22 @@ class MiniGame:
         pygame.draw.rect(surface, (255, 200, 50), bg_rect, 3, border_radius=10)
         
         # Title
-        font = pygame.font.SysFont(None, 28)
-        title = font.render(f"Préparation: {self.dish_name}", True, WHITE)
+        title = render_text(f"Préparation: {self.dish_name}", 28, WHITE)
         surface.blit(title, (x - 10, y - 10))
         
         # Key sequence display
-        key_font = pygame.font.SysFont(None, 36)
         key_x = x
         for i, key_name in enumerate(self.key_names):
             color = GREEN if i < self.current_step else (WHITE if i == self.current_step else GRAY)
             key_bg = pygame.Rect(key_x, y + 30, 50, 50)
             pygame.draw.rect(surface, color, key_bg, border_radius=8)
             pygame.draw.rect(surface, BLACK, key_bg, 2, border_radius=8)
-            key_text = key_font.render(key_name, True, BLACK)
+            key_text = render_text(key_name, 36, BLACK)
             surface.blit(key_text, (key_x + 15, y + 40))
             key_x += 60
             
         # Timer bar
-        elapsed = time.time() - self.start_time
+        elapsed = self.clock.now() - self.start_time
         remaining_ratio = max(0, 1 - elapsed / self.duration)
         bar_width = int(240 * remaining_ratio)
         pygame.draw.rect(surface, GRAY, (x - 10, y + 85, 240, 15), border_radius=5)
@@ -2,7 +2,6 @@
 Système de missions - Objectifs à accomplir durant la partie
 """
 import random
-import time
 from config import *
 
 
@@ -318,7 +317,7 @@ class MissionManager:
             mission_type=template['type'],
             icon=template.get('icon', 'default')
         )
-        mission.start_time = time.time()
+        mission.start_time = self.player.clock.now()
         self.active_missions.append(mission)
     
     def update(self, event_type, value=1):
@@ -0,0 +1,172 @@
+"""
+Musique d'ambiance procédurale (style fast-food/arcade)
+La piste est une liste d'événements (notes de basse, accords, mélodie, hi-hat, kick) rendue bloc par
+bloc : aucun tableau de la taille de la piste n'est alloué, quelle que soit sa durée. Au-delà de
+30 s, chaque phrase reprend la grille transposée, pour une musique longue qui ne se répète pas.
+"""
+import os
+import wave
+import numpy as np
+
+SAMPLE_RATE = 44100
+PHRASE_SECONDS = 30
+PHRASE_TRANSPOSE = (0, 5, -2, 3)  # demi-tons de la mélodie, phrase après phrase
+PEAK = 0.7                        # amplitude maximale après normalisation
+
+# Basse funky (groove de base) : C2, E2, C2 pattern
+BASS_PATTERN = (65.41, 0, 65.41, 0, 82.41, 0, 65.41, 0)
+BEATS_PER_SECOND = 2  # 120 BPM
+
+# Accords/pads (ambiance chaude)
+CHORDS = (
+    (261.63, 329.63, 392.00),  # C major
+    (293.66, 369.99, 440.00),  # D major
+    (261.63, 329.63, 392.00),  # C major
+    (246.94, 311.13, 369.99),  # B minor
+)
+
+# Mélodie simple et accrocheuse (style arcade)
+MELODY = (
+    523.25, 0, 587.33, 523.25, 0, 392.00, 440.00, 0,
+    523.25, 0, 659.25, 587.33, 0, 523.25, 0, 0,
+    698.46, 0, 659.25, 587.33, 0, 523.25, 587.33, 0,
+    523.25, 0, 440.00, 392.00, 0, 349.23, 392.00, 0,
+)
+
+BASS, CHORD, NOTE, HIHAT, KICK = range(5)
+
+
+class AmbientTrack:
+    """Piste de `duration` secondes, rendue par blocs (chunks / render)"""
+
+    def __init__(self, duration=PHRASE_SECONDS, sample_rate=SAMPLE_RATE, seed=0):
+        self.duration = duration
+        self.sample_rate = sample_rate
+        self.seed = seed
+        self.num_samples = int(sample_rate * duration)
+        self.events = []  # (début, fin, type, paramètres), en échantillons
+        phrases = max(1, -(-duration // PHRASE_SECONDS))
+        for phrase in range(int(phrases)):
+            self._add_phrase(phrase)
+        self.starts = np.array([event[0] for event in self.events])
+        self.ends = np.array([event[1] for event in self.events])
+
+    def _add_phrase(self, phrase):
+        sr = self.sample_rate
+        offset = phrase * PHRASE_SECONDS * sr
+        duration = PHRASE_SECONDS
+
+        def add(start, end, kind, params):
+            start, end = offset + start, offset + end
+            if end <= self.num_samples:
+                self.events.append((start, end, kind, params))
+
+        beat_duration = 1.0 / BEATS_PER_SECOND
+        bass = BASS_PATTERN * int(duration * BEATS_PER_SECOND / len(BASS_PATTERN))
+        for i, note in enumerate(bass):
+            if note > 0:
+                add(int(i * beat_duration * sr / 2), int((i + 0.4) * beat_duration * sr / 2), BASS, note)
+
+        chord_duration = duration / len(CHORDS)
+        for i, chord in enumerate(CHORDS * 2):
+            add(int(i * chord_duration * sr / 2), int((i + 1) * chord_duration * sr / 2), CHORD, chord)
+
+        transpose = 2 ** (PHRASE_TRANSPOSE[phrase % len(PHRASE_TRANSPOSE)] / 12)
+        note_duration = duration / len(MELODY)
+        for i, note in enumerate(MELODY * 2):
+            if note > 0:
+                add(int(i * note_duration * sr / 2), int((i + 0.7) * note_duration * sr / 2),
+                    NOTE, note * transpose)
+
+        # Percussion légère (hi-hat style) : 4 hits par seconde, bruit propre à chaque hit
+        hit_length = int(sr * 0.05)
+        for i in range(int(duration * 4)):
+            start = int(i * sr / 4)
+            add(start, start + hit_length, HIHAT, (phrase, i))
+
+        # Kick drum sur les temps forts : 2 kicks par seconde
+        kick_length = int(sr * 0.1)
+        for i in range(int(duration * 2)):
+            start = int(i * sr / 2)
+            add(start, start + kick_length, KICK, None)
+
+    def render(self, start, end):
+        """Échantillons [start, end) non normalisés (float)"""
+        out = np.zeros(end - start)
+        for index in np.flatnonzero((self.starts < end) & (self.ends > start)):
+            ev_start, ev_end, kind, params = self.events[index]
+            lo, hi = max(start, ev_start), min(end, ev_end)
+            local = np.arange(lo - ev_start, hi - ev_start)
+            out[lo - start:hi - start] += self._event(kind, params, local, ev_end - ev_start)
+        return out
+
+    def _event(self, kind, params, local, length):
+        """Contribution d'un événement sur ses échantillons `local` (0 = début de l'événement)"""
+        t = local / self.sample_rate
+        if kind == BASS:
+            # Son de basse avec un peu de growl
+            wave = np.sin(2 * np.pi * params * t) * 0.4
+            wave += np.sin(2 * np.pi * params * 2 * t) * 0.1
+            return wave * np.exp(-t * 4)
+        if kind == CHORD:
+            wave = sum(np.sin(2 * np.pi * freq * t) * 0.08 for freq in params)
+            # Envelope douce
+            return wave * envelope(local, length, int(0.1 * length), int(0.2 * length), 0.0)
+        if kind == NOTE:
+            # Son type synthé rétro (+ harmonique)
+            wave = np.sin(2 * np.pi * params * t) * 0.15
+            wave += np.sin(2 * np.pi * params * 2 * t) * 0.05
+            return wave * envelope(local, length, int(0.05 * length), int(0.3 * length), 0.2)
+        if kind == HIHAT:
+            # Noise burst, rejouable à l'identique (deux passes : crête puis écriture)
+            phrase, hit = params
+            noise = np.random.RandomState((self.seed, phrase, hit)).uniform(-1, 1, length)
+            env = np.exp(-local * 10 / (length - 1))
+            return noise[local] * env * 0.08
+        # Kick avec pitch drop
+        kick_t = local * 0.1 / (length - 1)
+        kick_freq = 150 * np.exp(-kick_t * 30)
+        return np.sin(2 * np.pi * kick_freq * kick_t) * np.exp(-kick_t * 20) * 0.25
+
+    def chunks(self, chunk_seconds=1.0):
+        """PCM 16 bits mono normalisé, bloc par bloc. La piste est rendue deux fois : une passe
+        pour la crête (normalisation), une pour les blocs eux-mêmes."""
+        step = int(self.sample_rate * chunk_seconds)
+        peak = 0.0
+        for start in range(0, self.num_samples, step):
+            peak = max(peak, np.max(np.abs(self.render(start, min(start + step, self.num_samples)))))
+        gain = PEAK / peak if peak > 0 else 1.0
+        for start in range(0, self.num_samples, step):
+            block = self.render(start, min(start + step, self.num_samples))
+            yield (block * gain * 32767).astype(np.int16)
+
+
+def envelope(local, length, attack, release, release_end):
+    """Enveloppe attaque/maintien/relâchement d'un événement de `length` échantillons, évaluée
+    sur ses échantillons `local` (mêmes valeurs que des np.linspace sur l'événement entier)"""
+    env = np.ones(len(local))
+    if attack > 0:
+        rising = local < attack
+        env[rising] = local[rising] / (attack - 1) if attack > 1 else 0.0
+    if release > 0:
+        falling = local >= length - release
+        position = local[falling] - (length - release)
+        env[falling] = 1 + (release_end - 1) * (position / (release - 1) if release > 1 else 0.0)
+    return env
+
+
+def write_wav(track, path, chunk_seconds=1.0):
+    """Écrit la piste en WAV mono 16 bits, bloc par bloc, puis la publie d'un coup (os.replace)"""
+    tmp_path = path + ".tmp"
+    try:
+        with wave.open(tmp_path, 'wb') as wav_file:
+            wav_file.setnchannels(1)  # Mono
+            wav_file.setsampwidth(2)  # 16-bit
+            wav_file.setframerate(track.sample_rate)
+            for block in track.chunks(chunk_seconds):
+                wav_file.writeframes(block.tobytes())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
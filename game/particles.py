@@ -0,0 +1,301 @@
+"""
+Système de particules : sang, poussière de balayage, particules du fond des menus
+L'état des particules vit dans des tableaux NumPy (une colonne par attribut) et leurs sprites
+sont pré-rendus et partagés par (style, taille, palier d'alpha) : dessiner une frame ne crée
+aucune surface, tout part en un seul Surface.blits.
+"""
+import math
+import pygame
+import numpy as np
+from collections import OrderedDict
+from game.clock import wall_clock
+
+ALPHA_LEVELS = 32  # paliers d'alpha des sprites pré-rendus (pas de ~8)
+MAX_STEP = 0.1     # pas d'intégration maximal (s) : une frame très lente ne téléporte rien
+
+# Styles : un cercle de couleur, ou une image de taille fixe
+CIRCLE = 0
+IMAGE = 1
+
+
+class SpritePool:
+    """Sprites de particules pré-rendus, du moins au plus récemment utilisé.
+    Le nombre de surfaces est borné par max_sprites (les plus anciennes sont libérées)."""
+    _instance = None
+
+    @classmethod
+    def get(cls):
+        if cls._instance is None:
+            cls._instance = SpritePool()
+        return cls._instance
+
+    def __init__(self, max_sprites=512):
+        self.sprites = OrderedDict()  # (style, rayon, palier) -> Surface
+        self.max_sprites = max_sprites
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def sprite(self, style, radius, level):
+        key = (style, radius, level)
+        surface = self.sprites.get(key)
+        if surface is not None:
+            self.sprites.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        kind, data = style
+        alpha = alpha_of(level)
+        if kind == CIRCLE:
+            surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(surface, data + (alpha,), (radius, radius), radius)
+        else:
+            image, size = data
+            surface = pygame.transform.scale(image, size)
+            surface.set_alpha(alpha)
+        self.sprites[key] = surface
+        if len(self.sprites) > self.max_sprites:
+            self.sprites.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def clear(self):
+        self.sprites.clear()
+
+    def stats(self):
+        return {
+            'sprites': len(self.sprites),
+            'max_sprites': self.max_sprites,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+
+def alpha_of(level):
+    return int(level * 255 / (ALPHA_LEVELS - 1))
+
+
+class ParticleSystem:
+    """Particules d'une partie (ou d'un écran) en structure de tableaux.
+
+    Positions = centres, en pixels monde ; vitesses en pixels/s. L'alpha décroît linéairement
+    jusqu'à la fin de vie (life=inf : particule permanente) et le rayon grandit de `grow` px/s.
+    La capacité est fixe : une émission au-delà est ignorée (compteur dropped).
+    """
+
+    def __init__(self, capacity=256, clock=None, pool=None, seed=None):
+        self.clock = clock or wall_clock
+        self.pool = pool or SpritePool.get()
+        self.rng = np.random.default_rng(seed)
+        self.capacity = capacity
+        self.styles = []      # index -> (type, données)
+        self._style_ids = {}  # clé -> index
+        self.zones = []       # index -> nom de zone (None = pas de zone)
+        self._zone_ids = {}
+        self.last_update = None
+        self.dropped = 0
+
+        self.x = np.zeros(capacity, dtype=np.float64)
+        self.y = np.zeros(capacity, dtype=np.float64)
+        self.vx = np.zeros(capacity, dtype=np.float64)
+        self.vy = np.zeros(capacity, dtype=np.float64)
+        self.gravity = np.zeros(capacity, dtype=np.float64)
+        self.wobble = np.zeros(capacity, dtype=np.float64)       # amplitude de l'oscillation en x (px/s)
+        self.wobble_freq = np.zeros(capacity, dtype=np.float64)
+        self.phase = np.zeros(capacity, dtype=np.float64)
+        self.born = np.zeros(capacity, dtype=np.float64)
+        self.life = np.zeros(capacity, dtype=np.float64)
+        self.radius = np.zeros(capacity, dtype=np.float64)
+        self.grow = np.zeros(capacity, dtype=np.float64)
+        self.alpha = np.zeros(capacity, dtype=np.float64)        # alpha à l'émission
+        self.style = np.zeros(capacity, dtype=np.int32)
+        self.zone = np.zeros(capacity, dtype=np.int32)
+        self.alive = np.zeros(capacity, dtype=np.bool_)
+        self.count = 0
+
+    # === Styles ===
+
+    def _style(self, key, style):
+        index = self._style_ids.get(key)
+        if index is None:
+            index = len(self.styles)
+            self.styles.append(style)
+            self._style_ids[key] = index
+        return index
+
+    def circle_style(self, color):
+        """Style « disque de couleur » (le rayon est celui de la particule)"""
+        color = tuple(color[:3])
+        return self._style(("circle", color), (CIRCLE, color))
+
+    def image_style(self, key, image, size):
+        """Style « image mise à l'échelle `size` » ; key identifie l'image et sa taille"""
+        return self._style(("image", key, size), (IMAGE, (image, size)))
+
+    def _zone(self, name):
+        index = self._zone_ids.get(name)
+        if index is None:
+            index = len(self.zones)
+            self.zones.append(name)
+            self._zone_ids[name] = index
+        return index
+
+    # === Émission ===
+
+    def emit(self, style, x, y, vx=0.0, vy=0.0, radius=1, life=math.inf, alpha=255,
+             gravity=0.0, grow=0.0, wobble=0.0, wobble_freq=0.0, phase=0.0, zone=None):
+        """Ajoute une particule ; renvoie son index, ou None si la capacité est atteinte"""
+        if self.count == self.capacity:
+            self.dropped += 1
+            return None
+        slot = int(np.argmin(self.alive))
+        self.x[slot] = x
+        self.y[slot] = y
+        self.vx[slot] = vx
+        self.vy[slot] = vy
+        self.gravity[slot] = gravity
+        self.wobble[slot] = wobble
+        self.wobble_freq[slot] = wobble_freq
+        self.phase[slot] = phase
+        self.born[slot] = self.clock.now()
+        self.life[slot] = life
+        self.radius[slot] = radius
+        self.grow[slot] = grow
+        self.alpha[slot] = alpha
+        self.style[slot] = style
+        self.zone[slot] = self._zone(zone)
+        self.alive[slot] = True
+        self.count += 1
+        return slot
+
+    def burst(self, style, x, y, count, vx_range, vy_range, radius_range, **kwargs):
+        """Émet `count` particules aux vitesses et rayons tirés au hasard dans les intervalles"""
+        vx = self.rng.uniform(*vx_range, count)
+        vy = self.rng.uniform(*vy_range, count)
+        radius = self.rng.integers(radius_range[0], radius_range[1] + 1, count)
+        for i in range(count):
+            self.emit(style, x, y, vx=vx[i], vy=vy[i], radius=int(radius[i]), **kwargs)
+
+    def clear(self):
+        self.alive[:] = False
+        self.count = 0
+
+    # === Mise à jour ===
+
+    def update(self, dt=None):
+        """Fait avancer les particules de dt secondes (par défaut : temps écoulé depuis l'appel précédent)"""
+        now = self.clock.now()
+        if dt is None:
+            dt = 0.0 if self.last_update is None else min(MAX_STEP, now - self.last_update)
+        self.last_update = now
+        if not self.count:
+            return
+
+        idx = np.flatnonzero(self.alive)
+        expired = idx[now - self.born[idx] >= self.life[idx]]
+        if len(expired):
+            self.alive[expired] = False
+            self.count -= len(expired)
+            idx = np.flatnonzero(self.alive)
+
+        self.vy[idx] += self.gravity[idx] * dt
+        drift = self.vx[idx] + self.wobble[idx] * np.sin(self.wobble_freq[idx] * now + self.phase[idx])
+        self.x[idx] += drift * dt
+        self.y[idx] += self.vy[idx] * dt
+
+    def wrap(self, top, bottom, width):
+        """Les particules passées au-dessus de `top` réapparaissent en `bottom`, à un x au hasard"""
+        gone = np.flatnonzero(self.alive & (self.y < top))
+        if len(gone):
+            self.y[gone] = bottom
+            self.x[gone] = self.rng.integers(0, width + 1, len(gone))
+
+    # === Rendu ===
+
+    def draw(self, surface, camera=None, zone=None, view=None):
+        """Dessine les particules (de `zone` si donnée) qui touchent `view` (coordonnées monde)"""
+        if not self.count:
+            return
+        mask = self.alive.copy()
+        if zone is not None:
+            zone_id = self._zone_ids.get(zone)
+            if zone_id is None:
+                return
+            mask &= self.zone == zone_id
+        idx = np.flatnonzero(mask)
+        if not len(idx):
+            return
+
+        now = self.clock.now()
+        age = now - self.born[idx]
+        life = self.life[idx]
+        fade = np.ones(len(idx))
+        mortal = np.isfinite(life)
+        fade[mortal] = 1.0 - age[mortal] / life[mortal]
+        levels = np.rint(np.clip(self.alpha[idx] * fade, 0, 255) * (ALPHA_LEVELS - 1) / 255).astype(np.int32)
+        radius = np.maximum(1, (self.radius[idx] + self.grow[idx] * age).astype(np.int32))
+        x = self.x[idx].astype(np.int32)
+        y = self.y[idx].astype(np.int32)
+
+        visible = levels > 0
+        if view is not None:
+            visible &= ((x + radius > view.left) & (x - radius < view.right)
+                        & (y + radius > view.top) & (y - radius < view.bottom))
+        if camera is not None:
+            x = x - camera.x
+            y = y - camera.y
+            if camera.scale != 1:
+                # Vue rendue à une autre échelle : positions et rayons des cercles en pixels de rendu
+                x = np.rint(x * camera.scale).astype(np.int32)
+                y = np.rint(y * camera.scale).astype(np.int32)
+                radius = np.maximum(1, np.rint(radius * camera.scale).astype(np.int32))
+
+        sprite = self.pool.sprite
+        styles = self.styles
+        batch = []
+        for i in np.flatnonzero(visible):
+            style = styles[self.style[idx[i]]]
+            if style[0] == CIRCLE:
+                r = int(radius[i])
+                batch.append((sprite(style, r, int(levels[i])), (int(x[i]) - r, int(y[i]) - r)))
+            else:
+                w, h = style[1][1]
+                batch.append((sprite(style, 0, int(levels[i])), (int(x[i]) - w // 2, int(y[i]) - h // 2)))
+        if batch:
+            surface.blits(batch, doreturn=False)
+
+    def stats(self):
+        return {
+            'alive': self.count,
+            'capacity': self.capacity,
+            'dropped': self.dropped,
+            'styles': len(self.styles),
+            'pool': self.pool.stats(),
+        }
+
+
+# === Effets du jeu ===
+
+BLOOD_COLOR = (180, 0, 0)
+DUST_COLOR = (200, 180, 150)
+
+
+def emit_blood(particles, x, y, zone):
+    """Gerbe de sang d'un client tué (8 gouttes, retombent et s'effacent en 0.8s)"""
+    particles.burst(particles.circle_style(BLOOD_COLOR), x, y, 8,
+                    vx_range=(-180, 180), vy_range=(-300, -60), radius_range=(1, 4),
+                    life=0.8, gravity=1080, zone=zone)
+
+
+def emit_dust(particles, x, y, direction, progress, duration, zone):
+    """Nuages de poussière du balai (extrémité en x, y) : 3 bouffées qui s'éloignent, gonflent
+    et s'effacent d'ici la fin du balayage (`progress` de 0 à 1 sur `duration` secondes)"""
+    style = particles.circle_style(DUST_COLOR)
+    remaining = 1 - progress
+    for i in range(3):
+        particles.emit(style, x + (progress * 30 + i * 10) * direction, y + 5 - progress * 10,
+                       vx=30 / duration * direction, vy=-10 / duration,
+                       radius=int(3 + progress * 5), grow=5 / duration,
+                       life=duration * remaining, alpha=150 * remaining, zone=zone)
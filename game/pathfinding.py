@@ -0,0 +1,154 @@
+"""
+Recherche de chemin sur la grille de tuiles des zones
+A* pour les trajets ponctuels, champs de flux (flow fields) partagés pour les cibles fréquentes
+(portes, places de file) : des centaines de clients suivent le même champ sans calculer de chemin.
+"""
+import heapq
+import math
+from config import *
+
+# Voisins (dx, dy, coût) : 8 directions, diagonales à sqrt(2)
+_NEIGHBOURS = [
+    (1, 0, 1.0), (-1, 0, 1.0), (0, 1, 1.0), (0, -1, 1.0),
+    (1, 1, math.sqrt(2)), (1, -1, math.sqrt(2)), (-1, 1, math.sqrt(2)), (-1, -1, math.sqrt(2)),
+]
+
+
+def tile_center(tile):
+    """Centre en pixels d'une tuile"""
+    return tile[0] * TILE_SIZE + TILE_SIZE // 2, tile[1] * TILE_SIZE + TILE_SIZE // 2
+
+
+def _neighbours(grid, x, y):
+    """Voisins marchables ; pas de diagonale qui coupe un coin bloqué"""
+    height = len(grid)
+    width = len(grid[0])
+    for dx, dy, cost in _NEIGHBOURS:
+        nx, ny = x + dx, y + dy
+        if not (0 <= nx < width and 0 <= ny < height) or not grid[ny][nx]:
+            continue
+        if dx and dy and not (grid[y][nx] and grid[ny][x]):
+            continue
+        yield nx, ny, cost
+
+
+class FlowField:
+    """Pour chaque tuile : distance jusqu'à la cible et tuile suivante sur le plus court chemin"""
+
+    def __init__(self, grid, target, version):
+        self.target = target
+        self.version = version
+        height = len(grid)
+        width = len(grid[0])
+        self.distance = [[math.inf] * width for _ in range(height)]
+        self.next_tile = [[None] * width for _ in range(height)]
+
+        tx, ty = target
+        if not (0 <= tx < width and 0 <= ty < height):
+            return
+        # Dijkstra depuis la cible (graphe symétrique) : la tuile suivante est le prédécesseur
+        self.distance[ty][tx] = 0.0
+        heap = [(0.0, tx, ty)]
+        while heap:
+            dist, x, y = heapq.heappop(heap)
+            if dist > self.distance[y][x]:
+                continue
+            for nx, ny, cost in _neighbours(grid, x, y):
+                new_dist = dist + cost
+                if new_dist < self.distance[ny][nx]:
+                    self.distance[ny][nx] = new_dist
+                    self.next_tile[ny][nx] = (x, y)
+                    heapq.heappush(heap, (new_dist, nx, ny))
+
+    def step_from(self, tile):
+        """Tuile suivante depuis `tile` (None si déjà sur la cible, hors grille ou inaccessible)"""
+        x, y = tile
+        if 0 <= y < len(self.next_tile) and 0 <= x < len(self.next_tile[0]):
+            return self.next_tile[y][x]
+        return None
+
+
+class Pathfinder:
+    """Service de chemins d'une WorldMap.
+    Les champs de flux sont mis en cache par (zone, tuile cible) et recalculés seulement
+    quand les collisions de la zone changent (Zone.version)."""
+
+    def __init__(self, world_map):
+        self.world_map = world_map
+        self.flow_fields = {}  # (zone, (x, y)) -> FlowField
+
+    def _grid(self, zone):
+        zone.ensure_baked()
+        return zone.nav_rows
+
+    def flow_field(self, zone_name, target_tile):
+        zone = self.world_map.get_zone(zone_name)
+        if not zone:
+            return None
+        key = (zone_name, target_tile)
+        field = self.flow_fields.get(key)
+        if field is None or field.version != zone.version:
+            field = FlowField(self._grid(zone), target_tile, zone.version)
+            self.flow_fields[key] = field
+        return field
+
+    def warm_up(self):
+        """Précalcule les champs vers chaque porte et chaque place de file"""
+        for zone_name, zone in self.world_map.zones.items():
+            for door in zone.doors:
+                self.flow_field(zone_name, (door[0], door[1]))
+        for restaurant in ("tacos", "kebab"):
+            layout = self.world_map.get_queue_layout(restaurant)
+            if not layout:
+                continue
+            for slot in layout.inside_slots:
+                self.flow_field(restaurant, slot)
+            for slot in layout.outside_slots:
+                self.flow_field("street", slot)
+
+    def next_waypoint(self, zone_name, px, py, target_tile):
+        """Point (pixels) vers lequel avancer depuis (px, py) pour rejoindre target_tile.
+        Sur la tuile cible, ou si aucun chemin n'existe, renvoie directement le centre de la cible."""
+        field = self.flow_field(zone_name, target_tile)
+        if field:
+            step = field.step_from((int(px // TILE_SIZE), int(py // TILE_SIZE)))
+            if step:
+                return tile_center(step)
+        return tile_center(target_tile)
+
+    def find_path(self, zone_name, start, goal):
+        """A* entre deux tuiles. Renvoie la liste des tuiles (départ et arrivée inclus) ou None"""
+        zone = self.world_map.get_zone(zone_name)
+        if not zone:
+            return None
+        grid = self._grid(zone)
+        height = len(grid)
+        width = len(grid[0])
+        gx, gy = goal
+        if not (0 <= gx < width and 0 <= gy < height) or not grid[gy][gx]:
+            return None
+
+        def heuristic(x, y):
+            # Distance octile (admissible avec les coûts 1 / sqrt(2))
+            dx, dy = abs(x - gx), abs(y - gy)
+            return max(dx, dy) + (math.sqrt(2) - 1) * min(dx, dy)
+
+        came_from = {start: None}
+        cost_so_far = {start: 0.0}
+        heap = [(heuristic(*start), start)]
+        while heap:
+            _, current = heapq.heappop(heap)
+            if current == goal:
+                path = []
+                while current is not None:
+                    path.append(current)
+                    current = came_from[current]
+                return path[::-1]
+            x, y = current
+            for nx, ny, cost in _neighbours(grid, x, y):
+                new_cost = cost_so_far[current] + cost
+                if new_cost < cost_so_far.get((nx, ny), math.inf):
+                    cost_so_far[(nx, ny)] = new_cost
+                    came_from[(nx, ny)] = current
+                    heapq.heappush(heap, (new_cost + heuristic(nx, ny), (nx, ny)))
+        return None
@@ -1,5 +1,4 @@
 import pygame
-import time
 import math
 from config import *
 from game.equipment import Fryer, Spit, Menu, Register, Toilets
@@ -8,11 +7,17 @@ from game.inventory import PlayerInventory, FoodStock
 from game.animation import WalkAnimation, AttackAnimation, AnimationManager, FloatingText, ServeAnimation
 from game.audio import play_sound
 from game.missions import MissionManager
+from game.clock import wall_clock
+from game.particles import emit_dust
 
 class Player(pygame.sprite.Sprite):
-    def __init__(self, id, x, y, color, start_zone="street", username=None):
+    def __init__(self, id, x, y, color, start_zone="street", username=None, clock=None, particles=None):
         super().__init__()
         self.id = id
+        # Horloge de simulation (GameState.clock) : cooldowns et animations
+        self.clock = clock or wall_clock
+        # Système de particules de la partie (poussière du balai) ; None = pas d'effets
+        self.particles = particles
         self.color = color
         self.username = username or f"Joueur {id}"
         
@@ -27,13 +32,13 @@ class Player(pygame.sprite.Sprite):
         
         # Fallback pour le sprite gauche si non trouvé
         if not self.image_left and self.image_right:
-            self.image_left = pygame.transform.flip(self.image_right, True, False)
+            self.image_left = assets.get_flipped(sprite_name)
         
-        # Fallback complet si aucun sprite
+        # Fallback complet si aucun sprite (carré uni : identique une fois retourné)
         if not self.image_right:
             self.image_right = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
             self.image_right.fill(color)
-            self.image_left = pygame.transform.flip(self.image_right, True, False)
+            self.image_left = self.image_right
             self.mask = pygame.mask.from_surface(self.image_right)
             
         # Image actuelle (par défaut: droite)
@@ -69,12 +74,12 @@ class Player(pygame.sprite.Sprite):
         # Nouveau: Inventaire et stock
         self.inventory = PlayerInventory(id)
         restaurant_type = 'tacos' if start_zone == 'tacos' else 'kebab'
-        self.food_stock = FoodStock(restaurant_type)
+        self.food_stock = FoodStock(restaurant_type, clock=self.clock)
         
         # Nouveau: Animations
-        self.walk_animation = WalkAnimation(self.base_image)
+        self.walk_animation = WalkAnimation(self.base_image, clock=self.clock)
         self.attack_animation = None
-        self.animation_manager = AnimationManager()
+        self.animation_manager = AnimationManager(clock=self.clock)
         self.bob_offset = 0
         
         # Direction du joueur
@@ -104,6 +109,7 @@ class Player(pygame.sprite.Sprite):
         self.is_sweeping = False
         self.sweep_animation_timer = 0
         self.sweep_animation_duration = 1.0  # 1 seconde d'animation
+        self.sweep_dust_emitted = False
         
         # Système de missions
         self.mission_manager = MissionManager(self)
@@ -132,9 +138,9 @@ class Player(pygame.sprite.Sprite):
         _, self.bob_offset = self.walk_animation.update(self.is_moving)
         
         # Son de pas
-        if self.is_moving and time.time() - self.last_footstep > self.footstep_interval:
+        if self.is_moving and self.clock.now() - self.last_footstep > self.footstep_interval:
             play_sound('footstep', f'player{self.id}')
-            self.last_footstep = time.time()
+            self.last_footstep = self.clock.now()
         
         # Mettre à jour l'animation d'attaque
         if self.attack_animation:
@@ -150,26 +156,30 @@ class Player(pygame.sprite.Sprite):
             self.rect.y = int(pos[1])
             # Orientation : regarder vers la cuisine ou le client selon la phase
             if not self.serve_animation.completed:
-                progress = (time.time() - self.serve_animation.start_time) / self.serve_animation.duration
-                if progress < 0.5:
+                if self.serve_animation.progress < 0.5:
                     self.facing = 'right' if self.serve_animation.kitchen_pos[0] >= self.rect.centerx else 'left'
                 else:
                     self.facing = 'right' if self.serve_animation.client_pos[0] >= self.rect.centerx else 'left'
             return
                 
+        # Cooldowns décomptés au pas fixe de l'horloge de simulation
+        dt = self.clock.dt
+        
         # Cooldown d'attaque
         if self.attack_cooldown > 0:
-            self.attack_cooldown -= 1/60  # Approximation pour 60 FPS
+            self.attack_cooldown -= dt
             
         # Cooldown de balayage
         if self.sweep_cooldown > 0:
-            self.sweep_cooldown -= 1/60
+            self.sweep_cooldown -= dt
             
         # Animation de balayage
         if self.is_sweeping:
-            self.sweep_animation_timer -= 1/60
+            self.sweep_animation_timer -= dt
             if self.sweep_animation_timer <= 0:
                 self.is_sweeping = False
+            elif not self.sweep_dust_emitted and self._sweep_progress() > 0.2:
+                self._emit_sweep_dust()
         
         if self.active_minigame:
             if events:
@@ -236,24 +246,21 @@ class Player(pygame.sprite.Sprite):
             center_tile_y = int(self.rect.centery // TILE_SIZE)
             door = zone.get_door_at(center_tile_x, center_tile_y)
             if door:
-                _, _, target_zone, target_x, target_y = door
                 old_zone = self.current_zone
-                self.current_zone = target_zone
-                self.rect.centerx = target_x * TILE_SIZE + TILE_SIZE // 2
-                self.rect.centery = target_y * TILE_SIZE + TILE_SIZE // 2
+                self.current_zone = door[2]
+                self.rect.center = zone.door_arrivals[door]
                 play_sound('door', f'player{self.id}')
         
     def draw(self, surface, camera, viewport_owner_id=None):
         """Dessine le joueur. viewport_owner_id: id du joueur dont c'est la vue (1 ou 2).
         La box de service (minigame) n'est affichée que sur la vue de ce joueur."""
-        draw_x = self.rect.x - camera.x
-        draw_y = self.rect.y - camera.y + self.bob_offset
+        px = camera.pixels
+        draw_x, draw_y = camera.to_view(self.rect.x, self.rect.y)
+        draw_y += self.bob_offset * camera.scale
         
-        # Utiliser le bon sprite selon la direction
-        if self.facing == 'left':
-            surface.blit(self.image_left, (draw_x, draw_y))
-        else:
-            surface.blit(self.image_right, (draw_x, draw_y))
+        # Utiliser le bon sprite selon la direction (variante à l'échelle de rendu)
+        image = self.image_left if self.facing == 'left' else self.image_right
+        surface.blit(Assets.get().sprite_for(image), (draw_x, draw_y))
         
         # Dessiner l'animation d'attaque
         if self.attack_animation and not self.attack_animation.completed:
@@ -261,82 +268,85 @@ class Player(pygame.sprite.Sprite):
         
         # Dessiner l'animation de balayage
         if self.is_sweeping:
-            self._draw_sweep_animation(surface, draw_x, draw_y)
+            self._draw_sweep_animation(surface, camera, draw_x, draw_y)
         
         # Indicateur d'arme équipée
         weapon_info = self.get_weapon_info()
         if weapon_info:
             # Petit icône au-dessus du joueur
-            icon_x = draw_x + self.rect.width // 2 - 8
-            icon_y = draw_y - 20
-            pygame.draw.rect(surface, (50, 50, 50), (icon_x - 2, icon_y - 2, 20, 20), border_radius=3)
+            icon_x = draw_x + px(self.rect.width // 2 - 8)
+            icon_y = draw_y - px(20)
+            pygame.draw.rect(surface, (50, 50, 50), (icon_x - px(2), icon_y - px(2), px(20), px(20)),
+                             border_radius=px(3))
             if weapon_info['type'] == 'knife':
                 pygame.draw.polygon(surface, (180, 180, 180), [
-                    (icon_x + 2, icon_y + 8),
-                    (icon_x + 14, icon_y + 4),
-                    (icon_x + 14, icon_y + 12)
+                    (icon_x + px(2), icon_y + px(8)),
+                    (icon_x + px(14), icon_y + px(4)),
+                    (icon_x + px(14), icon_y + px(12))
                 ])
             else:  # fork
                 for i in range(3):
                     pygame.draw.line(surface, (150, 150, 150), 
-                                   (icon_x + 4 + i * 4, icon_y + 2),
-                                   (icon_x + 4 + i * 4, icon_y + 12), 2)
+                                   (icon_x + px(4 + i * 4), icon_y + px(2)),
+                                   (icon_x + px(4 + i * 4), icon_y + px(12)), px(2))
         
         # N'afficher la box de service (minigame) que sur la vue du joueur qui sert.
         # En split screen (viewport_owner_id défini) elle est dessinée au-dessus du HUD par le renderer.
         if self.active_minigame and viewport_owner_id is None:
             self.active_minigame.draw(surface, draw_x - 50, draw_y - 140)
             
-    def _draw_sweep_animation(self, surface, draw_x, draw_y):
-        """Dessine l'animation de balayage"""
-        import math
-        
-        # Calculer la progression de l'animation (0 à 1)
-        progress = 1 - (self.sweep_animation_timer / self.sweep_animation_duration)
-        
-        # Position du balai
-        center_x = draw_x + self.rect.width // 2
-        center_y = draw_y + self.rect.height
-        
-        # Angle du balai qui oscille (gauche-droite-gauche)
+    def _sweep_progress(self):
+        """Progression de l'animation de balayage (0 à 1)"""
+        return 1 - (self.sweep_animation_timer / self.sweep_animation_duration)
+
+    def _broom_end(self, center_x, center_y, progress, broom_length=40):
+        """Extrémité du balai (qui oscille gauche-droite-gauche) et son angle"""
         sweep_angle = math.sin(progress * math.pi * 3) * 45  # 3 oscillations
-        
-        # Longueur du balai
-        broom_length = 40
-        
-        # Calculer les points du balai
         angle_rad = math.radians(-90 + sweep_angle)
         end_x = center_x + int(broom_length * math.cos(angle_rad))
         end_y = center_y + int(broom_length * math.sin(angle_rad))
+        return end_x, end_y, angle_rad
+
+    def _emit_sweep_dust(self):
+        """Poussière soulevée par le balai (particules de la partie, une fois par balayage)"""
+        self.sweep_dust_emitted = True
+        if self.particles is None:
+            return
+        progress = self._sweep_progress()
+        end_x, end_y, _ = self._broom_end(self.rect.centerx, self.rect.bottom, progress)
+        direction = 1 if self.facing == 'right' else -1
+        emit_dust(self.particles, end_x, end_y, direction,
+                  progress, self.sweep_animation_duration, self.current_zone)
+
+    def _draw_sweep_animation(self, surface, camera, draw_x, draw_y):
+        """Dessine l'animation de balayage (la poussière est dans les particules de la partie)"""
+        px = camera.pixels
+        progress = self._sweep_progress()
+        
+        # Position du balai
+        center_x = draw_x + px(self.rect.width // 2)
+        center_y = draw_y + px(self.rect.height)
+        end_x, end_y, angle_rad = self._broom_end(center_x, center_y, progress, px(40))
         
         # Manche du balai
-        pygame.draw.line(surface, (139, 90, 43), (center_x, center_y - 10), (end_x, end_y), 3)
+        pygame.draw.line(surface, (139, 90, 43), (center_x, center_y - px(10)), (end_x, end_y), px(3))
         
         # Tête du balai (plus large à l'extrémité)
         broom_width = 20
+        half_width = px(broom_width // 2)
+        head = px(10)
         perp_angle = angle_rad + math.pi / 2
         broom_points = [
-            (end_x - int(broom_width // 2 * math.cos(perp_angle)),
-             end_y - int(broom_width // 2 * math.sin(perp_angle))),
-            (end_x + int(broom_width // 2 * math.cos(perp_angle)),
-             end_y + int(broom_width // 2 * math.sin(perp_angle))),
-            (end_x + int((broom_width // 2 + 5) * math.cos(perp_angle)) + int(10 * math.cos(angle_rad)),
-             end_y + int((broom_width // 2 + 5) * math.sin(perp_angle)) + int(10 * math.sin(angle_rad))),
-            (end_x - int((broom_width // 2 + 5) * math.cos(perp_angle)) + int(10 * math.cos(angle_rad)),
-             end_y - int((broom_width // 2 + 5) * math.sin(perp_angle)) + int(10 * math.sin(angle_rad))),
+            (end_x - int(half_width * math.cos(perp_angle)),
+             end_y - int(half_width * math.sin(perp_angle))),
+            (end_x + int(half_width * math.cos(perp_angle)),
+             end_y + int(half_width * math.sin(perp_angle))),
+            (end_x + int((half_width + px(5)) * math.cos(perp_angle)) + int(head * math.cos(angle_rad)),
+             end_y + int((half_width + px(5)) * math.sin(perp_angle)) + int(head * math.sin(angle_rad))),
+            (end_x - int((half_width + px(5)) * math.cos(perp_angle)) + int(head * math.cos(angle_rad)),
+             end_y - int((half_width + px(5)) * math.sin(perp_angle)) + int(head * math.sin(angle_rad))),
         ]
         pygame.draw.polygon(surface, (180, 140, 70), broom_points)
-        
-        # Effet de particules de poussière
-        if progress > 0.2:
-            for i in range(3):
-                dust_x = end_x + int((progress * 30 + i * 10) * (1 if self.facing == 'right' else -1))
-                dust_y = end_y + 5 - int(progress * 10)
-                alpha = int(150 * (1 - progress))
-                dust_size = int(3 + progress * 5)
-                dust_surface = pygame.Surface((dust_size * 2, dust_size * 2), pygame.SRCALPHA)
-                pygame.draw.circle(dust_surface, (200, 180, 150, alpha), (dust_size, dust_size), dust_size)
-                surface.blit(dust_surface, (dust_x - dust_size, dust_y - dust_size))
             
     def check_collision_with(self, other):
         """Pixel-perfect collision check"""
@@ -392,7 +402,8 @@ class Player(pygame.sprite.Sprite):
         self.attack_animation = AttackAnimation(
             (self.rect.centerx, self.rect.centery),
             target_pos,
-            weapon.weapon_type
+            weapon.weapon_type,
+            clock=self.clock
         )
         
         self.attack_cooldown = self.attack_cooldown_duration
@@ -507,6 +518,7 @@ class Player(pygame.sprite.Sprite):
             return False
             
         self.is_sweeping = True
+        self.sweep_dust_emitted = False
         self.sweep_animation_timer = self.sweep_animation_duration
         self.sweep_cooldown = self.sweep_cooldown_duration
         play_sound('sweep', f'player{self.id}')
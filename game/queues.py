@@ -0,0 +1,169 @@
+"""
+Files d'attente des restaurants
+Chaque restaurant a une file intérieure (devant le comptoir) et une file extérieure (devant la porte).
+Les files sont mises à jour au fil de l'eau, à chaque changement de zone/état d'un client.
+"""
+from config import *
+
+# États d'un client qui fait la queue dehors
+OUTSIDE_STATES = ("walking_to_restaurant", "waiting_outside")
+
+# Nombre de places dans chaque file
+INSIDE_SLOTS = 3
+OUTSIDE_SLOTS = 3
+
+# États où un client ne reprend plus sa place dans la file
+_FROZEN_STATES = ('angry', 'fleeing', 'dying', 'dead', 'gone')
+
+
+class QueueLayout:
+    """Géométrie des files d'un restaurant (tuiles), calculée une fois par WorldMap"""
+
+    def __init__(self, inside_slots, outside_slots, street_door):
+        self.inside_slots = inside_slots    # [(x, y)] du premier au dernier
+        self.outside_slots = outside_slots  # [(x, y)] de la porte vers la rue
+        self.street_door = street_door      # Porte de la rue vers ce restaurant (ou None)
+
+    @classmethod
+    def build(cls, world_map, restaurant):
+        restaurant_zone = world_map.get_zone(restaurant)
+        if not restaurant_zone:
+            return None
+
+        # Porte intérieure du resto (en bas de la salle)
+        door_inside_x = restaurant_zone.width // 2
+        for door in restaurant_zone.doors:
+            dx, dy, _, _, _ = door
+            if dy == restaurant_zone.height - 1:
+                door_inside_x = dx
+                break
+
+        # File légèrement différente selon le resto
+        if restaurant == "tacos":
+            queue_x = max(1, door_inside_x - 1)
+        else:
+            queue_x = door_inside_x
+
+        # Premier client de la file : juste devant le comptoir
+        queue_start_y = 3
+        max_queue_length = max(0, (restaurant_zone.height - 1) - queue_start_y)
+        inside_slots = [(queue_x, queue_start_y + i) for i in range(min(INSIDE_SLOTS, max_queue_length))]
+
+        # File extérieure : sous la porte de la rue qui mène à ce restaurant
+        street_zone = world_map.get_zone("street")
+        street_door = street_zone.get_door_to(restaurant) if street_zone else None
+        outside_slots = []
+        if street_door:
+            door_x, door_y = street_door[0], street_door[1]
+            outside_slots = [
+                (door_x, min(street_zone.height - 1, door_y + 1 + i)) for i in range(OUTSIDE_SLOTS)
+            ]
+
+        return cls(inside_slots, outside_slots, street_door)
+
+
+class RestaurantQueue:
+    """File d'un restaurant : clients entrés (dedans) et clients qui attendent devant la porte (dehors).
+    Ajout en fin de file, retrait n'importe où (service, fuite, mort) puis avancement des suivants."""
+
+    def __init__(self, restaurant, layout):
+        self.restaurant = restaurant
+        self.layout = layout
+        self.inside = []
+        self.outside = []
+
+    def enqueue_inside(self, client):
+        self.inside.append(client)
+        self._place_inside(len(self.inside) - 1)
+
+    def enqueue_outside(self, client):
+        self.outside.append(client)
+        self._place_outside(len(self.outside) - 1)
+
+    def dequeue_inside(self, client):
+        idx = self.inside.index(client)
+        del self.inside[idx]
+        client.is_first_in_queue = False
+        self._promote(self.inside, idx, self._place_inside)
+
+    def dequeue_outside(self, client):
+        idx = self.outside.index(client)
+        del self.outside[idx]
+        self._promote(self.outside, idx, self._place_outside)
+
+    def is_next_to_enter(self, client):
+        """Le client est en tête de la file extérieure"""
+        return bool(self.outside) and self.outside[0] is client
+
+    def _promote(self, queue, start, place):
+        """Fait avancer d'une place les clients derrière celui qui est parti"""
+        for idx in range(start, len(queue)):
+            place(idx)
+
+    def _place_inside(self, idx):
+        if idx >= len(self.layout.inside_slots):
+            return  # Pas de place au comptoir : attend qu'une place se libère
+        client = self.inside[idx]
+        client.queue_tile_x, client.queue_tile_y = self.layout.inside_slots[idx]
+        client.is_first_in_queue = (idx == 0)
+        # S'il n'est pas déjà bien positionné, on le remet en mouvement
+        target_px = client.queue_tile_x * TILE_SIZE + TILE_SIZE // 2
+        target_py = client.queue_tile_y * TILE_SIZE + TILE_SIZE // 2
+        dist = ((client.rect.centerx - target_px) ** 2 + (client.rect.centery - target_py) ** 2) ** 0.5
+        if dist > 4 and client.state not in _FROZEN_STATES:
+            client.state = "walking_to_queue"
+
+    def _place_outside(self, idx):
+        if idx >= len(self.layout.outside_slots):
+            return
+        client = self.outside[idx]
+        client.outside_tile_x, client.outside_tile_y = self.layout.outside_slots[idx]
+        client.state = "waiting_outside"
+
+
+class QueueManager:
+    """Files de tous les restaurants, alimentées par les changements de l'index des clients"""
+
+    def __init__(self, world_map, restaurants=("tacos", "kebab")):
+        self.queues = {}
+        for restaurant in restaurants:
+            layout = world_map.get_queue_layout(restaurant)
+            if layout:
+                self.queues[restaurant] = RestaurantQueue(restaurant, layout)
+
+    def get(self, restaurant):
+        return self.queues.get(restaurant)
+
+    def _membership(self, key):
+        """('inside' | 'outside', restaurant) pour une clé (zone, target_zone, state) de l'index"""
+        if key is None:
+            return None
+        zone, target_zone, state = key
+        if target_zone not in self.queues:
+            return None
+        if zone == target_zone:
+            return ("inside", target_zone)
+        if zone == "street" and state in OUTSIDE_STATES:
+            return ("outside", target_zone)
+        return None
+
+    def on_client_change(self, client, old_key, new_key):
+        """Appelé par ClientIndex (ajout, retrait, changement de zone/état)"""
+        old = self._membership(old_key)
+        new = self._membership(new_key)
+        if old == new:
+            return
+        if old:
+            side, restaurant = old
+            queue = self.queues[restaurant]
+            if side == "inside":
+                queue.dequeue_inside(client)
+            else:
+                queue.dequeue_outside(client)
+        if new:
+            side, restaurant = new
+            queue = self.queues[restaurant]
+            if side == "inside":
+                queue.enqueue_inside(client)
+            else:
+                queue.enqueue_outside(client)
@@ -1,21 +1,29 @@
+import copy
 import random
-import time
 from game.audio import play_sound
+from game.clock import wall_clock
 
 class Sabotage:
-    def __init__(self, name, cost, sabotage_type, effect_func, cooldown=0, requires_proximity=False):
+    def __init__(self, name, cost, sabotage_type, effect_func, cooldown=0, requires_proximity=False, clock=None):
         self.name = name
         self.cost = cost
         self.sabotage_type = sabotage_type
         self.effect_func = effect_func
         self.cooldown = cooldown
         self.requires_proximity = requires_proximity
-        self.last_used = 0
+        self.clock = clock or wall_clock
+        self.last_used = None  # Jamais utilisé
+        
+    def get_cooldown_remaining(self):
+        """Temps restant avant de pouvoir réutiliser ce sabotage"""
+        if self.last_used is None:
+            return 0
+        return max(0, self.cooldown - (self.clock.now() - self.last_used))
         
     def can_execute(self, executor_player, target_player):
         """Vérifie si le sabotage peut être exécuté"""
         # Vérifier le cooldown
-        if time.time() - self.last_used < self.cooldown:
+        if self.get_cooldown_remaining() > 0:
             return False, "En recharge"
             
         # Vérifier l'argent
@@ -45,7 +53,7 @@ class Sabotage:
         result = self.effect_func(executor_player, target_player)
         
         # Mettre à jour le cooldown
-        self.last_used = time.time()
+        self.last_used = self.clock.now()
         
         play_sound('sabotage', 'sabotage')
         
@@ -123,18 +131,27 @@ SABOTAGES = {
 
 
 class SabotageManager:
-    """Gestionnaire des sabotages en cours"""
+    """Gestionnaire des sabotages en cours.
+    Chaque partie travaille sur sa propre copie de SABOTAGES (cooldowns propres à la partie,
+    mesurés sur l'horloge de simulation)."""
     
-    def __init__(self):
+    def __init__(self, clock=None):
+        self.clock = clock or wall_clock
+        self.sabotages = {}
+        for name, template in SABOTAGES.items():
+            sabotage = copy.copy(template)
+            sabotage.clock = self.clock
+            sabotage.last_used = None
+            self.sabotages[name] = sabotage
         self.active_sabotages = []
         self.sabotage_history = []
         
     def execute_sabotage(self, sabotage_name, executor, target):
         """Exécute un sabotage"""
-        if sabotage_name not in SABOTAGES:
+        if sabotage_name not in self.sabotages:
             return False, "Sabotage inconnu"
             
-        sabotage = SABOTAGES[sabotage_name]
+        sabotage = self.sabotages[sabotage_name]
         success, message = sabotage.execute(executor, target)
         
         if success:
@@ -142,7 +159,7 @@ class SabotageManager:
                 'name': sabotage_name,
                 'executor': executor.id,
                 'target': target.id,
-                'time': time.time(),
+                'time': self.clock.now(),
                 'message': message
             })
             
@@ -151,9 +168,9 @@ class SabotageManager:
     def get_available_sabotages(self, player):
         """Retourne les sabotages disponibles pour un joueur"""
         available = []
-        for name, sabotage in SABOTAGES.items():
+        for name, sabotage in self.sabotages.items():
             if player.money >= sabotage.cost:
-                cooldown_remaining = max(0, sabotage.cooldown - (time.time() - sabotage.last_used))
+                cooldown_remaining = sabotage.get_cooldown_remaining()
                 available.append({
                     'name': name,
                     'display_name': sabotage.name,
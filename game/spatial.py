@@ -0,0 +1,101 @@
+"""
+Hachage spatial (grille uniforme) pour les requêtes de proximité
+Attaque, peur, interaction et ramassage d'armes ne parcourent que les cellules voisines.
+"""
+from config import *
+
+
+class SpatialHash:
+    """Grille uniforme de cellules de `cell_size` pixels.
+
+    Un objet est indexé par un point (insert_point) ou par un rectangle (insert_rect, dans toutes
+    les cellules qu'il touche). Les résultats sont rendus dans l'ordre d'insertion, pour que les
+    égalités se départagent comme un parcours de liste (simulations déterministes).
+    """
+
+    def __init__(self, cell_size=TILE_SIZE * 2):
+        self.cell_size = cell_size
+        self.cells = {}    # (cx, cy) -> [objets]
+        self.entries = {}  # objet -> (ordre d'insertion, cellules)
+        self._next_seq = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def clear(self):
+        self.cells.clear()
+        self.entries.clear()
+        self._next_seq = 0
+
+    def _cell(self, x, y):
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def _cells_in(self, left, top, right, bottom):
+        cx1, cy1 = self._cell(left, top)
+        cx2, cy2 = self._cell(right, bottom)
+        return [(cx, cy) for cy in range(cy1, cy2 + 1) for cx in range(cx1, cx2 + 1)]
+
+    def _add(self, obj, cells):
+        if obj in self.entries:
+            self.remove(obj)
+        self.entries[obj] = (self._next_seq, cells)
+        self._next_seq += 1
+        for cell in cells:
+            self.cells.setdefault(cell, []).append(obj)
+
+    def insert_point(self, obj, x, y):
+        self._add(obj, [self._cell(x, y)])
+
+    def insert_rect(self, obj, rect):
+        self._add(obj, self._cells_in(rect.left, rect.top, rect.right - 1, rect.bottom - 1))
+
+    def remove(self, obj):
+        entry = self.entries.pop(obj, None)
+        if entry is None:
+            return
+        for cell in entry[1]:
+            bucket = self.cells.get(cell)
+            if bucket:
+                bucket.remove(obj)
+                if not bucket:
+                    del self.cells[cell]
+
+    def _collect(self, cells):
+        found = {}
+        for cell in cells:
+            for obj in self.cells.get(cell, ()):
+                found[obj] = self.entries[obj][0]
+        return sorted(found, key=found.get)
+
+    def query_rect(self, rect):
+        """Objets des cellules touchées par rect (candidats : à affiner par l'appelant)"""
+        return self._collect(self._cells_in(rect.left, rect.top, rect.right - 1, rect.bottom - 1))
+
+    def query_radius(self, x, y, radius, position):
+        """Objets dont position(obj) est à une distance strictement inférieure à radius de (x, y)"""
+        radius_sq = radius * radius
+        result = []
+        for obj in self._collect(self._cells_in(x - radius, y - radius, x + radius, y + radius)):
+            ox, oy = position(obj)
+            if (ox - x) ** 2 + (oy - y) ** 2 < radius_sq:
+                result.append(obj)
+        return result
+
+    def nearest(self, x, y, radius, position, predicate=None):
+        """Objet le plus proche dans le rayon (et qui vérifie predicate), ou None"""
+        best = None
+        best_dist_sq = float('inf')
+        for obj in self.query_radius(x, y, radius, position):
+            if predicate and not predicate(obj):
+                continue
+            ox, oy = position(obj)
+            dist_sq = (ox - x) ** 2 + (oy - y) ** 2
+            if dist_sq < best_dist_sq:
+                best = obj
+                best_dist_sq = dist_sq
+        return best
+
+
+def rect_center(obj):
+    """Position d'un sprite pour les requêtes de rayon : centre de son rect"""
+    return obj.rect.center
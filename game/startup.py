@@ -0,0 +1,88 @@
+"""
+Démarrage du jeu : chronologie du lancement et écrans construits à la demande
+Les étapes (imports, fenêtre, assets, audio, menus...) sont horodatées depuis le début de main.py ;
+avec --profile-startup, la chronologie est affichée une fois la première frame du menu présentée,
+puis chaque écran construit plus tard est signalé à son ouverture.
+"""
+import time
+
+# Début du lancement : ce module est le premier importé par main.py
+START = time.perf_counter()
+
+
+class StartupProfile:
+    _instance = None
+
+    @classmethod
+    def get(cls):
+        if cls._instance is None:
+            cls._instance = StartupProfile()
+        return cls._instance
+
+    def __init__(self):
+        self.enabled = False
+        self.marks = []  # (étape, ms depuis le début, ms depuis l'étape précédente)
+        self.last = START
+        self.reported = False
+
+    def mark(self, label, start=None):
+        """Horodate une étape (durée : depuis `start`, sinon depuis l'étape précédente).
+        Après le rapport, les étapes sont affichées au fil de l'eau."""
+        now = time.perf_counter()
+        mark = (label, (now - START) * 1000, (now - (self.last if start is None else start)) * 1000)
+        self.marks.append(mark)
+        self.last = now
+        if self.enabled and self.reported:
+            self._print(mark)
+
+    def report(self, target_ms=None):
+        """Affiche la chronologie jusqu'ici (une seule fois)"""
+        if self.reported:
+            return
+        self.reported = True
+        if not self.enabled:
+            return
+        print(f"[Startup] {'depuis le début':>16}{'étape':>10}")
+        for mark in self.marks:
+            self._print(mark)
+        if target_ms is not None and self.marks:
+            total = self.marks[-1][1]
+            verdict = "OK" if total <= target_ms else "dépassé"
+            print(f"[Startup] Première frame en {total:.0f} ms (objectif {target_ms} ms : {verdict})")
+
+    def _print(self, mark):
+        label, since_start, step = mark
+        print(f"[Startup] {since_start:>13.1f} ms{step:>+9.1f} ms  {label}")
+
+
+class LazyScreen:
+    """Écran (menu superposé, renderer...) dont le module n'est importé et l'objet construit
+    qu'au premier usage, par `factory(*args)`. `visible` répond False sans rien construire : la
+    boucle principale peut l'interroger à chaque frame.
+    La fabrique importe son module elle-même (import statique, suivi par PyInstaller)."""
+
+    def __init__(self, name, factory, *args):
+        self._name = name
+        self._factory = factory
+        self._args = args
+        self._screen = None
+
+    @property
+    def built(self):
+        return self._screen is not None
+
+    @property
+    def visible(self):
+        return self._screen is not None and self._screen.visible
+
+    def build(self):
+        if self._screen is None:
+            start = time.perf_counter()
+            self._screen = self._factory(*self._args)
+            StartupProfile.get().mark(f"{self._name} (import et construction)", start)
+        return self._screen
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.build(), name)
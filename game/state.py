@@ -1,21 +1,35 @@
 import pygame
 import random
-import time
+from game.clock import SimulationClock
 from game.map import WorldMap
 from game.player import Player
 from game.client import Client
+from game.client_index import ClientIndex
+from game.crowd import Crowd
+from game.queues import QueueManager
+from game.spatial import SpatialHash, rect_center
 from game.minigames import MiniGame
 from game.events import EventManager
 from game.inventory import WeaponSpawner
 from game.sabotage import SabotageManager, SABOTAGES
 from game.animation import AnimationManager, ServeAnimation, ThiefAnimation
+from game.particles import ParticleSystem, emit_blood
 from game.audio import AudioManager, play_sound
 from game.history import GameHistory
 from config import *
 
 class GameState:
-    def __init__(self, player_configs=None):
-        self.world_map = WorldMap()
+    def __init__(self, player_configs=None, clock=None, world_map=None, record_history=True):
+        # Horloge de simulation à pas fixe, partagée par tous les sous-systèmes de la partie
+        self.clock = clock or SimulationClock()
+        # Entrées reçues pendant une frame sans tick (rejouées au tick suivant)
+        self._pending_events = []
+        self._pending_actions = []
+        
+        # La carte est statique : le mode sans fenêtre la réutilise d'une partie à l'autre
+        self.world_map = world_map or WorldMap()
+        # False pour les simulations en lot (ne pas polluer l'historique du joueur)
+        self.record_history = record_history
         
         # Default configs if not provided
         if player_configs is None:
@@ -30,9 +44,14 @@ class GameState:
         
         # Joueur index 0 = écran GAUCHE, joueur index 1 = écran DROIT (split_screen affiche 0 à gauche, 1 à droite)
         # Chaque joueur garde son restaurant (tacos ou kebab) selon la config
+        # Particules (sang, poussière) : tableaux NumPy et sprites partagés, capacité fixe
+        self.particles = ParticleSystem(capacity=PARTICLE_CAPACITY, clock=self.clock)
+        
         self.players = [
-            Player(1, 5, 5, PLAYER_1_COLOR, left_config["restaurant"], username=left_config["name"]),
-            Player(2, 5, 5, PLAYER_2_COLOR, right_config["restaurant"], username=right_config["name"])
+            Player(1, 5, 5, PLAYER_1_COLOR, left_config["restaurant"], username=left_config["name"],
+                   clock=self.clock, particles=self.particles),
+            Player(2, 5, 5, PLAYER_2_COLOR, right_config["restaurant"], username=right_config["name"],
+                   clock=self.clock, particles=self.particles)
         ]
         self.players[0].owns_restaurant = left_config["restaurant"]
         self.players[1].owns_restaurant = right_config["restaurant"]
@@ -41,24 +60,35 @@ class GameState:
         self.player_configs = player_configs
         
         self.clients = []
-        self.last_spawn_time = time.time()
+        # Index (zone, target_zone, state) tenu à jour par les clients : évite de filtrer self.clients
+        self.client_index = ClientIndex()
+        # Files d'attente des restaurants, mises à jour par l'index à chaque changement de zone/état
+        self.queues = QueueManager(self.world_map)
+        self.client_index.on_change = self.queues.on_client_change
+        # Données des clients en tableaux NumPy : passants, directions et patience vectorisés
+        self.crowd = Crowd(self.world_map, self.clock, seed=random.getrandbits(32))
+        # Grilles spatiales des clients par zone, reconstruites à la demande (invalidées à chaque pas)
+        self._client_grids = {}
+        self.last_spawn_time = self.clock.now()
         self.spawn_interval = 8.0
+        # Patience des clients en file (réglable pour l'équilibrage)
+        self.client_patience = CLIENT_PATIENCE
         
         # Clients qui se baladent dans la rue
-        self.last_wander_spawn_time = time.time()
+        self.last_wander_spawn_time = self.clock.now()
         self.wander_spawn_interval = 1.0
         self.wandering_clients_limit = 20
         
         self.event_manager = EventManager(self)
         
         # Nouveau: Gestionnaire d'armes
-        self.weapon_spawner = WeaponSpawner()
+        self.weapon_spawner = WeaponSpawner(clock=self.clock)
         
         # Nouveau: Gestionnaire de sabotages
-        self.sabotage_manager = SabotageManager()
+        self.sabotage_manager = SabotageManager(clock=self.clock)
         
         # Nouveau: Gestionnaire d'animations global
-        self.animation_manager = AnimationManager()
+        self.animation_manager = AnimationManager(clock=self.clock)
 
         # Animations de voleur (sabotage) par zone
         self.thief_animations = []
@@ -66,7 +96,7 @@ class GameState:
         # Nouveau: Audio
         self.audio = AudioManager.get()
         
-        self.start_time = time.time()
+        self.start_time = self.clock.now()
         self.game_duration = DEFAULT_DURATION
         self.game_over = False
         
@@ -83,11 +113,35 @@ class GameState:
         for _ in range(3):
             self.spawn_client(force_target_restaurant="kebab")
         
-    def update(self, events, input_action):
+    def update(self, events, input_action, real_dt=None):
+        """Avance la partie.
+        input_action: (player_idx, action_type), None, ou une liste de ces tuples (un par joueur).
+        real_dt: temps réel écoulé depuis la frame précédente (secondes). Il est accumulé par
+        l'horloge qui exécute 0, 1 ou plusieurs ticks fixes (rattrapage). Sans real_dt, exactement
+        un tick est simulé (mode sans fenêtre, simulation plus rapide que le temps réel)."""
         if self.game_over:
             return
-            
-        elapsed = time.time() - self.start_time
+        
+        ticks = 1 if real_dt is None else self.clock.advance(real_dt)
+        
+        # Ne jamais perdre une entrée reçue pendant une frame sans tick
+        self._pending_events.extend(events or [])
+        if isinstance(input_action, list):
+            self._pending_actions.extend(a for a in input_action if a)
+        elif input_action:
+            self._pending_actions.append(input_action)
+        
+        for _ in range(ticks):
+            if self.game_over:
+                break
+            events, self._pending_events = self._pending_events, []
+            input_actions, self._pending_actions = self._pending_actions, []
+            self.clock.tick()
+            self._tick(events, input_actions)
+    
+    def _tick(self, events, input_actions):
+        """Un pas fixe de simulation"""
+        elapsed = self.clock.now() - self.start_time
         remaining = self.game_duration - elapsed
         
         # Warning sonore à 30 secondes
@@ -104,14 +158,19 @@ class GameState:
             else:
                 play_sound('game_over', 'ui')
             # Enregistrer la partie dans l'historique
-            GameHistory.get().record_game(self)
+            if self.record_history:
+                GameHistory.get().record_game(self)
             return
         
+        # Les clients ont bougé depuis le pas précédent
+        self._client_grids.clear()
+
         # Mise à jour des armes
         self.weapon_spawner.update()
         
         # Mise à jour des animations globales
         self.animation_manager.update()
+        self.particles.update(self.clock.dt)
 
         # Mise à jour des animations voleur (update pour faire avancer le temps, puis retirer les terminées)
         for a in self.thief_animations:
@@ -158,9 +217,8 @@ class GameState:
                         (player.rect.centerx, player.rect.top - 50),
                         YELLOW
                     )
-                if player.current_client in self.clients:
-                    self.clients.remove(player.current_client)
-                    self._recompute_queues()
+                if player.current_client in self.client_index:
+                    self.remove_client(player.current_client)
                 player.current_client = None
                 player.serve_animation = None
                 continue
@@ -176,7 +234,7 @@ class GameState:
                         kitchen_pos = (kitchen_tile_x * TILE_SIZE, kitchen_tile_y * TILE_SIZE)
                         client_pos = (player.current_client.rect.x, player.current_client.rect.y)
                         start_pos = (player.rect.x, player.rect.y)
-                        player.serve_animation = ServeAnimation(start_pos, kitchen_pos, client_pos)
+                        player.serve_animation = ServeAnimation(start_pos, kitchen_pos, client_pos, clock=self.clock)
                         player.active_minigame = None
                         continue
                     else:
@@ -201,13 +259,11 @@ class GameState:
                     continue
 
                 player.active_minigame = None
-                if player.current_client in self.clients:
-                    self.clients.remove(player.current_client)
-                    self._recompute_queues()
+                if player.current_client in self.client_index:
+                    self.remove_client(player.current_client)
                 player.current_client = None
 
-        if input_action:
-            player_idx, action_type = input_action
+        for player_idx, action_type in input_actions:
             if action_type == "interact":
                 self.handle_interaction(player_idx)
             elif action_type == "attack":
@@ -217,20 +273,19 @@ class GameState:
             elif action_type == "sweep":
                 self.handle_sweep(player_idx)
 
-        if time.time() - self.last_spawn_time > self.spawn_interval:
+        if self.clock.now() - self.last_spawn_time > self.spawn_interval:
             self.spawn_client()
-            self.last_spawn_time = time.time()
+            self.last_spawn_time = self.clock.now()
             
         # Spawn de clients qui se baladent dans la rue
-        if time.time() - self.last_wander_spawn_time > self.wander_spawn_interval:
-            street_total = len([c for c in self.clients if c.zone == "street"])
-            if street_total < self.wandering_clients_limit:
+        if self.clock.now() - self.last_wander_spawn_time > self.wander_spawn_interval:
+            if self.client_index.count_zone("street") < self.wandering_clients_limit:
                 self._spawn_wandering_client()
-            self.last_wander_spawn_time = time.time()
+            self.last_wander_spawn_time = self.clock.now()
             
         # Vérifier les clients qui ont perdu patience et partent
-        for client in self.clients:
-            if client.state == "angry" and not hasattr(client, '_left_penalty_applied'):
+        for client in self.client_index.query(states=("angry",)):
+            if not hasattr(client, '_left_penalty_applied'):
                 # Client impatient qui s'en va
                 client._left_penalty_applied = True
                 client.flee()
@@ -246,14 +301,44 @@ class GameState:
                     )
             
         # Nettoyer les clients morts ou partis
-        self.clients = [c for c in self.clients if c.is_alive()]
+        for client in self.client_index.query(states=("dead", "gone")):
+            self.remove_client(client)
             
         # Mettre à jour les clients avec la logique de déplacement
+        # (les passants ne passent par Client.update que pour trembler de peur)
         for client in self.clients:
-            client.update(self.world_map, self)
+            if client._position_owner is None or client.fear_level > 0:
+                client.update(self.world_map, self)
+
+        # Passants et patience des files : quelques opérations vectorisées
+        self.crowd.update(self)
             
         self.event_manager.update()
         
+    def add_client(self, client):
+        """Ajoute un client à la partie (liste + index)"""
+        self.clients.append(client)
+        self.client_index.add(client)
+        self.crowd.add(client)
+        self._client_grids.pop(client.zone, None)
+
+    def remove_client(self, client):
+        """Retire un client de la partie (liste + index)"""
+        self.clients.remove(client)
+        self.client_index.remove(client)
+        self.crowd.remove(client)
+        self._client_grids.pop(client.zone, None)
+
+    def client_grid(self, zone_name):
+        """Grille spatiale des clients d'une zone (centres des rects), construite au premier appel du pas"""
+        grid = self._client_grids.get(zone_name)
+        if grid is None:
+            grid = SpatialHash()
+            for client in self.client_index.in_zone(zone_name):
+                grid.insert_point(client, *client.rect.center)
+            self._client_grids[zone_name] = grid
+        return grid
+
     def _get_restaurant_owner(self, zone_name):
         """Retourne le joueur propriétaire d'un restaurant"""
         for player in self.players:
@@ -278,10 +363,10 @@ class GameState:
             )
             return
         
-        for client in self.clients:
-            # Le client doit être dans le restaurant dont ce joueur est propriétaire (évite qu'un vendeur serve dans le resto de l'autre)
-            if client.zone != player_restaurant:
-                continue
+        # Seulement les clients du restaurant dont ce joueur est propriétaire (évite qu'un vendeur serve dans le resto de l'autre)
+        nearby = self.client_grid(player_restaurant).query_radius(
+            player.rect.centerx, player.rect.centery, TILE_SIZE * 2, rect_center)
+        for client in nearby:
             # Ne pas permettre de servir un client déjà pris en charge par un autre joueur
             if any(p.current_client == client for p in self.players if p != player):
                 continue
@@ -303,7 +388,7 @@ class GameState:
                     
             if collision:
                 player.current_client = client
-                player.active_minigame = MiniGame(client.dish.name, player_idx)
+                player.active_minigame = MiniGame(client.dish.name, player_idx, clock=self.clock)
                 play_sound('serve', f'player{player.id}')
                 return
                 
@@ -315,19 +400,10 @@ class GameState:
             return
             
         # Trouver le client le plus proche à portée
-        closest_client = None
-        closest_distance = float('inf')
-        
-        for client in self.clients:
-            if client.zone != player.current_zone:
-                continue
-            if not client.is_targetable():
-                continue
-                
-            distance = player.get_distance_to(client)
-            if distance < closest_distance and player.can_attack_client(client):
-                closest_client = client
-                closest_distance = distance
+        # can_attack_client vérifie la portée exacte de l'arme (au plus TILE_SIZE * 2)
+        closest_client = self.client_grid(player.current_zone).nearest(
+            player.rect.centerx, player.rect.centery, TILE_SIZE * 2 + 1, rect_center,
+            predicate=lambda c: c.is_targetable() and player.can_attack_client(c))
                 
         if closest_client:
             # Lancer l'attaque
@@ -338,7 +414,9 @@ class GameState:
                 player.attacks_made += 1
                 player.mission_manager.update('attack')
                 # Infliger les dégâts
-                closest_client.take_damage(weapon.damage, weapon.weapon_type)
+                if closest_client.take_damage(weapon.damage, weapon.weapon_type):
+                    emit_blood(self.particles, closest_client.rect.x, closest_client.rect.y,
+                               closest_client.zone)
                 
                 # Déterminer qui subit la pénalité de réputation
                 # Si on tue dans le restaurant de l'autre, c'est le propriétaire qui perd de la rep
@@ -371,17 +449,14 @@ class GameState:
                     )
                 
                 # Les autres clients à proximité ont peur
-                for other_client in self.clients:
-                    if other_client == closest_client:
-                        continue
-                    if other_client.zone != player.current_zone:
-                        continue
-                        
-                    dist = ((other_client.rect.centerx - closest_client.rect.centerx)**2 + 
-                           (other_client.rect.centery - closest_client.rect.centery)**2)**0.5
-                    
-                    if dist < TILE_SIZE * 4:
+                nearby = self.client_grid(player.current_zone).query_radius(
+                    closest_client.rect.centerx, closest_client.rect.centery, TILE_SIZE * 4, rect_center)
+                for other_client in nearby:
+                    if other_client != closest_client:
                         other_client.scare(intensity=1.5)
+
+                # Des clients ont pu être repoussés ou changer de zone
+                self._client_grids.clear()
                 
     def handle_sabotage(self, player_idx, sabotage_name):
         """Exécute un sabotage"""
@@ -393,7 +468,7 @@ class GameState:
         if success:
             if sabotage_name == 'thief':
                 target_zone = getattr(target, 'owns_restaurant', 'tacos' if target.id == 1 else 'kebab')
-                self.thief_animations.append(ThiefAnimation(zone_name=target_zone))
+                self.thief_animations.append(ThiefAnimation(zone_name=target_zone, clock=self.clock))
             player.animation_manager.add_floating_text(
                 message,
                 (player.rect.centerx, player.rect.top - 30),
@@ -482,108 +557,6 @@ class GameState:
             return success, message
         return False, "Impossible de voler la broche ici"
 
-    def _get_queue_config(self, target_restaurant):
-        """Renvoie (queue_x, queue_start_y, max_length) pour un resto donné."""
-        restaurant_zone = self.world_map.get_zone(target_restaurant)
-        if not restaurant_zone:
-            return None, None, 0
-
-        # Porte intérieure du resto (en bas de la salle)
-        door_inside_x = restaurant_zone.width // 2
-        for door in restaurant_zone.doors:
-            dx, dy, *_ = door
-            if dy == restaurant_zone.height - 1:
-                door_inside_x = dx
-                break
-
-        # File légèrement différente selon le resto
-        if target_restaurant == "tacos":
-            queue_x = max(1, door_inside_x - 1)
-        else:
-            queue_x = door_inside_x
-
-        # Premier client de la file : juste devant le comptoir
-        queue_start_y = 3
-        max_queue_length = max(0, (restaurant_zone.height - 1) - queue_start_y)
-
-        return queue_x, queue_start_y, max_queue_length
-
-    def _recompute_queues(self):
-        """Réorganise les files de chaque restaurant (dedans et dehors)."""
-        street_zone = self.world_map.get_zone("street")
-        for c in self.clients:
-            c.is_first_in_queue = False
-
-        for restaurant in ["tacos", "kebab"]:
-            queue_x, queue_start_y, max_len = self._get_queue_config(restaurant)
-            if queue_x is None:
-                continue
-
-            # --- File intérieure ---
-            inside_clients = [
-                c for c in self.clients
-                if c.target_zone == restaurant
-                and c.zone == restaurant
-            ]
-
-            # Trie par position verticale actuelle pour garder l'ordre naturel
-            inside_clients.sort(key=lambda c: c.rect.centery)
-            inside_clients = inside_clients[:3]  # Max 3 clients à l'intérieur
-
-            for idx, client in enumerate(inside_clients):
-                if idx >= max_len:
-                    break
-                client.queue_tile_x = queue_x
-                client.queue_tile_y = queue_start_y + idx
-                client.is_first_in_queue = (idx == 0)
-                # S'il n'est pas déjà bien positionné, on le remet en mouvement
-                target_px = client.queue_tile_x * TILE_SIZE + TILE_SIZE // 2
-                target_py = client.queue_tile_y * TILE_SIZE + TILE_SIZE // 2
-                dist = ((client.rect.centerx - target_px) ** 2 + (client.rect.centery - target_py) ** 2) ** 0.5
-                if dist > 4 and client.state not in ['angry', 'fleeing', 'dying', 'dead', 'gone']:
-                    client.state = "walking_to_queue"
-
-            # --- File extérieure devant le resto ---
-            if not street_zone:
-                continue
-
-            # Porte dans la rue vers ce restaurant
-            street_door = None
-            for door in street_zone.doors:
-                dx, dy, target_zone, _, _ = door
-                if target_zone == restaurant:
-                    street_door = door
-                    break
-
-            if not street_door:
-                continue
-
-            door_x, door_y, _, _, _ = street_door
-
-            outside_clients = [
-                c for c in self.clients
-                if c.zone == "street"
-                and getattr(c, "target_zone", None) == restaurant
-                and c.state in ("walking_to_restaurant", "waiting_outside")
-            ]
-
-            # Trie par distance à la porte pour ordonner la file
-            def dist_to_door(client):
-                cx = client.rect.centerx
-                cy = client.rect.centery
-                door_cx = door_x * TILE_SIZE + TILE_SIZE // 2
-                door_cy = door_y * TILE_SIZE + TILE_SIZE // 2
-                return ((cx - door_cx) ** 2 + (cy - door_cy) ** 2) ** 0.5
-
-            outside_clients.sort(key=dist_to_door)
-
-            # Place au maximum 3 clients dehors
-            for idx, client in enumerate(outside_clients[:3]):
-                client.outside_tile_x = door_x
-                client.outside_tile_y = min(street_zone.height - 1, door_y + 1 + idx)
-                if client.state in ("walking_to_restaurant", "waiting_outside"):
-                    client.state = "waiting_outside"
-
     def spawn_client(self, force_target_restaurant=None):
         """Fait apparaître un client qui va vers un restaurant.
         Si force_target_restaurant est donné, le client va vers ce restaurant.
@@ -609,25 +582,15 @@ class GameState:
             return
 
         # Limite globale de clients présents dans la rue
-        street_total = len([c for c in self.clients if c.zone == "street"])
-        if street_total >= self.wandering_clients_limit:
+        if self.client_index.count_zone("street") >= self.wandering_clients_limit:
             return
 
         # Maximum 3 clients qui attendent à l'extérieur pour ce resto
-        outside_clients = [
-            c for c in self.clients
-            if c.zone == "street" and getattr(c, "target_zone", None) == target_restaurant
-        ]
-        if len(outside_clients) >= 3:
+        if self.client_index.count_outside(target_restaurant) >= 3:
             return
 
         # Cherche la porte de rue qui mène à ce restaurant
-        street_door = None
-        for door in street_zone.doors:
-            dx, dy, target_zone, _, _ = door
-            if target_zone == target_restaurant:
-                street_door = door
-                break
+        street_door = street_zone.get_door_to(target_restaurant)
 
         if not street_door:
             # Fallback: spawn directement dans le restaurant
@@ -635,10 +598,10 @@ class GameState:
             if zone:
                 x = random.randint(2, zone.width - 3)
                 y = random.randint(4, zone.height - 2)
-                client = Client(x * TILE_SIZE, y * TILE_SIZE, target_restaurant, target_zone=target_restaurant)
+                client = Client(x * TILE_SIZE, y * TILE_SIZE, target_restaurant, target_zone=target_restaurant, clock=self.clock, patience=self.client_patience)
                 client.state = "waiting"
-                client.spawn_time = time.time()
-                self.clients.append(client)
+                client.spawn_time = self.clock.now()
+                self.add_client(client)
                 play_sound('client_spawn', 'client')
             return
 
@@ -648,31 +611,14 @@ class GameState:
         spawn_x = door_x
         spawn_y = min(street_zone.height - 1, door_y + 2)
 
-        # Calcule la file d'attente dans le restaurant
-        queue_x, queue_start_y, max_queue_length = self._get_queue_config(target_restaurant)
-        if queue_x is None:
+        # Pas de file d'attente possible dans ce restaurant
+        layout = self.world_map.get_queue_layout(target_restaurant)
+        if not layout or not layout.inside_slots:
             return
 
-        # Tous les clients qui visent le même restaurant et sont à l'intérieur
-        restaurant_clients = [
-            c for c in self.clients
-            if getattr(c, "target_zone", None) == target_restaurant
-            and c.zone == target_restaurant
-        ]
-        queue_index = min(len(restaurant_clients), 2)  # max 3 clients (0,1,2)
-
-        if queue_index >= max_queue_length:
-            return
-
-        queue_y = queue_start_y + queue_index
-
-        # Création du client: il apparaît dans la rue
-        client = Client(spawn_x * TILE_SIZE, spawn_y * TILE_SIZE, zone="street", target_zone=target_restaurant)
-        client.queue_tile_x = queue_x
-        client.queue_tile_y = queue_y
-
-        self.clients.append(client)
-        self._recompute_queues()
+        # Création du client: il apparaît dans la rue et rejoint la file extérieure (GameState.queues)
+        client = Client(spawn_x * TILE_SIZE, spawn_y * TILE_SIZE, zone="street", target_zone=target_restaurant, clock=self.clock, patience=self.client_patience)
+        self.add_client(client)
         play_sound('client_spawn', 'client')
 
     def _spawn_wandering_client(self):
@@ -686,26 +632,32 @@ class GameState:
             x = random.randint(0, street_zone.width - 1)
             y = random.randint(4, street_zone.height - 1)
             if street_zone.is_walkable(x, y):
-                client = Client(x * TILE_SIZE, y * TILE_SIZE, zone="street", target_zone=None)
-                self.clients.append(client)
+                client = Client(x * TILE_SIZE, y * TILE_SIZE, zone="street", target_zone=None, clock=self.clock, patience=self.client_patience)
+                self.add_client(client)
                 return
         
     def get_remaining_time(self):
-        elapsed = time.time() - self.start_time
+        elapsed = self.clock.now() - self.start_time
         remaining = max(0, self.game_duration - elapsed)
         return int(remaining)
             
-    def draw_zone(self, surface, camera, zone_name):
+    def draw_zone(self, surface, camera, zone_name, view=None):
+        """Dessine une zone et ses entités. Seules celles qui touchent `view` (coordonnées monde,
+        par défaut la vue de la caméra) sont dessinées, avec une marge pour bulles et indicateurs."""
         zone = self.world_map.get_zone(zone_name)
         if zone:
             self.world_map.draw_zone(zone, surface, camera)
+        view = (view or camera.view_rect).inflate(DRAW_CULL_MARGIN * 2, DRAW_CULL_MARGIN * 2)
             
         # Dessiner les armes au sol
-        self.weapon_spawner.draw(surface, camera, zone_name)
+        self.weapon_spawner.draw(surface, camera, zone_name, view)
+
+        # Particules (sang, poussière) : derrière les personnages
+        self.particles.draw(surface, camera, zone_name, view)
             
         # Dessiner les clients
-        for client in self.clients:
-            if client.zone == zone_name:
+        for client in self.client_index.in_zone(zone_name):
+            if view.colliderect(client.rect):
                 client.draw(surface, camera)
                 
         # Dessiner les animations globales
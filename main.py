@@ -1,21 +1,17 @@
+import argparse
 import os
-import pygame
 import sys
-import time
+from game.startup import StartupProfile, LazyScreen
+import pygame
+StartupProfile.get().mark("import pygame")
 from config import *
-from game.state import GameState
-from rendering.split_screen import SplitScreenRenderer
 from rendering.menu import MenuRenderer
-from rendering.inventory_menu import InventoryMenu
-from rendering.carte_menu import CarteMenu
-from rendering.keybind_menu import KeybindMenu
-from rendering.history_menu import HistoryMenu
-from rendering.tutorial_menu import TutorialMenu
-from rendering.mission_display import MissionDisplay, MissionNotification
-from rendering.intro_cutscene import IntroCutscene
+from rendering.compositor import FrameCompositor
 from input.controls import InputHandler, get_key_bindings
 from game.assets_loader import Assets, get_resource_path
 from game.audio import AudioManager, play_sound
+# La partie, l'intro et les menus superposés sont importés à leur première ouverture (LazyScreen)
+StartupProfile.get().mark("imports du menu principal")
 
 # Game States
 STATE_MENU = "menu"
@@ -26,9 +22,53 @@ STATE_PAUSED = "paused"
 STATE_KEYBIND = "keybind"
 
 
+# Écrans construits à la demande (LazyScreen). Les imports restent écrits en toutes lettres dans
+# ces fabriques pour que PyInstaller les suive et embarque les modules dans l'exécutable.
+def make_split_screen(screen):
+    from rendering.split_screen import SplitScreenRenderer
+    return SplitScreenRenderer(screen)
+
+
+def make_inventory_menu(screen):
+    from rendering.inventory_menu import InventoryMenu
+    return InventoryMenu(screen)
+
+
+def make_carte_menu(screen):
+    from rendering.carte_menu import CarteMenu
+    return CarteMenu(screen)
+
+
+def make_keybind_menu(screen):
+    from rendering.keybind_menu import KeybindMenu
+    return KeybindMenu(screen)
+
+
+def make_history_menu(screen):
+    from rendering.history_menu import HistoryMenu
+    return HistoryMenu(screen)
+
+
+def make_tutorial_menu(screen):
+    from rendering.tutorial_menu import TutorialMenu
+    return TutorialMenu(screen)
+
+
+def make_mission_display():
+    from rendering.mission_display import MissionDisplay
+    return MissionDisplay()
+
+
+def make_mission_notification():
+    from rendering.mission_display import MissionNotification
+    return MissionNotification()
+
+
 class Game:
-    def __init__(self):
+    def __init__(self, window_size=None, scale_filter=WINDOW_SCALE_FILTER, render_size=None):
+        profile = StartupProfile.get()
         pygame.init()
+        profile.mark("pygame.init")
 
         # Icône de fenêtre (à définir avant set_mode)
         try:
@@ -39,39 +79,61 @@ class Game:
         except Exception:
             pass
 
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        # HUD et menus sont dessinés en SCREEN_WIDTH x SCREEN_HEIGHT (les vues de la partie à la taille
+        # de rendu, puis agrandies) ; une fenêtre d'une autre taille reçoit l'image mise à l'échelle
+        # par le compositeur
+        window_size = window_size or (WINDOW_WIDTH, WINDOW_HEIGHT)
+        self.window = pygame.display.set_mode(window_size)
+        if window_size == (SCREEN_WIDTH, SCREEN_HEIGHT):
+            self.screen = self.window
+        else:
+            self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
         pygame.display.set_caption("SnackAnarchy")
+        profile.mark("fenêtre")
         
-        # Load Assets
-        Assets.get().load_images()
+        # Load Assets : le menu n'attend que ses sprites, le reste se décode pendant qu'il s'affiche
+        assets = Assets.get()
+        assets.set_render_height((render_size or (RENDER_WIDTH, RENDER_HEIGHT))[1])
+        assets.load_group("menu")
+        assets.request("game")
+        profile.mark("sprites du menu")
         
         # Initialiser l'audio
         self.audio = AudioManager.get()
+        self.audio.prepare_music()  # musique de la partie générée en arrière-plan pendant le menu
+        profile.mark("audio")
         
         self.clock = pygame.time.Clock()
+        self.frame_dt = 1.0 / FPS  # Durée réelle de la frame précédente (secondes)
         self.running = True
         
         # Game state management
         self.current_state = STATE_MENU
         self.game_state = None
-        self.pause_start_time = None
-        self.total_pause_time = 0
         self.intro_cutscene = None
         self.pending_player_configs = None
         self.intro_just_started = False
         self._menu_music_started = False
         
-        # Renderers
-        self.renderer = SplitScreenRenderer(self.screen)
+        # Renderers : seul le menu principal est construit d'avance, les autres écrans le sont
+        # (avec leurs imports) à leur première ouverture
         self.menu_renderer = MenuRenderer(self.screen)
-        self.inventory_menu = InventoryMenu(self.screen)
-        self.carte_menu = CarteMenu(self.screen)
-        self.keybind_menu = KeybindMenu(self.screen)
-        self.history_menu = HistoryMenu(self.screen)
-        self.tutorial_menu = TutorialMenu(self.screen)
-        self.mission_display = MissionDisplay()
-        self.mission_notification = MissionNotification()
+        self.renderer = LazyScreen("SplitScreenRenderer", make_split_screen, self.screen)
+        self.inventory_menu = LazyScreen("InventoryMenu", make_inventory_menu, self.screen)
+        self.carte_menu = LazyScreen("CarteMenu", make_carte_menu, self.screen)
+        self.keybind_menu = LazyScreen("KeybindMenu", make_keybind_menu, self.screen)
+        self.history_menu = LazyScreen("HistoryMenu", make_history_menu, self.screen)
+        self.tutorial_menu = LazyScreen("TutorialMenu", make_tutorial_menu, self.screen)
+        self.mission_display = LazyScreen("MissionDisplay", make_mission_display)
+        self.mission_notification = LazyScreen("MissionNotification", make_mission_notification)
         self.input_handler = InputHandler()
+        profile.mark("menu principal")
+
+        # Présentation des frames (zones modifiées seulement quand c'est possible)
+        self.compositor = FrameCompositor(self.screen, self.window, scale_filter)
+        self._scene = None
+        # Partie figée + voile de pause, capturés à l'entrée en pause
+        self.pause_background = None
         
         # Key bindings
         self.key_bindings = get_key_bindings()
@@ -79,15 +141,17 @@ class Game:
     def start_game(self, player_configs=None):
         """Lance l'intro puis la partie (après la cinématique ou skip)."""
         self.pending_player_configs = player_configs
+        Assets.get().load_group("game")  # déjà décodé en arrière-plan, sauf départ très rapide
+        from rendering.intro_cutscene import IntroCutscene
         self.intro_cutscene = IntroCutscene(self.screen, player_configs)
         self.current_state = STATE_INTRO
-        self.total_pause_time = 0
         play_sound('menu_select', 'ui')
         pygame.event.clear()
         self.intro_just_started = True
 
     def _start_playing_after_intro(self):
         """Appelé à la fin de l'intro : crée la partie et passe en jeu."""
+        from game.state import GameState
         self.game_state = GameState(self.pending_player_configs)
         self.current_state = STATE_PLAYING
         self.intro_cutscene = None
@@ -105,24 +169,24 @@ class Game:
         """Pause the game"""
         if self.current_state == STATE_PLAYING and self.game_state is not None:
             self.current_state = STATE_PAUSED
-            self.pause_start_time = time.time()
+            # L'horloge de simulation s'arrête : timers, cooldowns et patience sont gelés
+            self.game_state.clock.pause()
+            self.pause_background = None
             self.menu_renderer.reset_pause_selection()
             play_sound('menu_select', 'ui')
             
     def resume_game(self):
         """Resume the game from pause"""
-        if self.current_state == STATE_PAUSED and self.pause_start_time:
-            pause_duration = time.time() - self.pause_start_time
-            self.total_pause_time += pause_duration
-            if self.game_state:
-                self.game_state.start_time += pause_duration
-            self.pause_start_time = None
+        if self.current_state == STATE_PAUSED and self.game_state:
+            self.game_state.clock.resume()
         self.current_state = STATE_PLAYING
+        self.pause_background = None
         
     def return_to_menu(self):
         """Return to main menu"""
         self.current_state = STATE_MENU
         self.game_state = None
+        self.pause_background = None
         self.menu_renderer.reset_to_main_menu()
         self.audio.stop_music()
         
@@ -140,7 +204,28 @@ class Game:
         if not was_visible:
             play_sound('menu_select', 'ui')
         
+    def _draw_paused(self, redraw_all, input_received=True):
+        """Menu pause sur une image figée de la partie : seule la zone du menu est redessinée,
+        et sans entrée seules ses parties animées sont présentées"""
+        if self.pause_background is None:
+            self.renderer.draw(self.game_state)
+            self.compositor.invalidate_rects(self.renderer.get_hud_dirty_rects())
+            self.menu_renderer.draw_pause_overlay()
+            self.pause_background = self.screen.copy()
+            self.compositor.invalidate()
+        elif redraw_all:
+            self.screen.blit(self.pause_background, (0, 0))
+        else:
+            menu_rect = self.menu_renderer.pause_menu_rect()
+            self.screen.blit(self.pause_background, menu_rect, menu_rect)
+            if input_received:
+                self.compositor.invalidate(menu_rect)
+            else:
+                self.compositor.invalidate_rects(self.menu_renderer.pause_animated_rects())
+        self.menu_renderer.draw_pause_menu(self.game_state, overlay=False)
+
     def run(self):
+        profile = StartupProfile.get()
         while self.running:
             events = pygame.event.get()
             
@@ -148,6 +233,9 @@ class Game:
                 if event.type == pygame.QUIT:
                     self.running = False
                     continue
+                # Souris : coordonnées de la fenêtre ramenées à la résolution interne
+                if hasattr(event, 'pos'):
+                    event.pos = self.compositor.to_screen(event.pos)
                 
                 # Gérer le menu des touches en priorité s'il est ouvert
                 if self.keybind_menu.visible:
@@ -270,6 +358,7 @@ class Game:
                         if result == "close":
                             play_sound('menu_move', 'ui')
 
+            self.audio.update()
             # Musique du menu principal (démarre en entrant au menu, s'arrête en sortant)
             if self.current_state == STATE_MENU:
                 if not self._menu_music_started:
@@ -278,7 +367,21 @@ class Game:
             else:
                 self._menu_music_started = False
             
+            # Changement d'écran ou de menu superposé (ou fenêtre à repeindre) : toute la frame est
+            # à présenter. Sinon, chaque écran signale les zones qu'il a modifiées.
+            game_over = self.game_state is not None and self.game_state.game_over
+            scene = (self.current_state, self.keybind_menu.visible, self.history_menu.visible,
+                     self.tutorial_menu.visible, game_over)
+            redraw_all = scene != self._scene or any(event.type == pygame.WINDOWEXPOSED for event in events)
+            self._scene = scene
+            if redraw_all:
+                self.compositor.invalidate()
+
             # Update and draw based on current state
+            if self.current_state in (STATE_MENU, STATE_SETUP, STATE_INTRO):
+                # Fond animé plein écran (vidéo, particules, cinématique)
+                self.compositor.invalidate()
+
             if self.current_state == STATE_MENU:
                 self.menu_renderer.draw_main_menu()
                 # Dessiner les menus par-dessus si ouverts
@@ -318,32 +421,90 @@ class Game:
                             if self.inventory_menu.is_visible_for(i) or self.carte_menu.is_visible_for(i)
                         ]
                     )
-                    self.game_state.update(events, action)
+                    self.game_state.update(events, action, self.frame_dt)
                     
-                    self.renderer.draw(self.game_state)
-                    
-                    # Dessiner les inventaires par-dessus si ouverts
-                    if self.inventory_menu.visible:
-                        self.inventory_menu.draw(self.game_state)
-                    # Dessiner les cartes (ingrédients/plats) par-dessus si ouvertes
-                    if self.carte_menu.visible:
-                        self.carte_menu.draw(self.game_state)
+                    # Fin de partie : la simulation est arrêtée, l'écran de fin reste à l'écran
+                    # tel quel jusqu'à la prochaine entrée
+                    if not (game_over and not redraw_all and not events):
+                        self.renderer.draw(self.game_state)
+                        # Les deux vues changent à chaque frame, le HUD à chaque nouvelle valeur
+                        self.compositor.invalidate_rects(self.renderer.view_rects)
+                        self.compositor.invalidate_rects(self.renderer.get_hud_dirty_rects())
+                        
+                        # Dessiner les inventaires par-dessus si ouverts (dans les vues)
+                        if self.inventory_menu.visible:
+                            self.inventory_menu.draw(self.game_state)
+                        # Dessiner les cartes (ingrédients/plats) par-dessus si ouvertes
+                        if self.carte_menu.visible:
+                            self.carte_menu.draw(self.game_state)
                     
             elif self.current_state == STATE_PAUSED:
-                if self.game_state:
-                    self.renderer.draw(self.game_state)
-                    self.menu_renderer.draw_pause_menu(self.game_state)
-                # Dessiner le menu des touches par-dessus si ouvert
                 if self.keybind_menu.visible:
-                    self.keybind_menu.draw()
+                    # Menu des touches (sans animation) sur la partie figée : redessiné
+                    # seulement à l'ouverture et sur une entrée
+                    if redraw_all or events:
+                        if self.game_state:
+                            self._draw_paused(True)
+                        self.keybind_menu.draw()
+                        self.compositor.invalidate()
+                elif self.game_state:
+                    self._draw_paused(redraw_all, bool(events))
             
-            pygame.display.flip()
-            self.clock.tick(FPS)
+            self.compositor.present()
+            if not profile.reported:
+                profile.mark("première frame du menu")
+                profile.report(STARTUP_TARGET_MS)
+            # Menus et pause : cadence réduite (moins de CPU/GPU sur les bornes allumées en continu)
+            idle = self.current_state in (STATE_MENU, STATE_SETUP, STATE_PAUSED)
+            self.frame_dt = self.clock.tick(IDLE_FPS if idle else FPS) / 1000.0
         
+        self.menu_renderer.close()
+        Assets.get().shutdown()
         pygame.quit()
         sys.exit()
 
 
+def parse_window_size(value):
+    try:
+        width, height = (int(v) for v in value.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"taille attendue LARGEURxHAUTEUR, pas {value!r}")
+    return width, height
+
+
+def parse_render_size(value):
+    """Taille de rendu des vues : mêmes proportions que la mise en page, pas plus grande, et des
+    tuiles de taille entière (hauteur multiple de 45 pour 720)"""
+    width, height = parse_window_size(value)
+    if (width * SCREEN_HEIGHT != height * SCREEN_WIDTH or height > SCREEN_HEIGHT
+            or (TILE_SIZE * height) % SCREEN_HEIGHT):
+        raise argparse.ArgumentTypeError(
+            f"taille de rendu {value!r} invalide : {SCREEN_WIDTH}x{SCREEN_HEIGHT} ou moins, mêmes "
+            "proportions et tuiles entières (ex. 960x540, 800x450, 640x360)")
+    return width, height
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="SnackAnarchy")
+    parser.add_argument("--window", type=parse_window_size, default=None,
+                        help="taille de la fenêtre, ex. 960x540 ou 3840x2160 (l'image du jeu y est "
+                             "mise à l'échelle : une petite fenêtre n'allège pas le rendu, voir --render)")
+    parser.add_argument("--render", type=parse_render_size, default=None,
+                        help=f"taille de rendu des vues de la partie, ex. 960x540 (défaut {RENDER_WIDTH}x"
+                             f"{RENDER_HEIGHT}) : le monde est dessiné avec des sprites plus petits puis "
+                             "agrandi, HUD et menus restent nets")
+    parser.add_argument("--scale-filter", choices=("auto", "nearest", "smooth"), default=WINDOW_SCALE_FILTER,
+                        help="filtre de la mise à l'échelle finale (auto : nearest pour réduire, "
+                             "smooth pour agrandir)")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="affiche la chronologie du lancement (imports, assets, audio, menus) "
+                             "jusqu'à la première frame du menu, puis les écrans construits ensuite")
+    # parse_known_args : les lanceurs (bundle macOS...) peuvent ajouter leurs propres arguments
+    return parser.parse_known_args(argv)[0]
+
+
 if __name__ == "__main__":
-    game = Game()
+    args = parse_args()
+    StartupProfile.get().enabled = args.profile_startup
+    game = Game(window_size=args.window, scale_filter=args.scale_filter, render_size=args.render)
     game.run()
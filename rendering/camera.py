@@ -2,12 +2,26 @@ import pygame
 from config import *
 
 class Camera:
-    def __init__(self, width, height):
+    def __init__(self, width, height, scale=1):
         self.camera_rect = pygame.Rect(0, 0, width, height)
         self.width = width
         self.height = height
         self.x = 0
         self.y = 0
+        # Échelle de la surface de rendu : x, y, width et height restent en pixels monde
+        self.scale = scale
+
+    def to_view(self, x, y):
+        """Position monde -> position dans la surface de rendu"""
+        if self.scale == 1:
+            return x - self.x, y - self.y
+        return round((x - self.x) * self.scale), round((y - self.y) * self.scale)
+
+    def pixels(self, length):
+        """Longueur monde (épaisseur, rayon, taille de police...) -> pixels de rendu"""
+        if self.scale == 1:
+            return length
+        return max(1, round(length * self.scale))
         
     def update(self, target, zone):
         """Update camera to follow target within a zone"""
@@ -34,3 +48,8 @@ class Camera:
         self.camera_rect = pygame.Rect(x, y, self.width, self.height)
         self.x = -x
         self.y = -y
+
+    @property
+    def view_rect(self):
+        """Partie de la zone visible (coordonnées monde, en pixels)"""
+        return pygame.Rect(self.x, self.y, self.width, self.height)
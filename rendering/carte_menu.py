@@ -7,6 +7,7 @@ from collections import Counter
 from config import *
 from game.inventory import RECIPES
 from input.controls import get_key_bindings
+from rendering.overlays import veil
 
 # Plats par type de restaurant (noms affichés sur la carte)
 TACOS_DISHES = ['Tacos XXL', 'Tacos M', 'Burritos', 'Nachos', 'Tacos S', 'Tacos L']
@@ -153,9 +154,7 @@ class PlayerCarteMenu:
         player = game_state.players[self.player_idx]
         half_screen = SCREEN_WIDTH // 2
         overlay_x = 0 if self.player_idx == 0 else half_screen
-        overlay = pygame.Surface((half_screen, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 160))
-        self.screen.blit(overlay, (overlay_x, 0))
+        self.screen.blit(veil((half_screen, SCREEN_HEIGHT), (0, 0, 0, 160)), (overlay_x, 0))
 
         accent = ORANGE if self.player_idx == 0 else GREEN
         menu_rect = pygame.Rect(self.menu_x, self.menu_y, self.menu_width, self.menu_height)
@@ -0,0 +1,101 @@
+"""
+Présentation des frames à l'écran
+Les renderers signalent les zones qu'ils ont modifiées ; la frame est présentée avec
+pygame.display.update(zones), en entier (flip) si tout a changé, ou pas du tout si rien n'a bougé.
+Si la fenêtre n'a pas la résolution interne, l'image est mise à l'échelle en une seule passe.
+"""
+import pygame
+from config import *
+
+
+class FrameCompositor:
+    """Regroupe les zones modifiées d'une frame et choisit comment la présenter"""
+
+    def __init__(self, screen, window=None, scale_filter="auto"):
+        self.screen = screen
+        self.screen_rect = screen.get_rect()
+        self.full = True  # Première frame : tout l'écran
+        self.rects = []
+
+        # Fenêtre d'une autre taille que `screen` (None : screen est la surface d'affichage)
+        self.window = window if window is not None and window is not screen else None
+        if self.window is not None:
+            self.window_size = self.window.get_size()
+            if scale_filter == "auto":
+                # Réduction : le lissage coûte plusieurs ms par frame pour un gain peu visible
+                shrinking = self.window_size[0] < self.screen_rect.width or self.window_size[1] < self.screen_rect.height
+                scale_filter = "nearest" if shrinking else "smooth"
+        self.scale_filter = scale_filter
+        self.scale = pygame.transform.smoothscale if scale_filter == "smooth" else pygame.transform.scale
+
+        # Compteurs (frames entières / partielles / non présentées)
+        self.full_frames = 0
+        self.partial_frames = 0
+        self.skipped_frames = 0
+
+    def invalidate(self, rect=None):
+        """Marque une zone (ou tout l'écran si rect est None) comme à présenter"""
+        if rect is None:
+            self.full = True
+        elif not self.full:
+            rect = pygame.Rect(rect).clip(self.screen_rect)
+            if rect.width and rect.height:
+                self.rects.append(rect)
+
+    def invalidate_rects(self, rects):
+        for rect in rects:
+            self.invalidate(rect)
+
+    def present(self):
+        """Affiche la frame puis repart d'une liste de zones vide"""
+        if self.window is not None:
+            # Passe de mise à l'échelle unique, directement dans la surface de la fenêtre
+            # (image entière : pas de raccords visibles entre zones mises à l'échelle séparément)
+            if self.full or self.rects:
+                self.scale(self.screen, self.window_size, self.window)
+                pygame.display.flip()
+                self.full_frames += 1
+            else:
+                self.skipped_frames += 1
+        elif self.full:
+            pygame.display.flip()
+            self.full_frames += 1
+        elif self.rects:
+            rects = self._merged()
+            if sum(rect.width * rect.height for rect in rects) >= self.screen_rect.width * self.screen_rect.height:
+                # Les zones couvrent tout l'écran (les deux vues de la partie, par exemple)
+                pygame.display.flip()
+                self.full_frames += 1
+            else:
+                pygame.display.update(rects)
+                self.partial_frames += 1
+        else:
+            self.skipped_frames += 1
+        self.full = False
+        self.rects = []
+
+    def to_screen(self, pos):
+        """Position dans la fenêtre (souris) -> position dans la résolution interne"""
+        if self.window is None:
+            return pos
+        return (pos[0] * self.screen_rect.width // self.window_size[0],
+                pos[1] * self.screen_rect.height // self.window_size[1])
+
+    def _merged(self):
+        """Fusionne les zones qui se chevauchent (moins d'appels de copie vers l'écran)"""
+        merged = []
+        for rect in sorted(self.rects, key=lambda r: (r.y, r.x)):
+            for i, other in enumerate(merged):
+                if other.colliderect(rect):
+                    merged[i] = other.union(rect)
+                    break
+            else:
+                merged.append(rect)
+        return merged
+
+    def stats(self):
+        return {
+            'full': self.full_frames,
+            'partial': self.partial_frames,
+            'skipped': self.skipped_frames,
+        }
@@ -6,6 +6,7 @@ import math
 import time
 from config import *
 from game.history import GameHistory
+from rendering.overlays import veil
 
 
 class HistoryMenu:
@@ -190,9 +191,7 @@ class HistoryMenu:
         elapsed = time.time() - self.start_time
         
         # Overlay semi-transparent
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 220))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(veil((self.width, self.height), (0, 0, 0, 220)), (0, 0))
         
         # Titre
         title = self.title_font.render("HISTORIQUE", True, self.accent_color)
@@ -0,0 +1,80 @@
+"""
+HUD en mode retenu
+Chaque valeur affichée (timer, argent, réputation...) est un widget qui garde sa surface rendue
+et ne la redessine que lorsque sa valeur change ; les zones modifiées sont remontées en dirty rects.
+"""
+import pygame
+
+_UNSET = object()
+
+
+class Widget:
+    """Élément de HUD lié à une valeur.
+
+    `render(value)` construit la surface (appelé seulement quand la valeur change) ;
+    une valeur None masque le widget. La surface est placée par son point `anchor`
+    ("topleft", "center"...) sur `pos`.
+    """
+
+    def __init__(self, pos, render, anchor="topleft"):
+        self.pos = pos
+        self.render = render
+        self.anchor = anchor
+        self.value = _UNSET
+        self.surface = None
+        self.rect = pygame.Rect(pos, (0, 0))
+        self.renders = 0
+        self.dirty_rects = []
+
+    def set(self, value):
+        """Lie une nouvelle valeur ; renvoie True si le widget a dû être redessiné"""
+        if value == self.value:
+            return False
+        self.value = value
+        old_rect = self.rect
+        if value is None:
+            self.surface = None
+            self.rect = pygame.Rect(self.pos, (0, 0))
+        else:
+            self.surface = self.render(value)
+            self.rect = self.surface.get_rect(**{self.anchor: self.pos})
+            self.renders += 1
+        self.dirty_rects.append(old_rect.union(self.rect))
+        return True
+
+    def draw(self, surface):
+        if self.surface is not None:
+            surface.blit(self.surface, self.rect)
+
+
+def text_widget(pos, font, anchor="topleft"):
+    """Widget de texte : valeur = (texte, couleur)"""
+    return Widget(pos, lambda value: font.render(value[0], True, value[1]), anchor)
+
+
+class Hud:
+    """Ensemble de widgets dessinés dans l'ordre d'ajout"""
+
+    def __init__(self):
+        self.widgets = []
+
+    def add(self, widget):
+        self.widgets.append(widget)
+        return widget
+
+    def draw(self, surface):
+        for widget in self.widgets:
+            widget.draw(surface)
+
+    def pop_dirty_rects(self):
+        """Zones modifiées depuis le dernier appel (pour display.update)"""
+        rects = []
+        for widget in self.widgets:
+            if widget.dirty_rects:
+                rects.extend(widget.dirty_rects)
+                widget.dirty_rects = []
+        return rects
+
+    @property
+    def renders(self):
+        return sum(widget.renders for widget in self.widgets)
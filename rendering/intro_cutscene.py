@@ -9,6 +9,8 @@ import math
 from config import *
 from game.assets_loader import Assets
 from game.audio import play_sound
+from game.fonts import get_font
+from rendering.overlays import veil, solid, vertical_gradient, vignette
 
 
 class IntroCutscene:
@@ -273,11 +275,8 @@ class IntroCutscene:
         if self.street_surface:
             self.screen.blit(self.street_surface, (0, 0))
         else:
-            for i in range(0, self.height + 1, 4):
-                r = int(25 + (i / self.height) * 10)
-                g = int(20 + (i / self.height) * 12)
-                b = int(45 + (i / self.height) * 15)
-                pygame.draw.line(self.screen, (r, g, b), (0, i), (self.width, i), 5)
+            self.screen.blit(vertical_gradient((self.width, self.height), (25, 20, 45), (35, 32, 60),
+                                               step=4, line_width=5), (0, 0))
             street_y = int(self.height * 0.4)
             pygame.draw.rect(self.screen, (40, 42, 48), (0, street_y, self.width, self.height - street_y))
 
@@ -295,18 +294,7 @@ class IntroCutscene:
     def _draw_vignette(self):
         """Bords légèrement assombris pour un rendu cinématique."""
         margin = int(min(self.width, self.height) * 0.08)
-        v = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        v.fill((0, 0, 0, 0))
-        for side, (x, y, w, h) in [
-            (0, (0, 0, margin, self.height)),
-            (1, (self.width - margin, 0, margin, self.height)),
-            (2, (0, 0, self.width, margin)),
-            (3, (0, self.height - margin, self.width, margin)),
-        ]:
-            s = pygame.Surface((w, h), pygame.SRCALPHA)
-            s.fill((0, 0, 0, 45))
-            v.blit(s, (x, y))
-        self.screen.blit(v, (0, 0))
+        self.screen.blit(vignette((self.width, self.height), margin, 45), (0, 0))
 
     def _draw_narration(self, beat, beat_elapsed):
         text = beat.get("text", "")
@@ -325,13 +313,10 @@ class IntroCutscene:
         shadow = box.inflate(6, 6)
         shadow.x += 4
         shadow.y += 4
-        shadow_surf = pygame.Surface((shadow.w, shadow.h), pygame.SRCALPHA)
-        shadow_surf.fill((0, 0, 0, 90))
-        self.screen.blit(shadow_surf, shadow.topleft)
+        self.screen.blit(veil(shadow.size, (0, 0, 0, 90)), shadow.topleft)
 
         # Fond opaque (lisibilité)
-        bg = pygame.Surface((box.w, box.h))
-        bg.fill((28, 30, 42))
+        bg = solid(box.size, (28, 30, 42))
         bg.set_alpha(alpha)
         self.screen.blit(bg, box.topleft)
         pygame.draw.rect(self.screen, (255, 180, 80), box, 2, border_radius=8)
@@ -383,24 +368,19 @@ class IntroCutscene:
         shadow = box.inflate(8, 8)
         shadow.x += 5
         shadow.y += 5
-        shadow_surf = pygame.Surface((shadow.w, shadow.h), pygame.SRCALPHA)
-        shadow_surf.fill((0, 0, 0, 100))
-        self.screen.blit(shadow_surf, shadow.topleft)
+        self.screen.blit(veil(shadow.size, (0, 0, 0, 100)), shadow.topleft)
 
-        # 2) Fond de la boîte (opaque pour bonne lisibilité)
-        bg_surf = pygame.Surface((box.w, box.h))
-        bg_surf.fill((28, 30, 42))
+        # 2) Fond de la boîte (opaque pour bonne lisibilité : dessiné directement)
+        pygame.draw.rect(self.screen, (28, 30, 42), box)
         # Bordure intérieure claire
-        pygame.draw.rect(bg_surf, (60, 65, 85), (0, 0, box.w, box.h), 1)
-        self.screen.blit(bg_surf, box.topleft)
+        pygame.draw.rect(self.screen, (60, 65, 85), box, 1)
 
         # 3) Bandeau du nom (couleur accent)
         name_band = pygame.Rect(box.x, box.y, box.w, name_h + 14)
-        band_surf = pygame.Surface((name_band.w, name_band.h))
-        band_surf.fill((255, 140, 0))  # MENU_ACCENT / orange Tacos
+        band_color = (255, 140, 0)  # MENU_ACCENT / orange Tacos
         if beat.get("speaker") == "kebab":
-            band_surf.fill((76, 175, 80))  # vert Kebab
-        self.screen.blit(band_surf, name_band.topleft)
+            band_color = (76, 175, 80)  # vert Kebab
+        pygame.draw.rect(self.screen, band_color, name_band)
         pygame.draw.line(self.screen, (255, 255, 255), (name_band.left, name_band.bottom - 1), (name_band.right, name_band.bottom - 1), 2)
 
         # 4) Nom
@@ -434,7 +414,7 @@ class IntroCutscene:
         if scale <= 0:
             return
         size = int(38 + 22 * scale)
-        font = pygame.font.SysFont("Arial", size, bold=True)
+        font = get_font(size, name="Arial", bold=True)
         # Texte blanc pour une bonne visibilité
         surf = font.render(text, True, (255, 255, 255))
         text_rect = surf.get_rect(center=(self.width // 2, self.height * 0.32))
@@ -442,19 +422,20 @@ class IntroCutscene:
         box = text_rect.inflate(pad_x * 2, pad_y * 2)
         alpha = int(255 * scale)
 
-        # Ombre
+        # Ombre. La boîte grandit avec le titre : ombre et fond sont pris dans un aplat plein
+        # écran (un seul par couleur), découpé à la taille de la frame et rendu translucide
+        screen_size = (self.width, self.height)
         shadow = box.inflate(8, 8)
         shadow.x += 6
         shadow.y += 6
-        shadow_surf = pygame.Surface((shadow.w, shadow.h), pygame.SRCALPHA)
-        shadow_surf.fill((0, 0, 0, int(120 * scale)))
-        self.screen.blit(shadow_surf, shadow.topleft)
+        shadow_surf = solid(screen_size, (0, 0, 0))
+        shadow_surf.set_alpha(int(120 * scale))
+        self.screen.blit(shadow_surf, shadow.topleft, (0, 0, *shadow.size))
 
         # Fond semi-opaque (lisibilité sur tout arrière-plan)
-        bg = pygame.Surface((box.w, box.h))
-        bg.fill((22, 24, 38))
+        bg = solid(screen_size, (22, 24, 38))
         bg.set_alpha(alpha)
-        self.screen.blit(bg, box.topleft)
+        self.screen.blit(bg, box.topleft, (0, 0, *box.size))
         # Contour orange + blanc (style jeu)
         pygame.draw.rect(self.screen, (255, 140, 0), box, 3, border_radius=12)
         pygame.draw.rect(self.screen, (255, 255, 255), box, 1, border_radius=12)
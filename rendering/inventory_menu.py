@@ -3,6 +3,7 @@ Menu d'inventaire pour afficher le stock de nourriture et les équipements
 """
 import pygame
 from config import *
+from rendering.overlays import veil
 
 class InventoryMenu:
     """Gestionnaire des inventaires pour les deux joueurs"""
@@ -255,9 +256,7 @@ class PlayerInventoryMenu:
         else:
             overlay_x = half_screen
         
-        overlay = pygame.Surface((half_screen, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        self.screen.blit(overlay, (overlay_x, 0))
+        self.screen.blit(veil((half_screen, SCREEN_HEIGHT), (0, 0, 0, 150)), (overlay_x, 0))
         
         # Fond du menu
         menu_rect = pygame.Rect(self.menu_x, self.menu_y, self.menu_width, self.menu_height)
@@ -5,6 +5,7 @@ import pygame
 from config import *
 from input.controls import get_key_bindings
 from game.audio import play_sound
+from rendering.overlays import veil
 
 
 class KeybindMenu:
@@ -202,9 +203,7 @@ class KeybindMenu:
             return
             
         # Overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(veil((SCREEN_WIDTH, SCREEN_HEIGHT), (0, 0, 0, 200)), (0, 0))
         
         # Fond du menu avec dégradé subtil
         menu_rect = pygame.Rect(self.menu_x, self.menu_y, self.menu_width, self.menu_height)
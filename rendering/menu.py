@@ -2,11 +2,13 @@ import pygame
 import math
 import time
 import random
-import cv2
 import os
 import sys
 from config import *
 from game.assets_loader import Assets, get_resource_path
+from game.fonts import render_text
+from game.particles import ParticleSystem
+from rendering.overlays import veil, rounded_glow, vertical_gradient
 
 
 class MenuRenderer:
@@ -61,13 +63,12 @@ class MenuRenderer:
         # Load menu-specific images
         self._load_menu_assets()
         
-        # Background particles
-        self.particles = []
+        # Background particles (système de particules partagé avec le jeu)
+        self.particles = ParticleSystem(capacity=16)
         self._init_particles()
         
-        # Background video
-        self.video_capture = None
-        self.video_frame = None
+        # Background video (ouverte et décodée dans un thread, voir rendering/video.py)
+        self.video = None
         self._load_background_video()
     
     def _load_background_video(self):
@@ -78,61 +79,33 @@ class MenuRenderer:
         
         if os.path.exists(video_path):
             try:
-                self.video_capture = cv2.VideoCapture(video_path)
-                if self.video_capture.isOpened():
-                    self.video_fps = self.video_capture.get(cv2.CAP_PROP_FPS)
-                    self.last_frame_time = 0
-                    print(f"[DEBUG] Vidéo chargée avec succès, FPS: {self.video_fps}")
-                else:
-                    print(f"[DEBUG] OpenCV n'a pas pu ouvrir la vidéo")
-                    self.video_capture = None
+                # Import ici : OpenCV n'est chargé que si le menu a une vidéo
+                from rendering.video import VideoPlayer
+                self.video = VideoPlayer(video_path, (self.width, self.height))
+                print(f"[DEBUG] Vidéo en cours d'ouverture")
             except Exception as e:
                 print(f"[DEBUG] Erreur chargement vidéo: {e}")
-                self.video_capture = None
+                self.video = None
         else:
             print(f"[DEBUG] Fichier vidéo non trouvé")
     
     def _update_video_frame(self):
-        """Update and return the current video frame as a pygame surface"""
-        if self.video_capture is None:
+        """Return the current video frame as a pygame surface (None if not available)"""
+        if self.video is None:
             return None
-        
-        current_time = time.time()
-        # Control frame rate based on video FPS
-        if self.video_fps > 0 and (current_time - self.last_frame_time) < 1.0 / self.video_fps:
-            return self.video_frame
-        
-        self.last_frame_time = current_time
-        
-        ret, frame = self.video_capture.read()
-        if not ret:
-            # Loop video
-            self.video_capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
-            ret, frame = self.video_capture.read()
-            if not ret:
-                return None
-        
-        # Convert BGR to RGB and resize to screen size
-        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        frame = cv2.resize(frame, (self.width, self.height))
-        
-        # Convert to pygame surface
-        self.video_frame = pygame.surfarray.make_surface(frame.swapaxes(0, 1))
-        return self.video_frame
+        return self.video.frame()
+    
+    def close(self):
+        """Arrête le décodage de la vidéo de fond"""
+        if self.video:
+            self.video.close()
+            self.video = None
     
     def _load_menu_assets(self):
         """Load images for menu display"""
         self.menu_images = {}
         assets = Assets.get()
         
-        # Facades - scaled for display
-        for name in ["facade_tacos", "facade_kebab"]:
-            img = assets.get_image(name)
-            if img:
-                scale = 0.8
-                new_size = (int(img.get_width() * scale), int(img.get_height() * scale))
-                self.menu_images[name] = pygame.transform.scale(img, new_size)
-        
         # Players - scaled
         for name in ["player1", "player2"]:
             img = assets.get_image(name)
@@ -147,12 +120,6 @@ class MenuRenderer:
             scale = 0.8
             new_size = (int(client.get_width() * scale), int(client.get_height() * scale))
             self.menu_images["client"] = pygame.transform.scale(client, new_size)
-        
-        # Floor tiles
-        for name in ["interior_tacos", "interior_kebab", "sidewalk"]:
-            img = assets.get_image(name)
-            if img:
-                self.menu_images[name] = img
 
         # Background écran de configuration (plein écran)
         config_bg_path = get_resource_path(os.path.join("assets", "background-config.png"))
@@ -169,44 +136,30 @@ class MenuRenderer:
     
     def _init_particles(self):
         """Initialize background particles"""
+        client_img = self.menu_images.get("client")
+        if not client_img:
+            return
         for _ in range(6):
-            self.particles.append({
-                'x': random.randint(0, self.width),
-                'y': random.randint(0, self.height),
-                'speed': random.uniform(0.15, 0.4),
-                'scale': random.uniform(0.2, 0.4),
-                'offset': random.uniform(0, 6.28)
-            })
+            scale = random.uniform(0.2, 0.4)
+            size = (int(client_img.get_width() * scale), int(client_img.get_height() * scale))
+            style = self.particles.image_style("menu_client", client_img, size)
+            self.particles.emit(style, random.randint(0, self.width), random.randint(0, self.height),
+                                vy=-random.uniform(0.15, 0.4) * 60, alpha=25,
+                                wobble=12, wobble_freq=1.5, phase=random.uniform(0, 6.28))
     
     def _update_particles(self):
         """Update particle positions"""
-        for p in self.particles:
-            p['y'] -= p['speed']
-            p['x'] += math.sin(time.time() * 1.5 + p['offset']) * 0.2
-            if p['y'] < -80:
-                p['y'] = self.height + 80
-                p['x'] = random.randint(0, self.width)
+        self.particles.update()
+        self.particles.wrap(-80, self.height + 80, self.width)
     
     def _draw_background(self):
         """Draw themed background"""
-        # Gradient background
-        for y in range(self.height):
-            ratio = y / self.height
-            r = int(25 + ratio * 8)
-            g = int(25 + ratio * 6)
-            b = int(35 + ratio * 12)
-            pygame.draw.line(self.screen, (r, g, b), (0, y), (self.width, y))
+        # Gradient background (construit une fois)
+        self.screen.blit(vertical_gradient((self.width, self.height), (25, 25, 35), (33, 31, 47)), (0, 0))
         
         # Draw particles
         self._update_particles()
-        client_img = self.menu_images.get("client")
-        for p in self.particles:
-            if client_img:
-                size = (int(client_img.get_width() * p['scale']),
-                       int(client_img.get_height() * p['scale']))
-                scaled = pygame.transform.scale(client_img, size)
-                scaled.set_alpha(25)
-                self.screen.blit(scaled, (int(p['x']), int(p['y'])))
+        self.particles.draw(self.screen)
 
     def _draw_config_screen_background(self):
         """Dessine le fond de l'écran de configuration (background-config.png en grand)."""
@@ -217,9 +170,7 @@ class MenuRenderer:
             y = (self.height - bg.get_height()) // 2
             self.screen.blit(bg, (x, y))
             # Overlay semi-transparent pour garder titres et panneaux lisibles
-            overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 85))
-            self.screen.blit(overlay, (0, 0))
+            self.screen.blit(veil((self.width, self.height), (0, 0, 0, 85)), (0, 0))
         else:
             self._draw_background()
     
@@ -246,9 +197,7 @@ class MenuRenderer:
             
             # Glow effect
             glow_rect = rect.inflate(6, 6)
-            glow_surface = pygame.Surface((glow_rect.width, glow_rect.height), pygame.SRCALPHA)
-            pygame.draw.rect(glow_surface, (*color, 40), glow_surface.get_rect(), border_radius=10)
-            self.screen.blit(glow_surface, glow_rect.topleft)
+            self.screen.blit(rounded_glow(glow_rect.size, (*color, 40), 10), glow_rect.topleft)
         else:
             pygame.draw.rect(self.screen, self.button_border, rect, 2, border_radius=8)
         
@@ -313,8 +262,7 @@ class MenuRenderer:
         self._right_side_rect = right_rect
         
         # Highlight selected side avec surface alpha (compatible macOS)
-        highlight_surface = pygame.Surface((half_width, rect.height), pygame.SRCALPHA)
-        highlight_surface.fill((*color, 100))
+        highlight_surface = veil((half_width, rect.height), (*color, 100))
         if current_side == "left":
             self.screen.blit(highlight_surface, left_rect.topleft)
         else:
@@ -396,9 +344,7 @@ class MenuRenderer:
         if video_frame:
             self.screen.blit(video_frame, (0, 0))
             # Add a semi-transparent overlay for better text readability
-            overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 100))
-            self.screen.blit(overlay, (0, 0))
+            self.screen.blit(veil((self.width, self.height), (0, 0, 0, 100)), (0, 0))
         else:
             self._draw_background()
         self._draw_title()
@@ -488,9 +434,7 @@ class MenuRenderer:
         # Glow pour le bouton sélectionné
         if is_selected:
             glow_rect = draw_rect.inflate(8, 8)
-            glow_surface = pygame.Surface((glow_rect.width, glow_rect.height), pygame.SRCALPHA)
-            pygame.draw.rect(glow_surface, (*color, 30), glow_surface.get_rect(), border_radius=12)
-            self.screen.blit(glow_surface, glow_rect.topleft)
+            self.screen.blit(rounded_glow(glow_rect.size, (*color, 30), 12), glow_rect.topleft)
         
         # Icône à gauche
         icon_size = 18
@@ -524,8 +468,7 @@ class MenuRenderer:
         
         # VS
         vs_scale = 1 + math.sin(elapsed * 3) * 0.08
-        vs_font = pygame.font.SysFont("Arial", int(48 * vs_scale), bold=True)
-        vs_text = vs_font.render("VS", True, WHITE)
+        vs_text = render_text("VS", int(48 * vs_scale), WHITE, name="Arial", bold=True)
         self.screen.blit(vs_text, vs_text.get_rect(center=(self.width // 2, center_y)))
         
         # Right player
@@ -681,9 +624,7 @@ class MenuRenderer:
         # Glow pour le bouton sélectionné
         if is_selected:
             glow_rect = draw_rect.inflate(8, 8)
-            glow_surface = pygame.Surface((glow_rect.width, glow_rect.height), pygame.SRCALPHA)
-            pygame.draw.rect(glow_surface, (*color, 25), glow_surface.get_rect(), border_radius=12)
-            self.screen.blit(glow_surface, glow_rect.topleft)
+            self.screen.blit(rounded_glow(glow_rect.size, (*color, 25), 12), glow_rect.topleft)
         
         # Icône
         icon_size = 22
@@ -698,12 +639,53 @@ class MenuRenderer:
         text_rect = text_surface.get_rect(midleft=(text_x, draw_rect.centery))
         self.screen.blit(text_surface, text_rect)
     
-    def draw_pause_menu(self, game_state):
-        """Draw pause menu overlay"""
+    def draw_pause_overlay(self):
+        """Voile sombre posé sur la partie figée"""
         # Overlay avec effet de flou simulé
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 210))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(veil((self.width, self.height), (0, 0, 0, 210)), (0, 0))
+
+    def pause_menu_rect(self):
+        """Zone de l'écran où le menu pause (sans le voile) peut dessiner, animations comprises"""
+        frame_x = (self.width - 500) // 2
+        frame_y = 80
+        rect = pygame.Rect(frame_x, frame_y, 500, 450)
+        rect.unionall_ip(self._pause_player_rects())
+        # Aide sous le cadre
+        hint_x = self.width // 2 - 180
+        hint_w, hint_h = self.hint_font.size("ENTREE Valider  |  ECHAP Reprendre")
+        rect.union_ip(pygame.Rect(hint_x, frame_y + 450 + 15, 110 + hint_w, max(hint_h, 12)))
+        return rect
+
+    def pause_animated_rects(self):
+        """Zones du menu pause qui bougent d'elles-mêmes (titre, joueurs, bouton sélectionné) :
+        le reste du menu ne change que sur une entrée"""
+        frame_y = 80
+        # Titre et sa lueur (oscillation de 3 px, lueur décalée de 2 px)
+        title_w, title_h = self.title_font.size("PAUSE")
+        title = pygame.Rect(0, 0, title_w, title_h)
+        title.center = (self.width // 2, frame_y + 35)
+        title.union_ip(pygame.Rect(self.width // 2 - title_w // 2, frame_y + 20, title_w, title_h))
+        rects = [title.inflate(6, 12)]
+        rects.extend(self._pause_player_rects())
+        # Bouton sélectionné (pulsation, ombre et lueur)
+        rects.append(self._get_pause_button_rects()[self.pause_selected].inflate(16, 16))
+        return rects
+
+    def _pause_player_rects(self):
+        """Joueurs décoratifs de part et d'autre du cadre (rebond de 5 px)"""
+        frame_x = (self.width - 500) // 2
+        rects = []
+        for name, center_x in (("player1", frame_x - 50), ("player2", frame_x + 500 + 50)):
+            image = self.menu_images.get(name)
+            if image:
+                sprite = image.get_rect(center=(center_x, self.height // 2))
+                rects.append(sprite.inflate(0, 12))
+        return rects
+
+    def draw_pause_menu(self, game_state, overlay=True):
+        """Draw pause menu overlay"""
+        if overlay:
+            self.draw_pause_overlay()
         
         elapsed = time.time() - self.start_time
         
@@ -862,6 +844,28 @@ class MenuRenderer:
             rects.append(rect)
         return rects
     
+    def _get_pause_button_rects(self):
+        """Calcule les rectangles des boutons du menu pause"""
+        # Mêmes calculs que dans draw_pause_menu
+        max_text_width = 0
+        for option in self.pause_options:
+            max_text_width = max(max_text_width, self.menu_font.size(option)[0])
+        
+        button_width = max_text_width + 80
+        button_height = 50
+        button_spacing = 12
+        start_y = 80 + 210
+        
+        rects = []
+        for i in range(len(self.pause_options)):
+            rects.append(pygame.Rect(
+                self.width // 2 - button_width // 2,
+                start_y + i * (button_height + button_spacing),
+                button_width,
+                button_height
+            ))
+        return rects
+    
     def handle_menu_input(self, event):
         """Handle main menu input. Retourne 'navigate' quand seule la sélection change."""
         if event.type == pygame.KEYDOWN:
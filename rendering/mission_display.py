@@ -5,6 +5,7 @@ import pygame
 import math
 import time
 from config import *
+from game.fonts import render_text
 
 
 class MissionDisplay:
@@ -52,8 +53,7 @@ class MissionDisplay:
         elif icon_type == "money":
             # Symbole euro
             pygame.draw.circle(surface, color, (cx, cy), size // 2 - 2, 1)
-            small_font = pygame.font.SysFont("Arial", 12, bold=True)
-            dollar = small_font.render("€", True, color)
+            dollar = render_text("€", 12, color, name="Arial", bold=True)
             surface.blit(dollar, dollar.get_rect(center=(cx, cy)))
         elif icon_type == "star":
             # Étoile simple
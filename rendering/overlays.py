@@ -0,0 +1,129 @@
+"""
+Voiles, dégradés et vignettes partagés par les menus et la cinématique
+Chaque surface est construite une seule fois par (taille, style) puis réutilisée à chaque frame :
+les écrans plein cadre ne recréent plus de Surface SRCALPHA ni ne retracent leur dégradé ligne à ligne.
+"""
+import pygame
+from collections import OrderedDict
+
+
+class OverlayCache:
+    _instance = None
+
+    @classmethod
+    def get(cls):
+        if cls._instance is None:
+            cls._instance = OverlayCache()
+        return cls._instance
+
+    def __init__(self, max_surfaces=64):
+        # (type, taille, paramètres...) -> Surface, du moins au plus récemment utilisé
+        self.surfaces = OrderedDict()
+        self.max_surfaces = max_surfaces
+        self.builds = 0
+        self.hits = 0
+        self.evictions = 0
+
+    def surface(self, key, build):
+        """Surface associée à key, construite par build() au premier usage.
+        Elle est partagée : ne pas dessiner dedans ; un set_alpha doit précéder chaque blit."""
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.builds += 1
+        surface = build()
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_surfaces:
+            self.surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def clear(self):
+        self.surfaces.clear()
+
+    def stats(self):
+        return {
+            'surfaces': len(self.surfaces),
+            'max_surfaces': self.max_surfaces,
+            'builds': self.builds,
+            'hits': self.hits,
+            'evictions': self.evictions,
+        }
+
+
+# Fonctions utilitaires
+def veil(size, color):
+    """Voile translucide uni : color = (r, g, b, a)"""
+    size = tuple(size)
+    color = tuple(color)
+
+    def build():
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        surface.fill(color)
+        return surface
+    return OverlayCache.get().surface(("veil", size, color), build)
+
+
+def solid(size, color):
+    """Rectangle opaque uni (à rendre translucide par set_alpha juste avant le blit)"""
+    size = tuple(size)
+    color = tuple(color)
+
+    def build():
+        surface = pygame.Surface(size)
+        surface.fill(color)
+        return surface
+    return OverlayCache.get().surface(("solid", size, color), build)
+
+
+def rounded_glow(size, color, border_radius):
+    """Halo translucide aux coins arrondis (boutons sélectionnés) : color = (r, g, b, a)"""
+    size = tuple(size)
+    color = tuple(color)
+
+    def build():
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.rect(surface, color, surface.get_rect(), border_radius=border_radius)
+        return surface
+    return OverlayCache.get().surface(("glow", size, color, border_radius), build)
+
+
+def vertical_gradient(size, top, bottom, step=1, line_width=1):
+    """Dégradé vertical opaque de `top` (y = 0) vers `bottom` (y = hauteur), une ligne tous les `step` px"""
+    size = tuple(size)
+    top = tuple(top)
+    bottom = tuple(bottom)
+
+    def build():
+        width, height = size
+        surface = pygame.Surface(size)
+        for y in range(0, height + 1, step):
+            ratio = y / height
+            color = tuple(int(a + ratio * (b - a)) for a, b in zip(top, bottom))
+            pygame.draw.line(surface, color, (0, y), (width, y), line_width)
+        return surface
+    return OverlayCache.get().surface(("gradient", size, top, bottom, step, line_width), build)
+
+
+def vignette(size, margin, alpha):
+    """Bords assombris (bandes noires translucides de `margin` px, plus sombres dans les coins)"""
+    size = tuple(size)
+
+    def build():
+        width, height = size
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 0))
+        for x, y, w, h in [
+            (0, 0, margin, height),
+            (width - margin, 0, margin, height),
+            (0, 0, width, margin),
+            (0, height - margin, width, margin),
+        ]:
+            band = pygame.Surface((w, h), pygame.SRCALPHA)
+            band.fill((0, 0, 0, alpha))
+            surface.blit(band, (x, y))
+        return surface
+    return OverlayCache.get().surface(("vignette", size, margin, alpha), build)
@@ -4,6 +4,10 @@ from config import *
 from rendering.camera import Camera
 from input.controls import get_key_bindings
 from rendering.mission_display import MissionDisplay
+from game.fonts import render_text
+from rendering.hud import Hud, Widget, text_widget
+from rendering.overlays import solid
+from game.assets_loader import Assets
 
 class SplitScreenRenderer:
     def __init__(self, screen):
@@ -11,11 +15,25 @@ class SplitScreenRenderer:
         self.width = SCREEN_WIDTH // 2
         self.height = SCREEN_HEIGHT
         
-        self.surface1 = pygame.Surface((self.width, self.height))
-        self.surface2 = pygame.Surface((self.width, self.height))
-        
-        self.camera1 = Camera(self.width, self.height)
-        self.camera2 = Camera(self.width, self.height)
+        # Les vues sont dessinées à la taille de rendu (RENDER_HEIGHT), puis agrandies dans leur
+        # zone de l'écran : HUD et menus restent dessinés par-dessus à la taille de la mise en page
+        self.scale = Assets.get().render_scale
+        view_size = (round(self.width * self.scale), round(self.height * self.scale))
+        # Même format que l'écran : transform.scale écrit directement dans sa zone
+        self.surface1 = pygame.Surface(view_size, 0, screen)
+        self.surface2 = pygame.Surface(view_size, 0, screen)
+        
+        self.camera1 = Camera(self.width, self.height, self.scale)
+        self.camera2 = Camera(self.width, self.height, self.scale)
+        # Zones de l'écran des deux vues (le monde y change à chaque frame)
+        self.view_rects = [pygame.Rect(0, 0, self.width, self.height),
+                           pygame.Rect(self.width, 0, self.width, self.height)]
+        self.view_targets = [screen.subsurface(rect) for rect in self.view_rects] if self.scale != 1 else None
+
+        # Monde composé une seule fois quand les deux joueurs sont dans la même zone
+        # (surface de la zone + marge, dessinée avec sa propre caméra décalée de la marge)
+        self.world_layer = None
+        self.world_camera = Camera(self.width, self.height, self.scale)
         
         self.font = pygame.font.SysFont(None, 32)
         self.small_font = pygame.font.SysFont(None, 24)
@@ -27,6 +45,11 @@ class SplitScreenRenderer:
         
         # Affichage des missions
         self.mission_display = MissionDisplay()
+
+        # HUD retenu : chaque valeur n'est re-rendue que lorsqu'elle change
+        self.hud = Hud()
+        self.timer_widget = self.hud.add(Widget((SCREEN_WIDTH // 2, 30), self._render_timer, anchor="center"))
+        self.player_huds = [self._build_player_hud(10, 50), self._build_player_hud(self.width + 10, 50)]
         
     def draw(self, game_state):
         self.blink_timer = time.time()
@@ -42,9 +65,13 @@ class SplitScreenRenderer:
         self.camera1.update(p1, zone1)
         self.camera2.update(p2, zone2)
         
+        # Même zone : décor et entités composés une fois, puis vus par les deux caméras
+        shared_world = None
+        if p1.current_zone == p2.current_zone and zone1:
+            shared_world = self._compose_world(game_state, zone1)
+
         # Draw P1 View (vue du joueur 1)
-        self.surface1.fill(DARK_GRAY)
-        game_state.draw_zone(self.surface1, self.camera1, p1.current_zone)
+        self._draw_world(self.surface1, self.camera1, game_state, p1.current_zone, shared_world)
         # Dessiner P1 sur sa propre vue (box de service visible uniquement pour P1)
         p1.draw(self.surface1, self.camera1, viewport_owner_id=p1.id)
         # Si P2 est dans la même zone que P1, le dessiner aussi sur la vue P1 (sans sa box de service)
@@ -55,8 +82,7 @@ class SplitScreenRenderer:
         p1.animation_manager.draw(self.surface1, self.camera1)
         
         # Draw P2 View (vue du joueur 2)
-        self.surface2.fill(DARK_GRAY)
-        game_state.draw_zone(self.surface2, self.camera2, p2.current_zone)
+        self._draw_world(self.surface2, self.camera2, game_state, p2.current_zone, shared_world)
         # Dessiner P2 sur sa propre vue (box de service visible uniquement pour P2)
         p2.draw(self.surface2, self.camera2, viewport_owner_id=p2.id)
         # Si P1 est dans la même zone que P2, le dessiner aussi sur la vue P2 (sans sa box de service)
@@ -66,9 +92,13 @@ class SplitScreenRenderer:
         # Dessiner les animations du joueur 2
         p2.animation_manager.draw(self.surface2, self.camera2)
         
-        # Blit to main screen
-        self.screen.blit(self.surface1, (0, 0))
-        self.screen.blit(self.surface2, (self.width, 0))
+        # Blit to main screen (mise à l'échelle des vues si elles sont rendues plus petites)
+        if self.view_targets is None:
+            self.screen.blit(self.surface1, (0, 0))
+            self.screen.blit(self.surface2, (self.width, 0))
+        else:
+            pygame.transform.scale(self.surface1, self.view_rects[0].size, self.view_targets[0])
+            pygame.transform.scale(self.surface2, self.view_rects[1].size, self.view_targets[1])
         
         # Draw Divider
         pygame.draw.line(self.screen, BORDER_COLOR, (self.width, 0), (self.width, self.height), BORDER_THICKNESS)
@@ -89,95 +119,148 @@ class SplitScreenRenderer:
         if game_state.game_over:
             self._draw_game_over(game_state)
         
+    def _compose_world(self, game_state, zone):
+        """Dessine la zone partagée et ses entités dans world_layer (culling sur les deux vues)"""
+        margin = DRAW_CULL_MARGIN
+        size = (round((zone.width * TILE_SIZE + margin * 2) * self.scale),
+                round((zone.height * TILE_SIZE + margin * 2) * self.scale))
+        if self.world_layer is None or self.world_layer.get_size() != size:
+            self.world_layer = pygame.Surface(size)
+        self.world_camera.x = -margin
+        self.world_camera.y = -margin
+        self.world_layer.fill(DARK_GRAY)
+        view = self.camera1.view_rect.union(self.camera2.view_rect)
+        game_state.draw_zone(self.world_layer, self.world_camera, zone.name, view)
+        return self.world_layer
+
+    def _draw_world(self, surface, camera, game_state, zone_name, shared_world):
+        surface.fill(DARK_GRAY)
+        if shared_world is None:
+            game_state.draw_zone(surface, camera, zone_name)
+        else:
+            margin = DRAW_CULL_MARGIN
+            surface.blit(shared_world, camera.to_view(-margin, -margin))
+
     def _draw_hud(self, game_state, p1, p2):
         # Timer at center top
         remaining = game_state.get_remaining_time()
         minutes = remaining // 60
         seconds = remaining % 60
-        timer_text = self.big_font.render(f"{minutes:02d}:{seconds:02d}", True, WHITE)
-        timer_rect = timer_text.get_rect(center=(SCREEN_WIDTH // 2, 30))
-        
-        # Timer background
-        bg_rect = timer_rect.inflate(20, 10)
-        pygame.draw.rect(self.screen, BLACK, bg_rect, border_radius=5)
-        self.screen.blit(timer_text, timer_rect)
+        self.timer_widget.set(f"{minutes:02d}:{seconds:02d}")
         
         # P1 HUD (left) - use username
         p1_name = getattr(p1, 'username', 'TACOS')
-        self._draw_player_hud(10, 50, p1, p1_name, ORANGE)
+        self._update_player_hud(self.player_huds[0], p1, p1_name, ORANGE)
         
         # P2 HUD (right) - use username
         p2_name = getattr(p2, 'username', 'KEBAB')
-        self._draw_player_hud(self.width + 10, 50, p2, p2_name, GREEN)
-        
-    def _draw_player_hud(self, x, y, player, resto_name, color):
-        # Background panel - plus grand pour les nouvelles infos
-        panel_rect = pygame.Rect(x, y, 200, 120)
-        pygame.draw.rect(self.screen, (0, 0, 0, 180), panel_rect, border_radius=8)
-        pygame.draw.rect(self.screen, color, panel_rect, 2, border_radius=8)
-        
-        # Restaurant name
-        name_text = self.small_font.render(resto_name, True, color)
-        self.screen.blit(name_text, (x + 10, y + 5))
+        self._update_player_hud(self.player_huds[1], p2, p2_name, GREEN)
+
+        self.hud.draw(self.screen)
+
+    def get_hud_dirty_rects(self):
+        """Zones du HUD redessinées depuis le dernier appel"""
+        return self.hud.pop_dirty_rects()
+
+    def _render_timer(self, text):
+        timer_text = self.big_font.render(text, True, WHITE)
+        # Timer background
+        surface = pygame.Surface((timer_text.get_width() + 20, timer_text.get_height() + 10), pygame.SRCALPHA)
+        pygame.draw.rect(surface, BLACK, surface.get_rect(), border_radius=5)
+        surface.blit(timer_text, (10, 5))
+        return surface
+
+    def _build_player_hud(self, x, y):
+        """Widgets du panneau d'un joueur (positions écran fixes)"""
+        add = self.hud.add
+        bar_x = x + 50
+        return {
+            'panel': add(Widget((x, y), self._render_panel)),
+            'name': add(text_widget((x + 10, y + 5), self.small_font)),
+            'zone': add(text_widget((x + 120, y + 5), self.small_font)),
+            'money': add(text_widget((x + 10, y + 25), self.font)),
+            'rep_label': add(text_widget((x + 10, y + 55), self.small_font)),
+            'rep_bar': add(Widget((bar_x, y + 57), self._render_rep_bar)),
+            'rep_text': add(text_widget((bar_x + 130 // 2 - 15, y + 55), self.small_font)),
+            'weapon': add(Widget((x + 10, y + 78), self._render_weapon)),
+            'low_stock': add(Widget((x + 100, y + 79), self._render_low_stock)),
+            'status': add(text_widget((x + 10, y + 98), self.tiny_font)),
+        }
+
+    def _update_player_hud(self, widgets, player, resto_name, color):
+        widgets['panel'].set(color)
+        widgets['name'].set((resto_name, color))
         
         # Zone indicator
-        zone_text = self.small_font.render(f"[{player.current_zone.upper()}]", True, (150, 150, 150))
-        self.screen.blit(zone_text, (x + 120, y + 5))
+        widgets['zone'].set((f"[{player.current_zone.upper()}]", (150, 150, 150)))
         
         # Money
-        money_text = self.font.render(f"{player.money} €", True, (255, 215, 0))
-        self.screen.blit(money_text, (x + 10, y + 25))
+        widgets['money'].set((f"{player.money} €", (255, 215, 0)))
         
         # Reputation bar
-        rep_label = self.small_font.render("Rep:", True, WHITE)
-        self.screen.blit(rep_label, (x + 10, y + 55))
-        
-        # Rep bar background
-        bar_x = x + 50
-        bar_width = 130
-        pygame.draw.rect(self.screen, GRAY, (bar_x, y + 57, bar_width, 15), border_radius=3)
-        
-        # Rep bar fill
-        fill_width = int(bar_width * player.reputation / 100)
+        widgets['rep_label'].set(("Rep:", WHITE))
+        fill_width = int(130 * player.reputation / 100)
         rep_color = GREEN if player.reputation > 50 else ORANGE if player.reputation > 25 else RED
-        pygame.draw.rect(self.screen, rep_color, (bar_x, y + 57, fill_width, 15), border_radius=3)
-        
-        # Rep text
-        rep_text = self.small_font.render(f"{player.reputation}%", True, WHITE)
-        self.screen.blit(rep_text, (bar_x + bar_width // 2 - 15, y + 55))
-        
-        # === Nouvelles infos ===
+        widgets['rep_bar'].set((fill_width, rep_color))
+        widgets['rep_text'].set((f"{player.reputation}%", WHITE))
         
         # Arme équipée (icône dessinée, pas d'emoji)
         weapon_info = player.get_weapon_info()
-        if weapon_info:
-            weapon_color = (200, 50, 50)
-            self._draw_weapon_icon(self.screen, x + 10, y + 78, 14, weapon_color)
-            weapon_text = self.tiny_font.render(f"{weapon_info['name']} ({weapon_info['uses']})", True, weapon_color)
-            self.screen.blit(weapon_text, (x + 28, y + 80))
-        else:
-            no_weapon_text = self.tiny_font.render("Pas d'arme", True, GRAY)
-            self.screen.blit(no_weapon_text, (x + 10, y + 80))
+        widgets['weapon'].set(f"{weapon_info['name']} ({weapon_info['uses']})" if weapon_info else "")
             
         # Stock bas - clignotant (icône triangle avertissement)
         low_stock = player.get_low_stock_warning()
-        if low_stock and int(self.blink_timer * 3) % 2 == 0:
-            self._draw_warning_icon(self.screen, x + 100, y + 79, 12, RED)
-            stock_text = self.tiny_font.render("STOCK BAS!", True, RED)
-            self.screen.blit(stock_text, (x + 116, y + 80))
+        widgets['low_stock'].set(True if low_stock and int(self.blink_timer * 3) % 2 == 0 else None)
             
         # Broche volée indicator
         if not player.food_stock.is_spit_available():
             cooldown = player.food_stock.get_spit_cooldown()
-            spit_text = self.tiny_font.render(f"Broche volee: {int(cooldown)}s", True, RED)
-            self.screen.blit(spit_text, (x + 10, y + 98))
+            status = (f"Broche volee: {int(cooldown)}s", RED)
         # Cooldown balai
         elif hasattr(player, 'sweep_cooldown') and player.sweep_cooldown > 0:
-            sweep_text = self.tiny_font.render(f"Balai: {int(player.sweep_cooldown)}s", True, ORANGE)
-            self.screen.blit(sweep_text, (x + 10, y + 98))
+            status = (f"Balai: {int(player.sweep_cooldown)}s", ORANGE)
         elif hasattr(player, 'can_sweep') and player.can_sweep():
-            sweep_text = self.tiny_font.render("Balai pret!", True, GREEN)
-            self.screen.blit(sweep_text, (x + 10, y + 98))
+            status = ("Balai pret!", GREEN)
+        else:
+            status = None
+        widgets['status'].set(status)
+
+    def _render_panel(self, color):
+        # Background panel - plus grand pour les nouvelles infos
+        surface = pygame.Surface((200, 120), pygame.SRCALPHA)
+        pygame.draw.rect(surface, BLACK, surface.get_rect(), border_radius=8)
+        pygame.draw.rect(surface, color, surface.get_rect(), 2, border_radius=8)
+        return surface
+
+    def _render_rep_bar(self, value):
+        fill_width, rep_color = value
+        surface = pygame.Surface((130, 15), pygame.SRCALPHA)
+        # Rep bar background
+        pygame.draw.rect(surface, GRAY, (0, 0, 130, 15), border_radius=3)
+        # Rep bar fill
+        pygame.draw.rect(surface, rep_color, (0, 0, fill_width, 15), border_radius=3)
+        return surface
+
+    def _render_weapon(self, label):
+        """Ligne de l'arme : icône + nom (utilisations), ou "Pas d'arme" si label est vide"""
+        if not label:
+            text = self.tiny_font.render("Pas d'arme", True, GRAY)
+            surface = pygame.Surface((text.get_width(), text.get_height() + 2), pygame.SRCALPHA)
+            surface.blit(text, (0, 2))
+            return surface
+        weapon_color = (200, 50, 50)
+        text = self.tiny_font.render(label, True, weapon_color)
+        surface = pygame.Surface((18 + text.get_width(), max(14, text.get_height() + 2)), pygame.SRCALPHA)
+        self._draw_weapon_icon(surface, 0, 0, 14, weapon_color)
+        surface.blit(text, (18, 2))
+        return surface
+
+    def _render_low_stock(self, _):
+        text = self.tiny_font.render("STOCK BAS!", True, RED)
+        surface = pygame.Surface((16 + text.get_width(), max(12, text.get_height() + 1)), pygame.SRCALPHA)
+        self._draw_warning_icon(surface, 0, 0, 12, RED)
+        surface.blit(text, (16, 1))
+        return surface
     
     def _draw_arrow_icon(self, surface, direction, x, y, size, color):
         """Dessine une icône de flèche directionnelle (sans emoji)."""
@@ -320,14 +403,12 @@ class SplitScreenRenderer:
         
     def _draw_game_over(self, game_state):
         # Overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.fill(BLACK)
+        overlay = solid((SCREEN_WIDTH, SCREEN_HEIGHT), BLACK)
         overlay.set_alpha(180)
         self.screen.blit(overlay, (0, 0))
         
         # Game Over text
-        go_font = pygame.font.SysFont(None, 72)
-        go_text = go_font.render("FIN DE PARTIE!", True, WHITE)
+        go_text = render_text("FIN DE PARTIE!", 72, WHITE)
         go_rect = go_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3))
         self.screen.blit(go_text, go_rect)
         
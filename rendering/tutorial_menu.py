@@ -8,6 +8,8 @@ import math
 import time
 from config import *
 from input.controls import get_key_bindings
+from game.fonts import render_text
+from rendering.overlays import veil
 
 
 class TutorialMenu:
@@ -426,9 +428,7 @@ class TutorialMenu:
     def _draw_signs_phase(self):
         """Dessine la phase pancartes (pages défilantes)."""
         elapsed = time.time() - self.start_time
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 230))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(veil((self.width, self.height), (0, 0, 0, 230)), (0, 0))
         page = self.pages[self.current_page]
         
         # Titre avec icône
@@ -494,9 +494,7 @@ class TutorialMenu:
         step = steps[self.interactive_step]
         
         # Overlay avec léger dégradé
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 220))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(veil((self.width, self.height), (0, 0, 0, 220)), (0, 0))
         
         # Titre animé (ondulation)
         title_y = 50 + math.sin(elapsed * 2.5) * 4
@@ -523,8 +521,7 @@ class TutorialMenu:
         
         # Touche(s) à presser : boîte animée (lueur pulsée)
         key_label = step['key_labels']
-        key_font = pygame.font.SysFont("Arial", 28, bold=True)
-        key_surf = key_font.render(key_label, True, WHITE)
+        key_surf = render_text(key_label, 28, WHITE, name="Arial", bold=True)
         box_w = key_surf.get_width() + 48
         box_h = 52
         box_rect = pygame.Rect((self.width - box_w) // 2, panel.centery + 15, box_w, box_h)
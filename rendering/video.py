@@ -0,0 +1,252 @@
+"""
+Vidéo de fond du menu principal
+Un thread ouvre puis décode la vidéo (OpenCV, importé par ce thread : le menu s'affiche sans
+l'attendre), la met à l'échelle de l'écran et la convertit en RGB dans un tampon circulaire de
+frames préallouées ; le thread principal ne fait que recopier la frame due dans une surface
+réutilisée. Optionnellement (VIDEO_FRAME_CACHE), les frames converties sont écrites dans un cache
+brut sur disque, relu en mémoire mappée aux lancements suivants.
+"""
+import json
+import os
+import queue
+import threading
+import time
+import numpy as np
+import pygame
+from config import *
+from game.assets_loader import get_cache_dir
+
+CACHE_VERSION = 1
+
+
+class VideoPlayer:
+    """Lecture en boucle d'une vidéo à la taille `size`.
+
+    frame() renvoie la surface à afficher (toujours la même, mise à jour au rythme de la vidéo),
+    ou None tant qu'aucune frame n'est prête (ouverture en cours, ou vidéo illisible).
+    """
+
+    def __init__(self, path, size, buffer_frames=VIDEO_BUFFER_FRAMES, use_cache=VIDEO_FRAME_CACHE):
+        self.path = path
+        self.size = size
+        self.fps = 0
+        self.surface = pygame.Surface(size)
+        if pygame.display.get_surface():
+            self.surface = self.surface.convert()
+        self.has_frame = False
+        self.last_frame_time = 0
+
+        # Compteurs : frames décodées, affichées, et frames dues mais pas encore prêtes
+        self.decoded = 0
+        self.shown = 0
+        self.late = 0
+
+        self.capture = None
+        self.frame_count = 0
+        self.thread = None
+        self._stop = threading.Event()
+
+        # Cache disque : frames (n, h, w, 3) en mémoire mappée, lues dans l'ordre
+        self.cache = None
+        self.cache_index = 0
+        self._cache_paths = self._get_cache_paths() if use_cache else None
+        if self._cache_paths and self._open_cache():
+            print(f"[Video] Cache de frames chargé ({len(self.cache)} frames)")
+            return
+
+        # Tampon circulaire : le décodeur remplit les cases libres, le menu vide les prêtes
+        width, height = size
+        self.ring = np.empty((buffer_frames, height, width, 3), dtype=np.uint8)
+        self.free = queue.Queue()
+        self.ready = queue.Queue()
+        for slot in range(buffer_frames):
+            self.free.put(slot)
+
+        self.thread = threading.Thread(target=self._decode_loop, name="VideoDecoder", daemon=True)
+        self.thread.start()
+
+    # === Thread de décodage ===
+
+    def _open_capture(self):
+        import cv2
+        capture = cv2.VideoCapture(self.path)
+        if not capture.isOpened():
+            capture.release()
+            print(f"[Video] OpenCV n'a pas pu ouvrir la vidéo {self.path}")
+            return False
+        self.frame_count = capture.get(cv2.CAP_PROP_FRAME_COUNT)
+        self.fps = capture.get(cv2.CAP_PROP_FPS)
+        self.capture = capture
+        return True
+
+    def _decode_loop(self):
+        if not self._open_capture():
+            return
+        try:
+            self._decode_frames()
+        finally:
+            # La capture appartient à ce thread : libérée ici, même si close() n'a pas pu l'attendre
+            self.capture.release()
+
+    def _decode_frames(self):
+        import cv2
+        width, height = self.size
+        scaled = np.empty((height, width, 3), dtype=np.uint8)
+        writer = self._start_cache_writer()
+        written = 0
+        while not self._stop.is_set():
+            ok, frame = self.capture.read()
+            if not ok:
+                # Fin de la vidéo : le premier passage complet devient le cache, puis on boucle
+                if writer:
+                    self._finish_cache(writer, written)
+                    writer = None
+                self.capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                ok, frame = self.capture.read()
+                if not ok:
+                    return
+
+            slot = self._next_free_slot()
+            if slot is None:
+                break
+            # Mise à l'échelle puis BGR -> RGB, directement dans la case du tampon
+            cv2.resize(frame, (width, height), dst=scaled)
+            cv2.cvtColor(scaled, cv2.COLOR_BGR2RGB, dst=self.ring[slot])
+            if writer:
+                writer = self._write_cache_frame(writer, self.ring[slot])
+                written += 1
+            self.decoded += 1
+            self.ready.put(slot)
+
+        if writer:
+            self._abort_cache(writer)
+
+    def _next_free_slot(self):
+        """Attend une case libre (le tampon plein met le décodeur en pause) ; None si arrêt"""
+        while not self._stop.is_set():
+            try:
+                return self.free.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        return None
+
+    # === Lecture (thread principal) ===
+
+    def frame(self, now=None):
+        now = time.time() if now is None else now
+        if self.fps > 0 and self.has_frame and now - self.last_frame_time < 1.0 / self.fps:
+            return self.surface
+        if self.cache is not None:
+            self._show(self.cache[self.cache_index])
+            self.cache_index = (self.cache_index + 1) % len(self.cache)
+        else:
+            try:
+                slot = self.ready.get_nowait()
+            except queue.Empty:
+                # Le décodeur a du retard : on garde la frame précédente
+                self.late += 1
+                return self.surface if self.has_frame else None
+            self._show(self.ring[slot])
+            self.free.put(slot)
+        self.last_frame_time = now
+        return self.surface
+
+    def _show(self, pixels):
+        """Recopie une frame RGB (h, w, 3) dans la surface réutilisée (conversion faite par SDL)"""
+        self.surface.blit(pygame.image.frombuffer(pixels.data, self.size, "RGB"), (0, 0))
+        self.has_frame = True
+        self.shown += 1
+
+    def close(self):
+        self._stop.set()
+        if self.thread:
+            self.thread.join(timeout=1.0)
+            self.thread = None
+        self.cache = None
+
+    def stats(self):
+        return {
+            'decoded': self.decoded,
+            'shown': self.shown,
+            'late': self.late,
+            'cached': self.cache is not None,
+        }
+
+    # === Cache disque ===
+
+    def _get_cache_paths(self):
+        cache_dir = get_cache_dir("video")
+        if cache_dir is None or not os.path.exists(self.path):
+            return None
+        name = os.path.splitext(os.path.basename(self.path))[0]
+        base = os.path.join(cache_dir, f"{name}_{self.size[0]}x{self.size[1]}")
+        return base + ".rgb", base + ".json"
+
+    def _source_info(self):
+        stat = os.stat(self.path)
+        return {
+            'version': CACHE_VERSION,
+            'source_size': stat.st_size,
+            'source_mtime': stat.st_mtime,
+            'width': self.size[0],
+            'height': self.size[1],
+        }
+
+    def _open_cache(self):
+        """Ouvre le cache s'il correspond encore à la vidéo source (taille, date, résolution)"""
+        data_path, meta_path = self._cache_paths
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            if any(meta.get(key) != value for key, value in self._source_info().items()):
+                return False
+            width, height = self.size
+            self.cache = np.memmap(data_path, dtype=np.uint8, mode='r',
+                                   shape=(meta['frames'], height, width, 3))
+            self.fps = meta['fps']
+            return True
+        except (OSError, ValueError, KeyError):
+            return False
+
+    def _start_cache_writer(self):
+        if not self._cache_paths:
+            return None
+        frame_bytes = self.size[0] * self.size[1] * 3
+        if self.frame_count * frame_bytes > VIDEO_CACHE_MAX_MB * 1024 * 1024:
+            print(f"[Video] Vidéo trop longue pour le cache ({int(self.frame_count)} frames)")
+            return None
+        try:
+            return open(self._cache_paths[0] + ".tmp", 'wb')
+        except OSError:
+            return None
+
+    def _write_cache_frame(self, writer, pixels):
+        try:
+            writer.write(pixels.data)
+            return writer
+        except OSError as e:
+            print(f"[Video] Écriture du cache impossible: {e}")
+            self._abort_cache(writer)
+            return None
+
+    def _finish_cache(self, writer, frames):
+        """Publie le cache : données puis métadonnées, chacune remplacée d'un coup"""
+        data_path, meta_path = self._cache_paths
+        try:
+            writer.close()
+            os.replace(data_path + ".tmp", data_path)
+            meta = self._source_info()
+            meta.update(frames=frames, fps=self.fps)
+            with open(meta_path + ".tmp", 'w', encoding='utf-8') as f:
+                json.dump(meta, f)
+            os.replace(meta_path + ".tmp", meta_path)
+            print(f"[Video] Cache de frames écrit ({frames} frames)")
+        except OSError as e:
+            print(f"[Video] Écriture du cache impossible: {e}")
+
+    def _abort_cache(self, writer):
+        writer.close()
+        try:
+            os.remove(self._cache_paths[0] + ".tmp")
+        except OSError:
+            pass
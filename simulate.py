@@ -0,0 +1,59 @@
+"""
+SnackAnarchy - Simulation sans fenêtre
+Joue des parties complètes sans affichage, sans son et sans rendu, aussi vite que le CPU le permet.
+
+Exemples :
+    python simulate.py --seed 42 --duration 180 --p1 serve --p2 random
+    python simulate.py --matches 50 --duration 60 --quiet
+"""
+import argparse
+import json
+import time
+from config import DEFAULT_DURATION
+from game.headless import POLICIES, run_match, build_match_record, setup_headless
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Simulation SnackAnarchy sans fenêtre")
+    parser.add_argument("--seed", type=int, default=0, help="graine de la première partie")
+    parser.add_argument("--duration", type=float, default=DEFAULT_DURATION,
+                        help="durée d'une partie en secondes de jeu")
+    parser.add_argument("--matches", type=int, default=1, help="nombre de parties (graines consécutives)")
+    parser.add_argument("--p1", choices=sorted(POLICIES), default="serve", help="stratégie du joueur 1")
+    parser.add_argument("--p2", choices=sorted(POLICIES), default="serve", help="stratégie du joueur 2")
+    parser.add_argument("--quiet", action="store_true", help="n'affiche pas l'entrée d'historique de chaque partie")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    policies = (args.p1, args.p2)
+    setup_headless()
+
+    total_ticks = 0
+    total_time = 0.0
+    for i in range(args.matches):
+        seed = args.seed + i
+        start = time.perf_counter()
+        game_state, ticks = run_match(seed, args.duration, policies)
+        elapsed = time.perf_counter() - start
+        total_ticks += ticks
+        total_time += elapsed
+
+        record = build_match_record(game_state, seed, policies)
+        scores = " | ".join(
+            f"{p['name']}: {p['money']}€ {p['reputation']}% {p['clients_served']} servis"
+            for p in record['players']
+        )
+        print(f"[Sim] graine {seed}: {ticks} ticks en {elapsed:.2f}s "
+              f"({ticks / elapsed:.0f} ticks/s) - gagnant {record['winner']} - {scores}")
+        if not args.quiet:
+            print(json.dumps(record, ensure_ascii=False, indent=2))
+
+    if total_time > 0:
+        print(f"[Sim] {args.matches} partie(s), {total_ticks} ticks en {total_time:.2f}s : "
+              f"{total_ticks / total_time:.0f} ticks/s, {args.matches * 3600 / total_time:.0f} parties/heure")
+
+
+if __name__ == "__main__":
+    main()